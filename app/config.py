@@ -3,19 +3,62 @@ Configurações do AurantisSync
 """
 import os
 
+# Dados do usuário (perfis de velocidade medidos etc.)
+USER_DATA_DIR = os.path.join(os.path.expanduser("~"), ".aurantis_sync")
+SPEED_PROFILES_PATH = os.path.join(USER_DATA_DIR, "speed_profiles.json")
+JOB_QUEUE_PATH = os.path.join(USER_DATA_DIR, "jobs.json")
+
+# Servidor de transcrição (scripts/transcription_server.py)
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+SERVER_SPOOL_DIR = os.path.join(USER_DATA_DIR, "server")
+SERVER_WORKERS = 1
+# Jobs esperando além dos que estão rodando; acima disso o envio recebe 503
+SERVER_MAX_PENDING = 8
+# Jobs encerrados mantidos para consulta (os mais antigos são descartados)
+SERVER_KEEP_FINISHED = 50
+SERVER_MAX_UPLOAD_BYTES = 200 * 1024 * 1024
+SERVER_RETRY_AFTER_SECONDS = 10
+
 # Configurações de transcrição
 DEFAULT_LANGUAGE = "pt"
 DEFAULT_MODEL = "small"
 SUPPORTED_LANGUAGES = ["pt", "en", "es", "fr", "de", "it", "ja", "ko", "zh"]
 SUPPORTED_MODELS = ["tiny", "base", "small", "medium", "large-v3"]
 
+# Transcrição em duas passadas: rascunho rápido, depois refinamento em
+# segundo plano com o modelo escolhido
+DRAFT_MODEL = "tiny"
+DRAFT_PRESET = "draft"
+
 # Configurações de interface
 WINDOW_TITLE = "AurantisSync – Transcrição & Sincronização"
 WINDOW_SIZE = (1100, 700)
 
+# Visualização do waveform: "native" (QPainter) ou "matplotlib"
+WAVEFORM_BACKEND = "native"
+
+# Acima desta duração (segundos) o waveform guarda só o resumo de picos/RMS
+# e relê trechos do arquivo no zoom alto, mantendo a memória constante
+WAVEFORM_KEEP_SAMPLES_MAX_DURATION = 30 * 60
+
 # Configurações de áudio
 SUPPORTED_AUDIO_FORMATS = ["*.wav", "*.mp3", "*.m4a", "*.flac", "*.ogg", "*.aac"]
 
+# Margens (segundos) antes e depois da linha no preview em loop
+PREVIEW_PRE_ROLL = 0.5
+PREVIEW_POST_ROLL = 0.5
+
+# Intervalo (ms) de atualização do cursor durante a reprodução (~60 Hz)
+POSITION_POLL_INTERVAL_MS = 16
+
+# Espera (ms) após mudar modelo ou preset antes de pré-carregar o modelo
+MODEL_PREFETCH_DELAY_MS = 500
+
+# Atraso de reação padrão (segundos) descontado dos toques na sincronização
+# guiada; recalibrado ao fim de uma sessão sobre linhas já sincronizadas
+GUIDED_SYNC_REACTION_OFFSET = 0.1
+
 # Configurações de exportação
 EXPORT_FORMATS = {
     "txt": "Texto Simples",
@@ -0,0 +1,178 @@
+"""
+Módulo de alinhamento forçado: encontra no áudio os tempos de uma letra
+já conhecida, sem transcrever.
+"""
+import numpy as np
+from typing import Callable, List, Optional, Tuple
+
+from app.core.sync_model import LyricLine, WordTiming
+
+
+# Taxa de amostragem esperada pelo Whisper
+SAMPLE_RATE = 16000
+
+
+class LyricsAligner:
+    """
+    Alinhamento forçado com um modelo do faster-whisper.
+    
+    O áudio é percorrido em janelas de 30 s: o encoder processa a janela uma
+    vez e os tempos vêm do DTW sobre a atenção cruzada do decoder para os
+    tokens da própria letra, numa única passada, sem busca em feixe. O texto
+    das linhas nunca é alterado; só início, fim e palavras.
+    
+    Cada janela recebe as próximas linhas ainda não alinhadas. Linhas que
+    terminam perto do fim da janela (onde o DTW comprime o texto que sobra)
+    ficam para a janela seguinte, que começa no fim da última linha aceita.
+    """
+    
+    # Duração da janela do Whisper
+    WINDOW_SECONDS = 30.0
+    
+    # Linhas que terminam a menos disso do fim da janela são realinhadas
+    GUARD_SECONDS = 3.0
+    
+    # Tokens de letra por janela (o Whisper gera até ~220 tokens em 30 s)
+    MAX_WINDOW_TOKENS = 200
+    
+    # Probabilidade média abaixo da qual a linha não está na janela
+    # (trecho instrumental): a janela avança sem aceitar linhas
+    MIN_PROBABILITY = 0.05
+    
+    def __init__(self, model, language: str):
+        """
+        Args:
+            model: ``faster_whisper.WhisperModel`` já carregado
+            language: Código do idioma da letra
+        """
+        from faster_whisper.tokenizer import Tokenizer
+        
+        self.model = model
+        self.tokenizer = Tokenizer(
+            model.hf_tokenizer, model.model.is_multilingual,
+            task="transcribe", language=language
+        )
+    
+    def align(self, audio: np.ndarray, lines: List[LyricLine],
+              progress: Optional[Callable[[float], None]] = None) -> List[LyricLine]:
+        """
+        Alinha as linhas ao áudio.
+        
+        Args:
+            audio: Áudio mono float32 a 16 kHz
+            lines: Linhas da letra, na ordem cantada
+            progress: Chamado com a fração do áudio já percorrida
+        
+        Returns:
+            Cópias das linhas com início, fim e palavras alinhados (linhas
+            vazias mantêm os tempos originais)
+        """
+        result = [LyricLine(start=line.start, end=line.end, text=line.text) for line in lines]
+        pending = [i for i, line in enumerate(result) if not line.is_empty()]
+        tokens = {i: self.tokenizer.encode(" " + result[i].text.strip()) for i in pending}
+        
+        duration = len(audio) / SAMPLE_RATE
+        cursor = 0.0
+        position = 0
+        
+        while position < len(pending):
+            window_end = min(cursor + self.WINDOW_SECONDS, duration)
+            last_window = window_end >= duration
+            
+            # Próximas linhas, até o limite de tokens (ao menos uma)
+            candidates = []
+            count = 0
+            for i in pending[position:]:
+                if candidates and count + len(tokens[i]) > self.MAX_WINDOW_TOKENS:
+                    break
+                candidates.append(i)
+                count += len(tokens[i])
+            
+            aligned = self._align_window(audio, cursor, window_end, candidates, tokens)
+            
+            first_words, first_probability = aligned[0]
+            if not last_window and (not first_words or first_probability < self.MIN_PROBABILITY):
+                # A voz ainda não começou nesta janela
+                cursor += self.WINDOW_SECONDS - self.GUARD_SECONDS
+                continue
+            
+            accepted = 0
+            for words, _ in aligned:
+                if not words:
+                    break
+                if not last_window and words[-1].end > window_end - self.GUARD_SECONDS:
+                    break
+                accepted += 1
+            
+            if accepted == 0:
+                if not first_words:
+                    # Nada alinhado no fim do áudio: manter os tempos originais
+                    position += 1
+                    continue
+                if first_words[0].start > cursor + self.GUARD_SECONDS:
+                    # Linha começa no fim da janela: recomeçar a partir dela
+                    cursor = first_words[0].start - self.GUARD_SECONDS / 2
+                    continue
+                # Linha mais longa que a janela: aceitar como está
+                accepted = 1
+            
+            for i, (words, _) in zip(candidates[:accepted], aligned[:accepted]):
+                line = result[i]
+                line.words = words
+                line.start = words[0].start
+                line.end = words[-1].end
+            
+            position += accepted
+            cursor = result[candidates[accepted - 1]].end
+            
+            if progress:
+                progress(min(cursor / duration, 1.0) if duration else 1.0)
+        
+        return result
+    
+    def _align_window(self, audio: np.ndarray, start: float, end: float,
+                      candidates: List[int],
+                      tokens: dict) -> List[Tuple[List[WordTiming], float]]:
+        """
+        Alinha os tokens das linhas ``candidates`` ao trecho [start, end].
+        
+        Returns:
+            Para cada linha, as palavras (tempos absolutos) e a
+            probabilidade média dos seus tokens
+        """
+        from faster_whisper.audio import pad_or_trim
+        
+        chunk = audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)]
+        extractor = self.model.feature_extractor
+        features = extractor(chunk)
+        num_frames = max(1, min(extractor.nb_max_frames, features.shape[-1] - 1))
+        encoder_output = self.model.encode(pad_or_trim(features))
+        
+        text_tokens = [token for i in candidates for token in tokens[i]]
+        alignment = self.model.find_alignment(
+            self.tokenizer, [text_tokens], encoder_output, num_frames
+        )
+        words = alignment[0] if alignment else []
+        
+        # Distribuir as palavras pelas linhas: cada linha foi codificada à
+        # parte, então as fronteiras de palavra coincidem com as de linha
+        result = []
+        k = 0
+        for i in candidates:
+            remaining = len(tokens[i])
+            line_words = []
+            probabilities = []
+            while remaining > 0 and k < len(words):
+                word = words[k]
+                k += 1
+                remaining -= len(word["tokens"])
+                probabilities.append(float(word["probability"]))
+                text = word["word"].strip()
+                if text:
+                    word_start = start + float(word["start"])
+                    word_end = start + float(max(word["end"], word["start"]))
+                    line_words.append(WordTiming(start=word_start, end=word_end, text=text))
+            probability = float(np.mean(probabilities)) if probabilities else 0.0
+            result.append((line_words, probability))
+        
+        return result
@@ -0,0 +1,99 @@
+"""
+Módulo de decodificação de áudio em blocos.
+"""
+import numpy as np
+from typing import Iterator, Optional
+
+
+class AudioLoaderError(Exception):
+    """Exceção para erros de decodificação."""
+    pass
+
+
+class AudioLoader:
+    """
+    Decodifica um arquivo de áudio em blocos de amostras float32
+    (entre -1 e 1) com formato (frames, canais).
+    
+    Usa ``soundfile`` (WAV, FLAC, OGG, MP3) quando possível, lendo o
+    arquivo aos poucos; outros formatos (M4A, AAC...) são decodificados
+    inteiros pelo pydub/FFmpeg e entregues no mesmo formato de blocos.
+    """
+    
+    # Frames por bloco (~1,5 s a 44,1 kHz)
+    BLOCK_FRAMES = 65536
+    
+    def __init__(self, audio_path: str, block_frames: int = BLOCK_FRAMES):
+        self.audio_path = audio_path
+        self.block_frames = block_frames
+        self.sample_rate: int = 0
+        self.channels: int = 0
+        self.frames: int = 0
+        
+        self._segment = None  # AudioSegment do pydub (fallback)
+    
+    @property
+    def duration(self) -> float:
+        """Duração total em segundos."""
+        return self.frames / self.sample_rate if self.sample_rate else 0.0
+    
+    def open(self) -> 'AudioLoader':
+        """
+        Lê o cabeçalho do arquivo (taxa, canais e número de frames).
+        
+        Returns:
+            O próprio loader, para encadear chamadas
+        """
+        try:
+            import soundfile as sf
+            info = sf.info(self.audio_path)
+            if info.frames > 0:
+                self.sample_rate = info.samplerate
+                self.channels = info.channels
+                self.frames = info.frames
+                return self
+        except Exception:
+            pass
+        
+        # Formato não suportado pelo libsndfile: decodificar com pydub
+        try:
+            from pydub import AudioSegment
+            self._segment = AudioSegment.from_file(self.audio_path).set_sample_width(2)
+        except Exception as e:
+            raise AudioLoaderError(f"Erro ao abrir áudio: {e}")
+        
+        self.sample_rate = self._segment.frame_rate
+        self.channels = self._segment.channels
+        self.frames = int(self._segment.frame_count())
+        return self
+    
+    def blocks(self, start_frame: int = 0) -> Iterator[np.ndarray]:
+        """
+        Itera sobre o áudio em blocos de ``block_frames`` frames.
+        
+        Args:
+            start_frame: Primeiro frame a decodificar
+        
+        Returns:
+            Iterador de arrays float32 (frames, canais)
+        """
+        if not self.sample_rate:
+            self.open()
+        
+        if self._segment is not None:
+            data = np.frombuffer(self._segment.raw_data, dtype=np.int16)
+            data = data.reshape((-1, self.channels))
+            for start in range(start_frame, len(data), self.block_frames):
+                yield data[start:start + self.block_frames].astype(np.float32) / 32768.0
+            return
+        
+        import soundfile as sf
+        try:
+            yield from sf.blocks(self.audio_path, blocksize=self.block_frames,
+                                 start=start_frame, dtype='float32', always_2d=True)
+        except Exception as e:
+            raise AudioLoaderError(f"Erro ao decodificar áudio: {e}")
+    
+    def close(self):
+        """Libera o áudio decodificado pelo fallback."""
+        self._segment = None
@@ -3,38 +3,113 @@ Módulo de reprodução de áudio com controles avançados.
 """
 import sounddevice as sd
 import numpy as np
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
+import glob
+import mmap
+import os
+import tempfile
 import threading
 import time
 from pathlib import Path
 
-from pydub import AudioSegment
+from app.core.audio_loader import AudioLoader
+
+
+# Prefixo dos arquivos de cache do PCM no diretório temporário
+CACHE_PREFIX = "aurantis_pcm_"
+
+
+def remove_stale_caches() -> int:
+    """
+    Apaga caches de PCM deixados por execuções que terminaram sem
+    ``close`` (queda do aplicativo). No Windows um cache ainda mapeado por
+    outra instância não pode ser apagado e é mantido.
+    
+    Returns:
+        Número de arquivos apagados
+    """
+    removed = 0
+    for path in glob.glob(os.path.join(tempfile.gettempdir(), CACHE_PREFIX + "*.raw")):
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
 
 
 class AudioPlayer:
-    """Player de áudio com controles de velocidade, volume e posicionamento."""
+    """
+    Player de áudio com controles de velocidade, volume e posicionamento.
+    
+    O PCM decodificado fica em um arquivo de cache mapeado em memória, no
+    número de canais original e já em float32; o sistema operacional mantém
+    residente só o trecho sendo tocado. A saída é sempre estéreo float32: a
+    conversão de canais, o volume, o mudo e as rampas de ganho são aplicados
+    no callback direto no buffer de saída, sem alocar memória por bloco.
+    
+    A posição vem de um relógio ancorado no instante em que cada bloco chega
+    ao DAC (``outputBufferDacTime``): ``get_position`` extrapola a partir da
+    última âncora e pode ser consultada de qualquer thread na taxa da tela,
+    sem que a thread de áudio notifique a interface.
+    """
+    
+    # Canais do stream de saída e frames por bloco do callback
+    OUTPUT_CHANNELS = 2
+    BLOCK_SIZE = 1024
+    
+    # Duração da rampa de ganho (volume, mudo, início e seek), evita estalos
+    FADE_SECONDS = 0.01
+    
+    # Âncoras de relógio guardadas (blocos a caminho do DAC)
+    CLOCK_ANCHORS = 32
     
     def __init__(self):
-        self.audio_data: Optional[np.ndarray] = None
+        self.audio_data: Optional[np.ndarray] = None  # np.memmap (frames, canais)
         self.sample_rate: int = 44100
         self.current_position: float = 0.0
         self.duration: float = 0.0
         self.volume: float = 1.0
+        self.is_muted: bool = False
         self.speed: float = 1.0
         self.is_playing: bool = False
         self.is_paused: bool = False
         
-        # Callbacks
-        self.on_position_changed: Optional[Callable[[float], None]] = None
+        # Carregamento progressivo: frames já decodificados em audio_data
+        self.loaded_frames: int = 0
+        self.is_loading: bool = False
+        
+        # Callback de fim (chamado na thread do sounddevice)
         self.on_playback_finished: Optional[Callable[[], None]] = None
         
-        # Threading
-        self._playback_thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
+        # Stream de saída e próximo frame a tocar (lido no callback)
+        self._stream: Optional[sd.OutputStream] = None
+        self._frame: int = 0
+        self._cache_path: Optional[str] = None
+        
+        # Região de loop (frame inicial, frame final), trocada de uma vez
+        self._loop: Optional[Tuple[int, int]] = None
+        
+        # Relógio de posição: cada bloco publica uma âncora (instante em que
+        # chega ao DAC, frame inicial, frames, loop, relógio usado) em um anel
+        # que cobre a latência. ``_epoch`` muda a cada reposicionamento e
+        # descarta blocos que já estavam em preparo.
+        self._lock = threading.Lock()
+        self._epoch: int = 0
+        self._anchors: list = [None] * self.CLOCK_ANCHORS
+        self._anchor_index: int = 0
+        self._stream_rate: int = self.sample_rate
+        self._output_latency: float = 0.0
+        
+        # Ganho aplicado no último frame e buffers da rampa (pré-alocados)
+        self._gain: float = 0.0
+        self._fade_step: float = 1.0
+        self._ramp = np.zeros(self.BLOCK_SIZE, dtype=np.float32)
+        self._ramp_index = np.arange(1, self.BLOCK_SIZE + 1, dtype=np.float32)
         
         # Configurar sounddevice
         sd.default.samplerate = self.sample_rate
-        sd.default.channels = 2  # Estéreo
+        sd.default.channels = self.OUTPUT_CHANNELS
     
     def load_audio(self, audio_path: str) -> bool:
         """
@@ -42,69 +117,179 @@ class AudioPlayer:
         
         Args:
             audio_path: Caminho para o arquivo de áudio
-            
+        
         Returns:
             True se carregado com sucesso, False caso contrário
         """
+        loader = AudioLoader(audio_path)
         try:
-            # Parar reprodução atual
-            self.stop()
-            
-            # Carregar com pydub
-            audio = AudioSegment.from_file(audio_path)
-            
-            # Converter para numpy array
-            self.audio_data = np.array(audio.get_array_of_samples())
-            if audio.channels == 2:
-                self.audio_data = self.audio_data.reshape((-1, 2))
-            else:
-                self.audio_data = self.audio_data.reshape((-1, 1))
-                # Duplicar para estéreo
-                self.audio_data = np.repeat(self.audio_data, 2, axis=1)
-            
-            self.sample_rate = audio.frame_rate
-            self.duration = len(audio) / 1000.0  # Converter para segundos
-            self.current_position = 0.0
-            
-            # Atualizar configuração do sounddevice
-            sd.default.samplerate = self.sample_rate
+            loader.open()
+            self.begin_loading(loader.sample_rate, loader.channels, loader.frames)
+            for block in loader.blocks():
+                self.append_block(block)
+            self.finish_loading()
             
             return True
-            
+        
         except Exception as e:
             print(f"Erro ao carregar áudio: {e}")
+            self.finish_loading()
             return False
+        finally:
+            loader.close()
+    
+    def begin_loading(self, sample_rate: int, channels: int, total_frames: int) -> None:
+        """
+        Prepara o buffer para receber o áudio em blocos (ver ``append_block``).
+        A reprodução pode começar antes do fim do carregamento.
+        
+        Args:
+            sample_rate: Taxa de amostragem
+            channels: Número de canais do arquivo
+            total_frames: Número total de frames
+        """
+        self.stop()
+        self._release_cache()
+        
+        self._loop = None
+        self.audio_data = self._create_cache(total_frames, channels)
+        self.sample_rate = sample_rate
+        self.duration = total_frames / sample_rate if sample_rate else 0.0
+        self.current_position = 0.0
+        self.loaded_frames = 0
+        self.is_loading = True
+        
+        sd.default.samplerate = self.sample_rate
+    
+    def append_block(self, block: np.ndarray) -> None:
+        """
+        Acrescenta um bloco decodificado (frames, canais) ao buffer.
+        
+        Args:
+            block: Amostras float32 entre -1 e 1
+        """
+        if self.audio_data is None:
+            return
+        
+        start = self.loaded_frames
+        end = min(start + len(block), len(self.audio_data))
+        self.audio_data[start:end] = block[:end - start]
+        self.loaded_frames = end
+    
+    def finish_loading(self) -> None:
+        """Encerra o carregamento progressivo."""
+        if self.audio_data is not None and self.loaded_frames < len(self.audio_data):
+            # O cabeçalho superestimou a duração
+            self.audio_data = self.audio_data[:self.loaded_frames]
+            self.duration = self.loaded_frames / self.sample_rate
+        if self.audio_data is not None and isinstance(self.audio_data, np.memmap):
+            self.audio_data.flush()
+        self.is_loading = False
+    
+    def get_buffered_duration(self) -> float:
+        """Retorna quantos segundos já estão prontos para tocar."""
+        if not self.sample_rate:
+            return 0.0
+        return self.loaded_frames / self.sample_rate
+    
+    def _create_cache(self, frames: int, channels: int) -> np.ndarray:
+        """Cria o arquivo de cache do PCM e o mapeia em memória."""
+        if frames <= 0:
+            return np.zeros((0, channels), dtype=np.float32)
+        
+        fd, path = tempfile.mkstemp(prefix=CACHE_PREFIX, suffix=".raw")
+        os.close(fd)
+        data = np.memmap(path, dtype=np.float32, mode='w+', shape=(frames, channels))
+        if os.name == "nt":
+            # O Windows não apaga arquivo mapeado: fica para ``close``
+            self._cache_path = path
+        else:
+            # O mapeamento continua válido sem o nome; uma queda não deixa o arquivo
+            os.remove(path)
+        return data
+    
+    def _release_cache(self) -> None:
+        """Fecha o mapeamento e apaga o arquivo de cache."""
+        data, self.audio_data = self.audio_data, None
+        # O mapeamento por trás do memmap (ou da fatia criada em ``finish_loading``)
+        mapping = data
+        while isinstance(mapping, np.ndarray):
+            mapping = mapping.base
+        del data
+        if isinstance(mapping, mmap.mmap):
+            try:
+                # No Windows o arquivo só pode ser apagado com o mapeamento fechado
+                mapping.close()
+            except BufferError:
+                pass  # Ainda há arrays usando o buffer; o arquivo fica para a próxima abertura
+        
+        if self._cache_path:
+            try:
+                os.remove(self._cache_path)
+            except OSError:
+                pass
+            self._cache_path = None
+    
+    def close(self) -> None:
+        """Para a reprodução e libera o cache do áudio."""
+        self.stop()
+        self._release_cache()
     
     def play(self) -> None:
         """Inicia ou retoma a reprodução."""
         if self.audio_data is None:
             return
         
-        if self.is_paused:
-            self.is_paused = False
-            self._stop_event.clear()
-        else:
-            self.is_playing = True
-            self._stop_event.clear()
-            self._playback_thread = threading.Thread(target=self._playback_loop)
-            self._playback_thread.daemon = True
-            self._playback_thread.start()
+        if self._stream is not None and not self.is_paused and not self._stream.active:
+            # Stream anterior terminou no fim do áudio: recomeçar do início
+            self._close_stream()
+            if self.current_position >= self.duration:
+                self.current_position = 0.0
+        
+        if self._stream is None:
+            self._move_to(int(self.current_position * self.sample_rate))
+            # Velocidade aplicada pela taxa efetiva do stream
+            stream_rate = int(self.sample_rate * self.speed)
+            self._stream_rate = stream_rate
+            self._fade_step = 1.0 / max(self.FADE_SECONDS * stream_rate, 1.0)
+            self._stream = sd.OutputStream(
+                samplerate=stream_rate,
+                channels=self.OUTPUT_CHANNELS,
+                dtype='float32',
+                blocksize=self.BLOCK_SIZE,
+                callback=self._audio_callback,
+                finished_callback=self._on_stream_finished
+            )
+            self._output_latency = float(self._stream.latency)
+        
+        self.is_playing = True
+        self.is_paused = False
+        self._gain = 0.0  # Entrar com rampa a partir do silêncio
+        self._stream.start()
     
     def pause(self) -> None:
         """Pausa a reprodução."""
-        if self.is_playing:
+        if self.is_playing and self._stream is not None and not self.is_paused:
+            # Retomar do que foi ouvido, não do que já estava no buffer de saída
+            position = self.get_position()
             self.is_paused = True
-            self._stop_event.set()
+            self._stream.stop()
+            self.current_position = position
+            self._move_to(int(position * self.sample_rate))
     
     def stop(self) -> None:
         """Para a reprodução e volta ao início."""
         self.is_playing = False
         self.is_paused = False
-        self._stop_event.set()
+        self._close_stream()
         self.current_position = 0.0
-        
-        if self._playback_thread and self._playback_thread.is_alive():
-            self._playback_thread.join(timeout=1.0)
+        self._move_to(0)
+    
+    def _close_stream(self) -> None:
+        """Fecha o stream de saída, se aberto."""
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.close()
     
     def seek(self, position: float) -> None:
         """
@@ -120,15 +305,47 @@ class AudioPlayer:
         position = max(0.0, min(position, self.duration))
         self.current_position = position
         
-        # Se estiver tocando, reiniciar reprodução da nova posição
-        if self.is_playing and not self.is_paused:
-            self._stop_event.set()
-            if self._playback_thread and self._playback_thread.is_alive():
-                self._playback_thread.join(timeout=1.0)
-            
-            self._playback_thread = threading.Thread(target=self._playback_loop)
-            self._playback_thread.daemon = True
-            self._playback_thread.start()
+        # O callback passa a ler da nova posição no próximo bloco, com rampa
+        self._gain = 0.0
+        self._move_to(int(position * self.sample_rate))
+    
+    def _move_to(self, frame: int) -> None:
+        """Reposiciona a leitura e zera o relógio (thread da interface)."""
+        with self._lock:
+            self._epoch += 1
+            self._frame = frame
+            self._anchors = [None] * self.CLOCK_ANCHORS
+    
+    def set_loop(self, start: float, end: float) -> None:
+        """
+        Repete o trecho ``[start, end)`` continuamente, com precisão de
+        amostra e sem reiniciar o stream. Se a posição atual estiver
+        depois do fim, a reprodução volta ao início do trecho.
+        
+        Args:
+            start: Início do trecho em segundos
+            end: Fim do trecho em segundos
+        """
+        if self.audio_data is None:
+            return
+        
+        start_frame = max(0, int(round(start * self.sample_rate)))
+        end_frame = min(len(self.audio_data), int(round(end * self.sample_rate)))
+        if end_frame <= start_frame:
+            self._loop = None
+            return
+        self._loop = (start_frame, end_frame)
+    
+    def clear_loop(self) -> None:
+        """Desliga a repetição; a reprodução segue normalmente."""
+        self._loop = None
+    
+    def get_loop(self) -> Optional[Tuple[float, float]]:
+        """Retorna a região de loop em segundos, ou None."""
+        loop = self._loop
+        if loop is None:
+            return None
+        return loop[0] / self.sample_rate, loop[1] / self.sample_rate
     
     def set_volume(self, volume: float) -> None:
         """
@@ -139,6 +356,15 @@ class AudioPlayer:
         """
         self.volume = max(0.0, min(1.0, volume))
     
+    def set_muted(self, muted: bool) -> None:
+        """
+        Liga ou desliga o mudo sem parar a reprodução.
+        
+        Args:
+            muted: True para silenciar
+        """
+        self.is_muted = muted
+    
     def set_speed(self, speed: float) -> None:
         """
         Define a velocidade de reprodução.
@@ -146,11 +372,61 @@ class AudioPlayer:
         Args:
             speed: Velocidade (0.5 = metade, 1.0 = normal, 2.0 = dobro)
         """
-        self.speed = max(0.25, min(4.0, speed))
+        speed = max(0.25, min(4.0, speed))
+        if speed == self.speed:
+            return
+        self.speed = speed
+        
+        # A taxa do stream é fixa: recriar se estiver aberto
+        if self._stream is not None:
+            was_active = self.is_playing and not self.is_paused
+            self.current_position = self.get_position()
+            self._close_stream()
+            if was_active:
+                self.play()
     
     def get_position(self) -> float:
-        """Retorna a posição atual em segundos."""
-        return self.current_position
+        """
+        Retorna a posição audível agora, em segundos.
+        
+        Durante a reprodução, extrapola a partir do último bloco que já
+        chegou ao DAC; é segura para chamar de qualquer thread e feita para
+        ser consultada na taxa da tela.
+        """
+        stream = self._stream
+        if stream is None or not self.is_playing or self.is_paused:
+            return self.current_position
+        
+        with self._lock:
+            anchors = [anchor for anchor in self._anchors if anchor is not None]
+        if not anchors:
+            return self.current_position
+        
+        try:
+            now = stream.time if anchors[0][4] else time.monotonic()
+        except Exception:
+            # Stream fechado por outra thread
+            return self.current_position
+        
+        # Bloco tocando agora: o último que já chegou ao DAC. Nenhum ainda
+        # (início ou logo após seek): o áudio começa no primeiro enfileirado.
+        played = [anchor for anchor in anchors if anchor[0] <= now]
+        if played:
+            dac_time, start, count, loop, _ = max(played, key=lambda anchor: anchor[0])
+            frame = start + min((now - dac_time) * self._stream_rate, count)
+        else:
+            dac_time, start, count, loop, _ = min(anchors, key=lambda anchor: anchor[0])
+            frame = start
+        
+        # O bloco pode ter voltado ao início do loop no meio
+        if loop is not None and frame >= loop[1]:
+            frame = loop[0] + (frame - loop[1]) % (loop[1] - loop[0])
+        
+        return min(frame / self.sample_rate, self.duration)
+    
+    def get_output_latency(self) -> float:
+        """Latência de saída do stream (segundos entre o callback e o DAC)."""
+        return self._output_latency if self._stream is not None else 0.0
     
     def get_duration(self) -> float:
         """Retorna a duração total em segundos."""
@@ -160,58 +436,91 @@ class AudioPlayer:
         """Verifica se há áudio carregado."""
         return self.audio_data is not None
     
-    def _playback_loop(self) -> None:
-        """Loop principal de reprodução."""
-        if self.audio_data is None:
-            return
+    def _audio_callback(self, outdata: np.ndarray, frames: int, time_info, status) -> None:
+        """Preenche o bloco de saída a partir do cache (thread de áudio)."""
+        with self._lock:
+            epoch = self._epoch
+            frame = self._frame
+        start = frame
+        loop = self._loop
+        filled = 0
         
-        # Calcular posição inicial em samples
-        start_sample = int(self.current_position * self.sample_rate)
-        total_samples = len(self.audio_data)
+        while filled < frames:
+            # Fim do loop no meio do bloco: continuar do início sem pausa
+            if loop is not None and frame >= loop[1]:
+                frame = loop[0]
+            limit = loop[1] if loop is not None else len(self.audio_data)
+            
+            # Carregamento ainda não chegou aqui: completar com silêncio
+            count = min(frames - filled, limit - frame, self.loaded_frames - frame)
+            if count <= 0:
+                break
+            
+            chunk = self.audio_data[frame:frame + count]
+            if chunk.shape[1] > self.OUTPUT_CHANNELS:
+                chunk = chunk[:, :self.OUTPUT_CHANNELS]
+            # Mono é duplicado nos dois canais por broadcast
+            self._apply_gain(chunk, outdata[filled:filled + count])
+            
+            frame += count
+            filled += count
+        outdata[filled:] = 0
         
-        # Ajustar velocidade alterando o sample rate efetivo
-        effective_sample_rate = int(self.sample_rate * self.speed)
+        # Instante em que o primeiro frame do bloco sai no DAC; alguns host
+        # APIs informam 0, e então vale o relógio monotônico mais a latência
+        dac_time = time_info.outputBufferDacTime
+        stream_clock = dac_time > 0
+        if not stream_clock:
+            dac_time = time.monotonic() + self._output_latency
         
-        # Buffer de reprodução
-        buffer_size = 1024
+        with self._lock:
+            # Seek durante o bloco: a nova posição prevalece
+            if self._epoch == epoch:
+                self._frame = frame
+                self._anchors[self._anchor_index] = (dac_time, start, filled, loop, stream_clock)
+                self._anchor_index = (self._anchor_index + 1) % self.CLOCK_ANCHORS
         
-        try:
-            while (start_sample < total_samples and 
-                   not self._stop_event.is_set() and 
-                   self.is_playing):
-                
-                # Calcular tamanho do próximo chunk
-                end_sample = min(start_sample + buffer_size, total_samples)
-                chunk = self.audio_data[start_sample:end_sample]
-                
-                # Aplicar volume
-                if self.volume != 1.0:
-                    chunk = chunk * self.volume
-                
-                # Reproduzir chunk
-                sd.play(chunk, samplerate=effective_sample_rate)
-                sd.wait()
-                
-                # Atualizar posição
-                samples_played = end_sample - start_sample
-                time_played = samples_played / self.sample_rate
-                self.current_position += time_played
-                start_sample = end_sample
-                
-                # Notificar mudança de posição
-                if self.on_position_changed:
-                    self.on_position_changed(self.current_position)
-                
-                # Verificar se chegou ao fim
-                if start_sample >= total_samples:
-                    self.is_playing = False
-                    if self.on_playback_finished:
-                        self.on_playback_finished()
-                    break
-                    
-        except Exception as e:
-            print(f"Erro na reprodução: {e}")
+        # Verificar se chegou ao fim
+        if loop is None and frame >= len(self.audio_data) and not self.is_loading:
+            raise sd.CallbackStop
+    
+    def _apply_gain(self, chunk: np.ndarray, out: np.ndarray) -> None:
+        """Copia ``chunk`` para ``out`` aplicando ganho, mudo e rampa, sem alocar."""
+        target = 0.0 if self.is_muted else self.volume
+        gain = self._gain
+        
+        if gain == target:
+            if target == 1.0:
+                np.copyto(out, chunk)
+            else:
+                np.multiply(chunk, target, out=out)
+            return
+        
+        frames = len(out)
+        if frames > len(self._ramp):
+            # Blocos maiores que o esperado: aumentar os buffers uma única vez
+            self._ramp = np.zeros(frames, dtype=np.float32)
+            self._ramp_index = np.arange(1, frames + 1, dtype=np.float32)
+        
+        # Rampa linear de ``gain`` até ``target``, limitada ao alvo
+        ramp = self._ramp[:frames]
+        step = self._fade_step if target > gain else -self._fade_step
+        np.multiply(self._ramp_index[:frames], step, out=ramp)
+        ramp += gain
+        np.clip(ramp, min(gain, target), max(gain, target), out=ramp)
+        np.multiply(chunk, ramp[:, np.newaxis], out=out)
+        self._gain = float(ramp[-1])
+    
+    def _on_stream_finished(self) -> None:
+        """Chamado pelo sounddevice quando o stream termina."""
+        # Pausa e stop também encerram o stream; só o fim do áudio notifica
+        if self.is_paused or self._stream is None or self.audio_data is None:
+            return
+        if self._loop is None and self._frame >= len(self.audio_data) and not self.is_loading:
             self.is_playing = False
+            self.current_position = self.duration
+            if self.on_playback_finished:
+                self.on_playback_finished()
     
     def get_audio_info(self) -> dict:
         """Retorna informações sobre o áudio carregado."""
@@ -0,0 +1,110 @@
+"""
+Módulo de benchmark da transcrição: velocidade (fator de tempo real) e
+precisão (taxa de erro de palavras) por preset.
+"""
+import re
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from app.core.sync_model import LyricLine
+
+
+_WORD_RE = re.compile(r"[\w']+")
+
+
+@dataclass
+class BenchmarkResult:
+    """Resultado de uma transcrição medida."""
+    preset: str
+    model_size: str
+    audio_duration: float
+    elapsed: float
+    wer: Optional[float] = None
+    
+    @property
+    def rtf(self) -> float:
+        """Fator de tempo real: segundos de processamento por segundo de áudio."""
+        return self.elapsed / self.audio_duration if self.audio_duration else 0.0
+
+
+def normalize_words(text: str) -> List[str]:
+    """Separa o texto em palavras minúsculas, sem pontuação."""
+    return _WORD_RE.findall(text.lower())
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """
+    Taxa de erro de palavras: (substituições + inserções + remoções)
+    divididas pelo número de palavras da referência.
+    
+    Args:
+        reference: Texto correto
+        hypothesis: Texto transcrito
+    
+    Returns:
+        WER (0 = idêntico; pode passar de 1 com muitas inserções)
+    """
+    ref = normalize_words(reference)
+    hyp = normalize_words(hypothesis)
+    if not ref:
+        return float(len(hyp) > 0)
+    
+    # Distância de edição por palavras, guardando só a linha anterior
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            )
+        previous = current
+    
+    return previous[-1] / len(ref)
+
+
+def lines_text(lines: Iterable[LyricLine]) -> str:
+    """Junta o texto das linhas para comparação."""
+    return " ".join(line.text for line in lines)
+
+
+def benchmark_presets(transcriber, audio_path: str, reference: Optional[str] = None,
+                      language: str = "pt", model_size: str = "base",
+                      presets: Optional[List[str]] = None) -> List[BenchmarkResult]:
+    """
+    Transcreve o mesmo áudio com cada preset, medindo tempo e WER.
+    
+    O carregamento do modelo e a decodificação do áudio ficam fora da
+    medição; só a transcrição é cronometrada.
+    
+    Args:
+        transcriber: Instância de ``Transcriber``
+        audio_path: Clipe de referência
+        reference: Texto correto do clipe (sem ele o WER não é calculado)
+        language: Código do idioma
+        model_size: Tamanho do modelo
+        presets: Presets a medir (todos se omitido)
+    
+    Returns:
+        Um resultado por preset
+    """
+    from app.core.alignment import SAMPLE_RATE
+    
+    audio = transcriber.load_audio(audio_path)
+    duration = len(audio) / SAMPLE_RATE
+    
+    results = []
+    for preset in presets or list(transcriber.PRESETS):
+        if not transcriber.load_model(model_size, preset):
+            raise RuntimeError(f"Falha ao carregar modelo {model_size}")
+        
+        started = time.perf_counter()
+        lines = transcriber.transcribe(audio_path, language, model_size, preset)
+        elapsed = time.perf_counter() - started
+        
+        wer = word_error_rate(reference, lines_text(lines)) if reference is not None else None
+        results.append(BenchmarkResult(preset, model_size, duration, elapsed, wer))
+    
+    return results
@@ -1,10 +1,17 @@
 """
 Módulo de exportação para diferentes formatos de legendas e letras.
 """
+import io
 import json
-from typing import List, Dict, Any
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple, TextIO, BinaryIO, Union
 from pathlib import Path
 
+import numpy as np
+
+from app.core.fileio import atomic_open
 from app.core.sync_model import LyricLine
 
 
@@ -13,6 +20,102 @@ class ExportError(Exception):
     pass
 
 
+# Tipos de problema de temporização
+ISSUE_NEGATIVE_START = 0
+ISSUE_INVERTED_RANGE = 1
+ISSUE_OVERLAP = 2
+
+# Registro estruturado devolvido por find_timing_issues
+ISSUE_DTYPE = np.dtype([("index", np.int64), ("kind", np.int8)])
+
+
+@dataclass
+class ValidationIssue:
+    """Problema de temporização encontrado em uma linha."""
+    index: int
+    kind: str
+    start: float
+    end: float
+    next_start: Optional[float] = None
+    
+    KINDS = {
+        ISSUE_NEGATIVE_START: "negative_start",
+        ISSUE_INVERTED_RANGE: "inverted_range",
+        ISSUE_OVERLAP: "overlap",
+    }
+    
+    @property
+    def message(self) -> str:
+        """Mensagem legível do problema."""
+        if self.kind == "negative_start":
+            return f"Linha {self.index + 1}: Tempo de início negativo ({self.start})"
+        if self.kind == "inverted_range":
+            return (f"Linha {self.index + 1}: Tempo de fim deve ser maior que início "
+                    f"({self.start} -> {self.end})")
+        return (f"Linha {self.index + 1}: Sobreposição com próxima linha "
+                f"({self.end} > {self.next_start})")
+    
+    def __str__(self) -> str:
+        return self.message
+
+
+def timing_arrays(lines: List[LyricLine]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Extrai os tempos das linhas para arrays NumPy.
+    
+    Args:
+        lines: Lista de linhas de letra
+        
+    Returns:
+        Tupla com (inícios, fins, máscara de linhas não vazias)
+    """
+    count = len(lines)
+    starts = np.fromiter((line.start for line in lines), dtype=np.float64, count=count)
+    ends = np.fromiter((line.end for line in lines), dtype=np.float64, count=count)
+    valid = np.fromiter((not line.is_empty() for line in lines), dtype=bool, count=count)
+    return starts, ends, valid
+
+
+def find_timing_issues(starts: np.ndarray, ends: np.ndarray,
+                       valid: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Encontra inícios negativos, intervalos invertidos e sobreposições com a
+    linha seguinte em uma única passada vetorizada.
+    
+    Args:
+        starts: Tempos de início
+        ends: Tempos de fim
+        valid: Máscara das linhas a verificar (todas, se omitida)
+        
+    Returns:
+        Array estruturado (ISSUE_DTYPE) com ``index`` e ``kind`` de cada
+        problema, ordenado por linha e tipo
+    """
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    if valid is None:
+        valid = np.ones(len(starts), dtype=bool)
+    
+    negative = valid & (starts < 0)
+    inverted = valid & (ends <= starts)
+    overlap = np.zeros(len(starts), dtype=bool)
+    if len(starts) > 1:
+        overlap[:-1] = valid[:-1] & valid[1:] & (ends[:-1] > starts[1:])
+    
+    masks = ((ISSUE_NEGATIVE_START, negative),
+             (ISSUE_INVERTED_RANGE, inverted),
+             (ISSUE_OVERLAP, overlap))
+    indices = np.concatenate([np.flatnonzero(mask) for _, mask in masks])
+    kinds = np.concatenate([np.full(np.count_nonzero(mask), kind, dtype=np.int8)
+                            for kind, mask in masks])
+    
+    issues = np.empty(len(indices), dtype=ISSUE_DTYPE)
+    order = np.lexsort((kinds, indices))
+    issues["index"] = indices[order]
+    issues["kind"] = kinds[order]
+    return issues
+
+
 def format_time_srt(seconds: float) -> str:
     """Formata tempo para formato SRT (HH:MM:SS,mmm)."""
     if seconds < 0:
@@ -45,6 +148,95 @@ def format_time_lrc(seconds: float) -> str:
     return f"{minutes:02d}:{secs:02d}.{cs:02d}"
 
 
+def _non_empty(lines: List[LyricLine]) -> Iterator[Tuple[LyricLine, str]]:
+    """Gera pares (linha, texto sem espaços) ignorando linhas vazias."""
+    for line in lines:
+        text = line.text.strip()
+        if text:
+            yield line, text
+
+
+def write_txt(lines: List[LyricLine], stream: TextIO) -> None:
+    """
+    Escreve apenas o texto das letras em um stream de texto.
+    
+    Args:
+        lines: Lista de linhas de letra
+        stream: Stream de texto de destino
+    """
+    stream.writelines(f"{text}\n" for _, text in _non_empty(lines))
+
+
+def write_srt(lines: List[LyricLine], stream: TextIO) -> None:
+    """
+    Escreve legendas SRT em um stream de texto.
+    
+    Args:
+        lines: Lista de linhas de letra
+        stream: Stream de texto de destino
+    """
+    stream.writelines(
+        f"{index}\n"
+        f"{format_time_srt(line.start)} --> {format_time_srt(line.end)}\n"
+        f"{text}\n\n"
+        for index, (line, text) in enumerate(_non_empty(lines), 1)
+    )
+
+
+def write_lrc(lines: List[LyricLine], stream: TextIO) -> None:
+    """
+    Escreve letras LRC em um stream de texto.
+    
+    Args:
+        lines: Lista de linhas de letra
+        stream: Stream de texto de destino
+    """
+    stream.writelines(
+        f"[{format_time_lrc(line.start)}]{text}\n"
+        for line, text in _non_empty(lines)
+    )
+
+
+def write_vtt(lines: List[LyricLine], stream: TextIO) -> None:
+    """
+    Escreve legendas WebVTT em um stream de texto.
+    
+    Args:
+        lines: Lista de linhas de letra
+        stream: Stream de texto de destino
+    """
+    stream.write("WEBVTT\n\n")
+    stream.writelines(
+        f"{format_time_vtt(line.start)} --> {format_time_vtt(line.end)}\n{text}\n\n"
+        for line, text in _non_empty(lines)
+    )
+
+
+def write_json(lines: List[LyricLine], stream: TextIO) -> None:
+    """
+    Escreve JSON com timestamps em um stream de texto.
+    
+    Args:
+        lines: Lista de linhas de letra
+        stream: Stream de texto de destino
+    """
+    data = [
+        {"start": line.start, "end": line.end, "text": line.text}
+        for line in lines if line.text.strip()
+    ]
+    json.dump(data, stream, indent=2, ensure_ascii=False)
+
+
+def _export_to_path(writer: Callable[[List[LyricLine], TextIO], None],
+                    lines: List[LyricLine], path: str, label: str) -> None:
+    """Grava a saída de ``writer`` em ``path``, traduzindo erros para ExportError."""
+    try:
+        with atomic_open(path) as f:
+            writer(lines, f)
+    except Exception as e:
+        raise ExportError(f"Erro ao exportar {label}: {e}")
+
+
 def export_txt(lines: List[LyricLine], path: str) -> None:
     """
     Exporta apenas o texto das letras para arquivo TXT.
@@ -53,13 +245,7 @@ def export_txt(lines: List[LyricLine], path: str) -> None:
         lines: Lista de linhas de letra
         path: Caminho do arquivo de saída
     """
-    try:
-        with open(path, 'w', encoding='utf-8') as f:
-            for line in lines:
-                if line.text.strip():
-                    f.write(line.text.strip() + '\n')
-    except Exception as e:
-        raise ExportError(f"Erro ao exportar TXT: {e}")
+    _export_to_path(write_txt, lines, path, "TXT")
 
 
 def export_srt(lines: List[LyricLine], path: str) -> None:
@@ -70,23 +256,7 @@ def export_srt(lines: List[LyricLine], path: str) -> None:
         lines: Lista de linhas de letra
         path: Caminho do arquivo de saída
     """
-    try:
-        with open(path, 'w', encoding='utf-8') as f:
-            subtitle_index = 1
-            for line in lines:
-                text = line.text.strip()
-                if not text:
-                    continue
-                start_time = format_time_srt(line.start)
-                end_time = format_time_srt(line.end)
-                
-                f.write(f"{subtitle_index}\n")
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{text}\n\n")
-                
-                subtitle_index += 1
-    except Exception as e:
-        raise ExportError(f"Erro ao exportar SRT: {e}")
+    _export_to_path(write_srt, lines, path, "SRT")
 
 
 def export_lrc(lines: List[LyricLine], path: str) -> None:
@@ -97,16 +267,7 @@ def export_lrc(lines: List[LyricLine], path: str) -> None:
         lines: Lista de linhas de letra
         path: Caminho do arquivo de saída
     """
-    try:
-        with open(path, 'w', encoding='utf-8') as f:
-            for line in lines:
-                text = line.text.strip()
-                if not text:
-                    continue
-                timestamp = format_time_lrc(line.start)
-                f.write(f"[{timestamp}]{text}\n")
-    except Exception as e:
-        raise ExportError(f"Erro ao exportar LRC: {e}")
+    _export_to_path(write_lrc, lines, path, "LRC")
 
 
 def export_vtt(lines: List[LyricLine], path: str) -> None:
@@ -117,21 +278,7 @@ def export_vtt(lines: List[LyricLine], path: str) -> None:
         lines: Lista de linhas de letra
         path: Caminho do arquivo de saída
     """
-    try:
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write("WEBVTT\n\n")
-            
-            for line in lines:
-                text = line.text.strip()
-                if not text:
-                    continue
-                start_time = format_time_vtt(line.start)
-                end_time = format_time_vtt(line.end)
-                
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{text}\n\n")
-    except Exception as e:
-        raise ExportError(f"Erro ao exportar VTT: {e}")
+    _export_to_path(write_vtt, lines, path, "VTT")
 
 
 def export_json(lines: List[LyricLine], path: str) -> None:
@@ -142,20 +289,7 @@ def export_json(lines: List[LyricLine], path: str) -> None:
         lines: Lista de linhas de letra
         path: Caminho do arquivo de saída
     """
-    try:
-        data = []
-        for line in lines:
-            if line.text.strip():
-                data.append({
-                    "start": line.start,
-                    "end": line.end,
-                    "text": line.text
-                })
-        
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        raise ExportError(f"Erro ao exportar JSON: {e}")
+    _export_to_path(write_json, lines, path, "JSON")
 
 
 class Exporter:
@@ -163,11 +297,16 @@ class Exporter:
     
     # Formatos suportados
     FORMATS = {
-        "txt": {"name": "Texto Simples", "extension": ".txt", "function": export_txt},
-        "srt": {"name": "Legendas SRT", "extension": ".srt", "function": export_srt},
-        "lrc": {"name": "Letras LRC", "extension": ".lrc", "function": export_lrc},
-        "vtt": {"name": "WebVTT", "extension": ".vtt", "function": export_vtt},
-        "json": {"name": "JSON", "extension": ".json", "function": export_json}
+        "txt": {"name": "Texto Simples", "extension": ".txt", "function": export_txt,
+                "writer": write_txt},
+        "srt": {"name": "Legendas SRT", "extension": ".srt", "function": export_srt,
+                "writer": write_srt},
+        "lrc": {"name": "Letras LRC", "extension": ".lrc", "function": export_lrc,
+                "writer": write_lrc},
+        "vtt": {"name": "WebVTT", "extension": ".vtt", "function": export_vtt,
+                "writer": write_vtt},
+        "json": {"name": "JSON", "extension": ".json", "function": export_json,
+                 "writer": write_json}
     }
     
     @classmethod
@@ -193,21 +332,17 @@ class Exporter:
         if not path.suffix:
             path = path.with_suffix(cls.FORMATS[format_type]["extension"])
         
-        # Filtrar linhas vazias
-        non_empty_lines = [line for line in lines if not line.is_empty()]
-        
-        if not non_empty_lines:
-            raise ExportError("Nenhuma linha válida para exportar")
-        
         # Exportar
-        export_func = cls.FORMATS[format_type]["function"]
-        export_func(non_empty_lines, str(path))
+        cls._export_prepared(cls._prepare_lines(lines), str(path), format_type)
     
     @classmethod
     def export_all(cls, lines: List[LyricLine], base_path: str) -> Dict[str, str]:
         """
         Exporta para todos os formatos suportados.
         
+        As linhas são filtradas uma única vez e os formatos são gerados em
+        paralelo; cada arquivo é escrito em um temporário e renomeado ao final.
+        
         Args:
             lines: Lista de linhas de letra
             base_path: Caminho base (sem extensão)
@@ -218,49 +353,144 @@ class Exporter:
         base_path = Path(base_path)
         exported_files = {}
         
-        for format_type, info in cls.FORMATS.items():
-            try:
-                file_path = base_path.with_suffix(info["extension"])
-                cls.export(lines, str(file_path), format_type)
-                exported_files[format_type] = str(file_path)
-            except ExportError as e:
-                print(f"Erro ao exportar {format_type}: {e}")
+        try:
+            non_empty_lines = cls._prepare_lines(lines)
+        except ExportError as e:
+            print(f"Erro ao exportar: {e}")
+            return exported_files
+        
+        with ThreadPoolExecutor(max_workers=len(cls.FORMATS)) as executor:
+            futures = {}
+            for format_type, info in cls.FORMATS.items():
+                file_path = str(base_path.with_suffix(info["extension"]))
+                futures[format_type] = (
+                    file_path,
+                    executor.submit(cls._export_prepared, non_empty_lines,
+                                    file_path, format_type)
+                )
+            
+            # Coletar na ordem de FORMATS para manter o resultado estável
+            for format_type, (file_path, future) in futures.items():
+                try:
+                    future.result()
+                    exported_files[format_type] = file_path
+                except ExportError as e:
+                    print(f"Erro ao exportar {format_type}: {e}")
         
         return exported_files
     
+    @classmethod
+    def write(cls, lines: List[LyricLine], stream: Union[TextIO, BinaryIO],
+              format_type: str, encoding: str = "utf-8") -> None:
+        """
+        Exporta linhas para um stream já aberto (texto ou binário).
+        
+        Args:
+            lines: Lista de linhas de letra
+            stream: Stream de destino; streams binários recebem ``encoding``
+            format_type: Tipo de formato ("txt", "srt", "lrc", "vtt", "json")
+            encoding: Codificação usada em streams binários
+        """
+        if format_type not in cls.FORMATS:
+            raise ExportError(f"Formato não suportado: {format_type}")
+        
+        lines = cls._prepare_lines(lines)
+        writer = cls.FORMATS[format_type]["writer"]
+        
+        try:
+            if isinstance(stream, io.TextIOBase):
+                writer(lines, stream)
+            else:
+                text_stream = io.TextIOWrapper(stream, encoding=encoding, newline="")
+                try:
+                    writer(lines, text_stream)
+                    text_stream.flush()
+                finally:
+                    # Devolver o stream binário ao chamador sem fechá-lo
+                    text_stream.detach()
+        except Exception as e:
+            raise ExportError(f"Erro ao exportar {format_type.upper()}: {e}")
+    
+    @classmethod
+    def render(cls, lines: List[LyricLine], format_type: str) -> str:
+        """
+        Exporta linhas para uma string, sem passar pelo disco.
+        
+        Args:
+            lines: Lista de linhas de letra
+            format_type: Tipo de formato ("txt", "srt", "lrc", "vtt", "json")
+            
+        Returns:
+            Conteúdo do arquivo no formato pedido
+        """
+        buffer = io.StringIO()
+        cls.write(lines, buffer, format_type)
+        return buffer.getvalue()
+    
+    @classmethod
+    def render_bytes(cls, lines: List[LyricLine], format_type: str,
+                     encoding: str = "utf-8") -> bytes:
+        """
+        Exporta linhas para bytes, sem passar pelo disco.
+        
+        Args:
+            lines: Lista de linhas de letra
+            format_type: Tipo de formato ("txt", "srt", "lrc", "vtt", "json")
+            encoding: Codificação do resultado
+            
+        Returns:
+            Conteúdo codificado do arquivo no formato pedido
+        """
+        buffer = io.BytesIO()
+        cls.write(lines, buffer, format_type, encoding)
+        return buffer.getvalue()
+    
+    @classmethod
+    def _prepare_lines(cls, lines: List[LyricLine]) -> List[LyricLine]:
+        """Filtra linhas vazias, falhando se não sobrar nenhuma."""
+        non_empty_lines = [line for line in lines if not line.is_empty()]
+        
+        if not non_empty_lines:
+            raise ExportError("Nenhuma linha válida para exportar")
+        
+        return non_empty_lines
+    
+    @classmethod
+    def _export_prepared(cls, lines: List[LyricLine], path: str,
+                         format_type: str) -> None:
+        """Exporta linhas já filtradas por ``_prepare_lines``."""
+        export_func = cls.FORMATS[format_type]["function"]
+        export_func(lines, path)
+    
     @classmethod
     def get_format_info(cls, format_type: str) -> Dict[str, Any]:
         """Retorna informações sobre um formato."""
         return cls.FORMATS.get(format_type, {})
     
     @classmethod
-    def validate_lines(cls, lines: List[LyricLine]) -> List[str]:
+    def validate_lines(cls, lines: List[LyricLine]) -> List[ValidationIssue]:
         """
         Valida linhas e retorna lista de problemas encontrados.
         
+        A verificação é feita de uma vez sobre os arrays de tempos; ``str()``
+        de cada problema produz a mensagem legível.
+        
         Args:
             lines: Lista de linhas para validar
             
         Returns:
-            Lista de mensagens de erro
+            Lista de ValidationIssue, ordenada por linha
         """
-        errors = []
-        
-        for i, line in enumerate(lines):
-            if line.is_empty():
-                continue
-            
-            # Verificar tempos válidos
-            if line.start < 0:
-                errors.append(f"Linha {i+1}: Tempo de início negativo ({line.start})")
-            
-            if line.end <= line.start:
-                errors.append(f"Linha {i+1}: Tempo de fim deve ser maior que início ({line.start} -> {line.end})")
-            
-            # Verificar sobreposição com próxima linha
-            if i < len(lines) - 1:
-                next_line = lines[i + 1]
-                if not next_line.is_empty() and line.end > next_line.start:
-                    errors.append(f"Linha {i+1}: Sobreposição com próxima linha ({line.end} > {next_line.start})")
+        starts, ends, valid = timing_arrays(lines)
+        issues = find_timing_issues(starts, ends, valid)
         
-        return errors
+        return [
+            ValidationIssue(
+                index=int(index),
+                kind=ValidationIssue.KINDS[kind],
+                start=float(starts[index]),
+                end=float(ends[index]),
+                next_start=float(starts[index + 1]) if kind == ISSUE_OVERLAP else None
+            )
+            for index, kind in zip(issues["index"].tolist(), issues["kind"].tolist())
+        ]
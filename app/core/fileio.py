@@ -0,0 +1,55 @@
+"""
+Módulo de gravação de arquivos: escrita atômica com as permissões que um
+``open(path, 'w')`` comum daria.
+"""
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+
+
+def _current_umask() -> int:
+    """Máscara de permissões do processo (só pode ser lida trocando-a)."""
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+# Lida uma vez, na importação: trocar a máscara em paralelo com outras
+# threads criando arquivos não é seguro
+_UMASK = _current_umask()
+
+
+def _file_mode(path: str) -> int:
+    """Permissões para gravar ``path``: as do arquivo existente ou as padrão."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_open(path: str):
+    """
+    Abre arquivo temporário no mesmo diretório e o renomeia para ``path``
+    ao final, de forma que leitores nunca vejam um arquivo pela metade.
+    
+    O ``mkstemp`` cria o temporário só para o dono (0600); antes de renomear
+    ele recebe as permissões que ``open(path, 'w')`` daria. Quebras de linha
+    são gravadas como escritas (``newline=''``), igual a ``Exporter.write``.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            yield f
+        os.chmod(temp_path, _file_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,168 @@
+"""
+Módulo de sincronização guiada: o usuário marca os tempos das linhas
+tocando uma tecla junto com a música.
+"""
+from statistics import median
+from typing import List, Optional, Tuple
+
+from app.core.sync_model import SyncProject
+
+
+class GuidedSync:
+    """
+    Motor da sincronização guiada.
+    
+    Cada toque chega com o tempo do relógio de áudio no instante da tecla
+    (``AudioPlayer.get_position``, já referido ao que sai no DAC, ou seja,
+    sem a latência de saída). O atraso de reação calibrado é descontado e o
+    resultado vai direto para ``project.lines``; os métodos de marcação
+    retornam os índices das linhas alteradas, para a interface atualizar
+    só essas linhas.
+    """
+    
+    # Toques sobre linhas já sincronizadas necessários para estimar o atraso
+    MIN_CALIBRATION_TAPS = 4
+    
+    # Diferença máxima (segundos) entre toque e tempo anterior da linha para
+    # o par entrar na calibração; além disso o usuário não estava no ritmo
+    MAX_CALIBRATION_ERROR = 1.0
+    
+    def __init__(self, project: SyncProject, reaction_offset: float = 0.0):
+        self.project = project
+        self.reaction_offset = reaction_offset
+        self.is_active: bool = False
+        
+        # Próxima linha a receber início
+        self.current_index: int = 0
+        # O fim da linha anterior já foi marcado explicitamente
+        self._closed: bool = False
+        
+        # Desfazer: (índice atual, fechada, [(linha, início, fim)])
+        self._history: List[Tuple[int, bool, List[Tuple[int, float, float]]]] = []
+        # Pares (toque sem compensação, início anterior) para calibração
+        self._calibration: List[Tuple[float, float]] = []
+    
+    def start(self, index: int = 0) -> None:
+        """
+        Inicia uma sessão a partir da linha ``index``.
+        
+        Args:
+            index: Primeira linha a receber início
+        """
+        self.is_active = True
+        self.current_index = max(0, min(index, len(self.project.lines)))
+        self._closed = False
+        self._history.clear()
+        self._calibration.clear()
+    
+    def stop(self) -> None:
+        """Encerra a sessão (as marcações já estão no projeto)."""
+        self.is_active = False
+    
+    @property
+    def current_line(self) -> Optional[int]:
+        """Índice da linha que recebe o próximo toque, ou None se acabaram."""
+        if self.current_index < len(self.project.lines):
+            return self.current_index
+        return None
+    
+    def compensate(self, timestamp: float) -> float:
+        """Converte o tempo do relógio de áudio no tempo marcado."""
+        return max(0.0, timestamp - self.reaction_offset)
+    
+    def tap(self, timestamp: float) -> List[int]:
+        """
+        Marca o início da linha atual e avança. Se o fim da anterior não
+        foi marcado, ela termina no mesmo instante.
+        
+        Args:
+            timestamp: Posição do áudio no momento da tecla (segundos)
+        
+        Returns:
+            Índices das linhas alteradas
+        """
+        index = self.current_line
+        if not self.is_active or index is None:
+            return []
+        
+        lines = self.project.lines
+        line = lines[index]
+        previous = lines[index - 1] if index > 0 else None
+        
+        # Toques não voltam no tempo em relação à linha anterior
+        time = self.compensate(timestamp)
+        if previous is not None:
+            time = max(time, previous.start)
+        
+        touched = [index] if previous is None or self._closed else [index - 1, index]
+        self._save(touched)
+        
+        if line.end > line.start > 0:
+            self._calibration.append((timestamp, line.start))
+        
+        line.start = time
+        if line.end < time:
+            line.end = time
+        if previous is not None and not self._closed:
+            previous.end = time
+        
+        self.current_index += 1
+        self._closed = False
+        return touched
+    
+    def mark_end(self, timestamp: float) -> List[int]:
+        """
+        Marca o fim da última linha iniciada (pausa antes da próxima).
+        
+        Args:
+            timestamp: Posição do áudio no momento da tecla (segundos)
+        
+        Returns:
+            Índices das linhas alteradas
+        """
+        index = self.current_index - 1
+        if not self.is_active or index < 0 or index >= len(self.project.lines):
+            return []
+        
+        self._save([index])
+        line = self.project.lines[index]
+        line.end = max(self.compensate(timestamp), line.start)
+        self._closed = True
+        return [index]
+    
+    def undo(self) -> List[int]:
+        """
+        Desfaz a última marcação, voltando para a linha correspondente.
+        
+        Returns:
+            Índices das linhas restauradas
+        """
+        if not self._history:
+            return []
+        
+        self.current_index, self._closed, saved = self._history.pop()
+        for index, start, end in saved:
+            line = self.project.lines[index]
+            line.start = start
+            line.end = end
+        return [index for index, _, _ in saved]
+    
+    def estimate_reaction_offset(self) -> Optional[float]:
+        """
+        Estima o atraso de reação pelos toques sobre linhas que já tinham
+        tempo (mediana de toque - início anterior).
+        
+        Returns:
+            Atraso em segundos, ou None se não há toques suficientes
+        """
+        errors = [tap - start for tap, start in self._calibration
+                  if abs(tap - start) <= self.MAX_CALIBRATION_ERROR]
+        if len(errors) < self.MIN_CALIBRATION_TAPS:
+            return None
+        return median(errors)
+    
+    def _save(self, indices: List[int]) -> None:
+        """Guarda o estado das linhas antes de uma marcação."""
+        lines = self.project.lines
+        saved = [(i, lines[i].start, lines[i].end) for i in indices]
+        self._history.append((self.current_index, self._closed, saved))
@@ -0,0 +1,372 @@
+"""
+Módulo de importação de legendas e letras já sincronizadas.
+"""
+import html
+import json
+import re
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from pathlib import Path
+
+from app.core.sync_model import LyricLine, SyncProject
+
+
+class ImporterError(Exception):
+    """Exceção para erros de importação."""
+    pass
+
+
+# Duração atribuída à última linha de um LRC (o formato não tem tempo de fim)
+LRC_LAST_LINE_DURATION = 5.0
+
+# HH:MM:SS,mmm / MM:SS.mmm (horas e milissegundos opcionais)
+_TIME = r"(?:(\d+):)?(\d{1,2}):(\d{1,2})(?:[,.](\d{1,3}))?"
+_CUE_TIMING_RE = re.compile(rf"^\s*{_TIME}\s*-->\s*{_TIME}")
+_LRC_TAG_RE = re.compile(r"\[([^\[\]]*)\]")
+_LRC_TIME_RE = re.compile(r"^\s*(\d+):(\d{1,2})(?:[.:](\d{1,3}))?\s*$")
+_LRC_WORD_TIME_RE = re.compile(r"<\d+:\d{1,2}(?:[.:]\d{1,3})?>")
+_MARKUP_RE = re.compile(r"<[^>]*>")
+
+
+def _to_seconds(hours: Optional[str], minutes: str, secs: str,
+                fraction: Optional[str]) -> float:
+    """Converte os grupos de um timestamp em segundos."""
+    total = int(minutes) * 60 + int(secs)
+    if hours:
+        total += int(hours) * 3600
+    if fraction:
+        # "5" -> 500 ms, "05" -> 50 ms, "005" -> 5 ms
+        return total + int(fraction) / (10 ** len(fraction))
+    return float(total)
+
+
+def _parse_cues(lines: Iterable[str], drop_numeric_ids: bool,
+                strip_markup: bool) -> Iterator[LyricLine]:
+    """
+    Parser comum de SRT e VTT: blocos com uma linha ``início --> fim``
+    seguida de uma ou mais linhas de texto.
+    
+    Blocos sem timing válido (cabeçalhos, NOTE, STYLE, lixo) são ignorados.
+    """
+    start = end = 0.0
+    text_parts: Optional[List[str]] = None
+    
+    def flush():
+        if text_parts:
+            text = " ".join(text_parts)
+            if strip_markup and "<" in text:
+                text = _MARKUP_RE.sub("", text).strip()
+            if strip_markup and "&" in text:
+                text = html.unescape(text)
+            if text:
+                return LyricLine(start=start, end=end, text=text)
+        return None
+    
+    for raw in lines:
+        line = raw.strip()
+        
+        if "-->" in line:
+            # Arquivos sem linha em branco entre blocos: o índice do
+            # próximo bloco ficou grudado no texto do anterior
+            if drop_numeric_ids and text_parts and text_parts[-1].isdigit():
+                text_parts.pop()
+            cue = flush()
+            if cue is not None:
+                yield cue
+            
+            match = _CUE_TIMING_RE.match(line)
+            if match:
+                groups = match.groups()
+                start = _to_seconds(*groups[:4])
+                end = _to_seconds(*groups[4:])
+                text_parts = []
+            else:
+                text_parts = None
+            continue
+        
+        if not line:
+            cue = flush()
+            if cue is not None:
+                yield cue
+            text_parts = None
+            continue
+        
+        if text_parts is not None:
+            text_parts.append(line)
+    
+    cue = flush()
+    if cue is not None:
+        yield cue
+
+
+def parse_srt(lines: Iterable[str]) -> Iterator[LyricLine]:
+    """
+    Lê legendas SRT linha a linha.
+    
+    Args:
+        lines: Linhas do arquivo (um arquivo aberto serve)
+    
+    Returns:
+        Iterador de LyricLine
+    """
+    return _parse_cues(lines, drop_numeric_ids=True, strip_markup=False)
+
+
+def parse_vtt(lines: Iterable[str]) -> Iterator[LyricLine]:
+    """
+    Lê legendas WebVTT linha a linha, removendo tags de formatação.
+    
+    Args:
+        lines: Linhas do arquivo (um arquivo aberto serve)
+    
+    Returns:
+        Iterador de LyricLine
+    """
+    return _parse_cues(lines, drop_numeric_ids=False, strip_markup=True)
+
+
+def parse_lrc(lines: Iterable[str],
+              duration: Optional[float] = None) -> Iterator[LyricLine]:
+    """
+    Lê letras LRC, incluindo linhas com vários timestamps
+    (``[00:12.00][00:45.00]Refrão``), tags de palavra e ``[offset:]``.
+    
+    O fim de cada linha é o início da próxima; uma linha com timestamp
+    e sem texto apenas encerra a anterior.
+    
+    Args:
+        lines: Linhas do arquivo (um arquivo aberto serve)
+        duration: Duração do áudio, usada como fim da última linha
+    
+    Returns:
+        Iterador de LyricLine
+    """
+    entries: List[Tuple[float, str]] = []
+    offset = 0.0
+    
+    for raw in lines:
+        line = raw.strip()
+        if not line.startswith("["):
+            continue
+        
+        times = []
+        pos = 0
+        for match in _LRC_TAG_RE.finditer(line):
+            if match.start() != pos:
+                break
+            pos = match.end()
+            tag = match.group(1)
+            
+            time_match = _LRC_TIME_RE.match(tag)
+            if time_match:
+                times.append(_to_seconds(None, *time_match.groups()))
+            elif tag[:7].lower() == "offset:":
+                try:
+                    # Offset positivo adianta a letra (em milissegundos)
+                    offset = int(tag[7:].strip()) / 1000.0
+                except ValueError:
+                    pass
+        
+        if not times:
+            continue
+        
+        text = line[pos:]
+        if "<" in text:
+            text = _LRC_WORD_TIME_RE.sub("", text)
+        text = " ".join(text.split())
+        
+        for time in times:
+            entries.append((time, text))
+    
+    entries.sort(key=lambda entry: entry[0])
+    
+    for i, (time, text) in enumerate(entries):
+        if not text:
+            continue
+        start = max(0.0, time - offset)
+        if i + 1 < len(entries):
+            end = max(start, entries[i + 1][0] - offset)
+        elif duration is not None and duration > start:
+            end = duration
+        else:
+            end = start + LRC_LAST_LINE_DURATION
+        yield LyricLine(start=start, end=end, text=text)
+
+
+def parse_json(data: Any) -> Iterator[LyricLine]:
+    """
+    Lê linhas a partir de dados JSON já decodificados.
+    
+    Aceita a lista gerada por ``export_json``, um projeto (``{"lines": [...]}``),
+    um arquivo ``.aurantisproj`` ou a saída do Whisper (``{"segments": [...]}``).
+    Itens malformados são ignorados.
+    
+    Args:
+        data: Objeto retornado por ``json.load``
+    
+    Returns:
+        Iterador de LyricLine
+    """
+    if isinstance(data, dict):
+        if isinstance(data.get("project"), dict):
+            data = data["project"]
+        data = data.get("lines", data.get("segments", []))
+    
+    if not isinstance(data, list):
+        return
+    
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+        text = item.get("text")
+        if not isinstance(text, str) or not text.strip():
+            continue
+        try:
+            start = float(item.get("start", 0.0))
+            end = float(item.get("end", start))
+        except (TypeError, ValueError):
+            continue
+        yield LyricLine(start=start, end=end, text=text.strip())
+
+
+def _read_lines(path: str, parser) -> List[LyricLine]:
+    """Abre o arquivo como texto e aplica um parser de linhas."""
+    with open(path, 'r', encoding='utf-8-sig', errors='replace') as f:
+        return list(parser(f))
+
+
+def import_srt(path: str) -> List[LyricLine]:
+    """
+    Importa legendas SRT.
+    
+    Args:
+        path: Caminho do arquivo
+    
+    Returns:
+        Lista de linhas de letra
+    """
+    try:
+        return _read_lines(path, parse_srt)
+    except Exception as e:
+        raise ImporterError(f"Erro ao importar SRT: {e}")
+
+
+def import_vtt(path: str) -> List[LyricLine]:
+    """
+    Importa legendas WebVTT.
+    
+    Args:
+        path: Caminho do arquivo
+    
+    Returns:
+        Lista de linhas de letra
+    """
+    try:
+        return _read_lines(path, parse_vtt)
+    except Exception as e:
+        raise ImporterError(f"Erro ao importar VTT: {e}")
+
+
+def import_lrc(path: str) -> List[LyricLine]:
+    """
+    Importa letras LRC.
+    
+    Args:
+        path: Caminho do arquivo
+    
+    Returns:
+        Lista de linhas de letra
+    """
+    try:
+        return _read_lines(path, parse_lrc)
+    except Exception as e:
+        raise ImporterError(f"Erro ao importar LRC: {e}")
+
+
+def import_json(path: str) -> List[LyricLine]:
+    """
+    Importa linhas de um arquivo JSON.
+    
+    Args:
+        path: Caminho do arquivo
+    
+    Returns:
+        Lista de linhas de letra
+    """
+    try:
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            data = json.load(f)
+        return list(parse_json(data))
+    except Exception as e:
+        raise ImporterError(f"Erro ao importar JSON: {e}")
+
+
+class Importer:
+    """Classe principal para importação de letras sincronizadas."""
+    
+    # Formatos suportados
+    FORMATS = {
+        "srt": {"name": "Legendas SRT", "extension": ".srt", "function": import_srt},
+        "lrc": {"name": "Letras LRC", "extension": ".lrc", "function": import_lrc},
+        "vtt": {"name": "WebVTT", "extension": ".vtt", "function": import_vtt},
+        "json": {"name": "JSON", "extension": ".json", "function": import_json}
+    }
+    
+    @classmethod
+    def get_supported_formats(cls) -> Dict[str, str]:
+        """Retorna dicionário com formatos suportados."""
+        return {fmt: info["name"] for fmt, info in cls.FORMATS.items()}
+    
+    @classmethod
+    def detect_format(cls, path: str) -> Optional[str]:
+        """Detecta o formato pela extensão do arquivo."""
+        suffix = Path(path).suffix.lower()
+        for format_type, info in cls.FORMATS.items():
+            if info["extension"] == suffix:
+                return format_type
+        return None
+    
+    @classmethod
+    def import_lines(cls, path: str,
+                     format_type: Optional[str] = None) -> List[LyricLine]:
+        """
+        Importa linhas do arquivo no formato especificado.
+        
+        Args:
+            path: Caminho do arquivo de entrada
+            format_type: Tipo de formato ("srt", "lrc", "vtt", "json");
+                detectado pela extensão se omitido
+        
+        Returns:
+            Lista de linhas de letra
+        """
+        if format_type is None:
+            format_type = cls.detect_format(path)
+        
+        if format_type not in cls.FORMATS:
+            raise ImporterError(f"Formato não suportado: {format_type or Path(path).suffix}")
+        
+        import_func = cls.FORMATS[format_type]["function"]
+        lines = import_func(str(path))
+        
+        if not lines:
+            raise ImporterError("Nenhuma linha válida encontrada no arquivo")
+        
+        return lines
+    
+    @classmethod
+    def import_project(cls, path: str, format_type: Optional[str] = None,
+                       audio_path: str = "", language: str = "pt") -> SyncProject:
+        """
+        Cria um projeto a partir de um arquivo de legendas ou letras.
+        
+        Args:
+            path: Caminho do arquivo de entrada
+            format_type: Tipo de formato; detectado pela extensão se omitido
+            audio_path: Áudio associado ao projeto
+            language: Código do idioma
+        
+        Returns:
+            Projeto com as linhas importadas
+        """
+        lines = cls.import_lines(path, format_type)
+        return SyncProject(audio_path=audio_path, language=language, lines=lines)
@@ -0,0 +1,373 @@
+"""
+Módulo da fila de transcrição: vários áudios transcritos um após o outro,
+com prioridade, progresso, previsão de término e persistência.
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from app.config import JOB_QUEUE_PATH
+from app.core.fileio import atomic_open
+from app.core.sync_model import LyricLine, SyncProject
+from app.core.transcriber import SAMPLE_RATE, TranscriptionCancelled
+
+
+def probe_duration(audio_path: str) -> Optional[float]:
+    """Duração do áudio pelo cabeçalho (None se o formato exige decodificar)."""
+    try:
+        import soundfile as sf
+        info = sf.info(audio_path)
+        return info.frames / info.samplerate if info.frames > 0 else None
+    except Exception:
+        return None
+
+
+@dataclass
+class TranscriptionJob:
+    """Um áudio na fila de transcrição."""
+    audio_path: str
+    language: str = "pt"
+    model_size: str = "base"
+    preset: str = "balanced"
+    priority: int = 0  # Maior sai primeiro
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    sequence: int = 0  # Ordem de chegada, para desempate
+    status: str = "pending"
+    progress: float = 0.0
+    duration: Optional[float] = None
+    error: str = ""
+    finished_at: str = ""
+    lines: List[LyricLine] = field(default_factory=list)
+    
+    # Relógio do início da execução (não persistido)
+    started_clock: Optional[float] = field(default=None, repr=False, compare=False)
+    
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    
+    @property
+    def name(self) -> str:
+        """Nome do arquivo de áudio."""
+        return os.path.basename(self.audio_path)
+    
+    @property
+    def is_finished(self) -> bool:
+        """Indica se o job não vai mais rodar (concluído, com erro ou cancelado)."""
+        return self.status in (self.DONE, self.FAILED, self.CANCELLED)
+    
+    def to_project(self) -> SyncProject:
+        """Cria um projeto com o resultado da transcrição."""
+        return SyncProject(
+            audio_path=self.audio_path,
+            language=self.language,
+            model_size=self.model_size,
+            lines=[LyricLine.from_dict(line.to_dict()) for line in self.lines],
+            preset=self.preset
+        )
+    
+    def to_dict(self) -> dict:
+        """Converte para dicionário."""
+        return {
+            "id": self.id,
+            "audio_path": self.audio_path,
+            "language": self.language,
+            "model_size": self.model_size,
+            "preset": self.preset,
+            "priority": self.priority,
+            "sequence": self.sequence,
+            "status": self.status,
+            "progress": self.progress,
+            "duration": self.duration,
+            "error": self.error,
+            "finished_at": self.finished_at,
+            "lines": [line.to_dict() for line in self.lines]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TranscriptionJob':
+        """Cria instância a partir de dicionário."""
+        return cls(
+            audio_path=data.get("audio_path", ""),
+            language=data.get("language", "pt"),
+            model_size=data.get("model_size", "base"),
+            preset=data.get("preset", "balanced"),
+            priority=int(data.get("priority", 0)),
+            id=data.get("id") or uuid.uuid4().hex[:12],
+            sequence=int(data.get("sequence", 0)),
+            status=data.get("status", cls.PENDING),
+            progress=float(data.get("progress", 0.0)),
+            duration=data.get("duration"),
+            error=data.get("error", ""),
+            finished_at=data.get("finished_at", ""),
+            lines=[LyricLine.from_dict(line) for line in data.get("lines", [])]
+        )
+
+
+class JobQueue:
+    """
+    Fila persistente de transcrições.
+    
+    Os jobs rodam um de cada vez (``process``), do de maior prioridade para
+    o de menor e, com a mesma prioridade, na ordem de chegada. A fila é
+    salva em JSON a cada mudança de estado; jobs interrompidos pelo
+    encerramento do aplicativo voltam a pendentes na próxima abertura.
+    
+    O worker e a interface usam a fila ao mesmo tempo: as alterações são
+    feitas sob ``_lock``.
+    """
+    
+    def __init__(self, path: str = JOB_QUEUE_PATH):
+        self.path = path
+        self.jobs: List[TranscriptionJob] = []
+        self._lock = threading.RLock()
+        self._cancel_requested = set()
+        self._interrupted = False
+        self.load()
+    
+    def load(self) -> None:
+        """Lê a fila salva (arquivo ausente ou inválido = fila vazia)."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        jobs = []
+        for item in data.get("jobs", []) if isinstance(data, dict) else []:
+            try:
+                job = TranscriptionJob.from_dict(item)
+            except (TypeError, ValueError, AttributeError):
+                continue
+            if job.status == job.RUNNING:
+                # Interrompido no meio: recomeça
+                job.status = job.PENDING
+                job.progress = 0.0
+            jobs.append(job)
+        self.jobs = jobs
+    
+    def save(self) -> None:
+        """Grava a fila no disco."""
+        with self._lock:
+            data = {"jobs": [job.to_dict() for job in self.jobs]}
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with atomic_open(self.path) as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+    
+    def add(self, audio_path: str, language: str = "pt", model_size: str = "base",
+            preset: str = "balanced", priority: int = 0) -> TranscriptionJob:
+        """
+        Adiciona um áudio à fila.
+        
+        Returns:
+            O job criado
+        """
+        with self._lock:
+            job = TranscriptionJob(
+                audio_path=audio_path, language=language, model_size=model_size,
+                preset=preset, priority=priority,
+                sequence=max((job.sequence for job in self.jobs), default=0) + 1,
+                duration=probe_duration(audio_path)
+            )
+            self.jobs.append(job)
+            self.save()
+        return job
+    
+    def get(self, job_id: str) -> Optional[TranscriptionJob]:
+        """Retorna o job pelo id."""
+        return next((job for job in self.jobs if job.id == job_id), None)
+    
+    def remove(self, job_id: str) -> bool:
+        """Remove um job que não está rodando."""
+        with self._lock:
+            job = self.get(job_id)
+            if job is None or job.status == job.RUNNING:
+                return False
+            self.jobs.remove(job)
+            self.save()
+        return True
+    
+    def cancel(self, job_id: str) -> bool:
+        """Cancela um job pendente, ou pede a parada do que está rodando."""
+        with self._lock:
+            job = self.get(job_id)
+            if job is None or job.is_finished:
+                return False
+            if job.status == job.RUNNING:
+                # O worker para no próximo segmento
+                self._cancel_requested.add(job_id)
+            else:
+                job.status = job.CANCELLED
+                self.save()
+        return True
+    
+    def retry(self, job_id: str) -> bool:
+        """Volta para a fila um job com erro ou cancelado."""
+        with self._lock:
+            job = self.get(job_id)
+            if job is None or job.status not in (job.FAILED, job.CANCELLED):
+                return False
+            job.status = job.PENDING
+            job.progress = 0.0
+            job.error = ""
+            self.save()
+        return True
+    
+    def set_priority(self, job_id: str, priority: int) -> bool:
+        """Altera a prioridade de um job."""
+        with self._lock:
+            job = self.get(job_id)
+            if job is None:
+                return False
+            job.priority = priority
+            self.save()
+        return True
+    
+    def ordered(self) -> List[TranscriptionJob]:
+        """Jobs na ordem de execução: rodando, pendentes e depois os encerrados."""
+        rank = {TranscriptionJob.RUNNING: 0, TranscriptionJob.PENDING: 1}
+        return sorted(self.jobs, key=lambda job: (
+            rank.get(job.status, 2),
+            -job.priority if not job.is_finished else 0,
+            job.sequence
+        ))
+    
+    def next_job(self) -> Optional[TranscriptionJob]:
+        """Próximo job pendente, ou None se não há."""
+        with self._lock:
+            return next((job for job in self.ordered() if job.status == job.PENDING), None)
+    
+    def claim(self, prefer: Optional[Callable[[TranscriptionJob], bool]] = None
+              ) -> Optional[TranscriptionJob]:
+        """
+        Retira o próximo job pendente, já marcado como rodando, para que
+        vários workers não peguem o mesmo job.
+        
+        Args:
+            prefer: Entre os pendentes de maior prioridade, escolhe o primeiro
+                aceito por ``prefer`` (ex.: mesmo modelo já carregado no worker)
+        
+        Returns:
+            O job, ou None se não há pendentes
+        """
+        with self._lock:
+            pending = [job for job in self.ordered() if job.status == job.PENDING]
+            if not pending:
+                return None
+            job = pending[0]
+            if prefer is not None:
+                job = next((candidate for candidate in pending
+                            if candidate.priority == job.priority and prefer(candidate)), job)
+            job.status = job.RUNNING
+            return job
+    
+    def has_pending(self) -> bool:
+        """Indica se há jobs esperando para rodar."""
+        return any(job.status == job.PENDING for job in self.jobs)
+    
+    def interrupt(self) -> None:
+        """
+        Para o job em andamento no próximo segmento sem cancelá-lo: ele
+        volta a pendente (usado ao fechar o aplicativo).
+        """
+        self._interrupted = True
+    
+    def process(self, job: TranscriptionJob, transcriber,
+                on_progress: Optional[Callable[[TranscriptionJob], None]] = None) -> None:
+        """
+        Transcreve um job, atualizando estado, progresso e resultado.
+        
+        Args:
+            job: Job pendente (ver ``next_job``)
+            transcriber: Instância de ``Transcriber``; o modelo carregado é
+                reaproveitado entre jobs com a mesma configuração
+            on_progress: Chamado ao iniciar e a cada segmento transcrito
+        """
+        with self._lock:
+            job.status = job.RUNNING
+            job.progress = 0.0
+            job.error = ""
+            job.started_clock = time.monotonic()
+            self.save()
+        if on_progress:
+            on_progress(job)
+        
+        def progress(fraction: float) -> None:
+            if self._interrupted or job.id in self._cancel_requested:
+                raise TranscriptionCancelled()
+            job.progress = fraction
+            if on_progress:
+                on_progress(job)
+        
+        try:
+            if not transcriber.load_model(job.model_size, job.preset):
+                raise RuntimeError(f"Falha ao carregar modelo {job.model_size}")
+            if job.duration is None:
+                job.duration = probe_duration(job.audio_path)
+            lines = transcriber.transcribe(
+                job.audio_path, job.language, job.model_size, job.preset, progress=progress
+            )
+            if job.duration is None:
+                # Formato sem duração no cabeçalho: o áudio já foi decodificado
+                # pela transcrição e ``load_audio`` devolve o que está em memória
+                job.duration = len(transcriber.load_audio(job.audio_path)) / SAMPLE_RATE
+        except TranscriptionCancelled:
+            job.status = job.PENDING if self._interrupted else job.CANCELLED
+            job.progress = 0.0
+        except Exception as e:
+            job.status = job.FAILED
+            job.error = str(e)
+        else:
+            job.lines = lines
+            job.status = job.DONE
+            job.progress = 1.0
+        finally:
+            with self._lock:
+                if job.is_finished:
+                    job.finished_at = datetime.now().isoformat(timespec="seconds")
+                job.started_clock = None
+                self._cancel_requested.discard(job.id)
+                self.save()
+    
+    def remaining_times(self, predict: Callable[[TranscriptionJob], Optional[float]]
+                        ) -> Dict[str, Optional[float]]:
+        """
+        Tempo até cada job não encerrado terminar, somando os que rodam antes.
+        
+        Args:
+            predict: Duração prevista de um job inteiro (RTF medido x duração
+                do áudio), ou None sem medição
+        
+        Returns:
+            Segundos por id de job; None quando algum job à frente não tem
+            previsão
+        """
+        result = {}
+        total = 0.0
+        known = True
+        for job in self.ordered():
+            if job.is_finished:
+                continue
+            
+            remaining = predict(job)
+            if job.status == job.RUNNING:
+                if remaining is not None:
+                    remaining *= 1.0 - job.progress
+                elif job.progress > 0 and job.started_clock is not None:
+                    # Sem medição: extrapolar o ritmo do próprio job
+                    elapsed = time.monotonic() - job.started_clock
+                    remaining = elapsed * (1.0 - job.progress) / job.progress
+            
+            if remaining is None:
+                known = False
+            else:
+                total += remaining
+            result[job.id] = total if known else None
+        return result
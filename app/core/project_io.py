@@ -282,6 +282,7 @@ class ProjectIO:
                 "audio_path": project_data.get("audio_path", ""),
                 "language": project_data.get("language", "pt"),
                 "model_size": project_data.get("model_size", "base"),
+                "preset": project_data.get("preset", "balanced"),
                 "lines_count": len(project_data.get("lines", [])),
                 "file_size": os.path.getsize(file_path),
                 "is_autosave": data.get("is_autosave", False)
@@ -308,6 +309,7 @@ class ProjectIO:
                 f.write(f"Arquivo de áudio: {project.audio_path}\n")
                 f.write(f"Idioma: {project.language}\n")
                 f.write(f"Modelo: {project.model_size}\n")
+                f.write(f"Preset: {project.preset}\n")
                 f.write(f"Total de linhas: {len(project.lines)}\n")
                 f.write(f"Linhas não vazias: {len(project.get_non_empty_lines())}\n\n")
                 
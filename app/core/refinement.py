@@ -0,0 +1,102 @@
+"""
+Módulo de refinamento do rascunho: troca as linhas de uma transcrição
+rápida pelas de um modelo maior, sem mexer no que o usuário editou.
+"""
+from typing import List, Tuple
+
+from app.core.sync_model import LyricLine, SyncProject
+
+
+class DraftRefinement:
+    """
+    Refinamento em segundo plano de uma transcrição rascunho.
+    
+    Guarda as linhas do rascunho como foram entregues. O áudio é dividido em
+    trechos (``spans``), cortados nas pausas entre linhas do rascunho, que o
+    modelo maior retranscreve um a um; cada trecho refinado é encaixado com
+    ``merge``. Uma linha só é substituída se continua idêntica ao rascunho:
+    linhas editadas, divididas ou criadas pelo usuário ficam, e o texto
+    refinado que cairia sobre elas ou sobre linhas removidas é descartado.
+    """
+    
+    # Duração aproximada de cada trecho refinado
+    CHUNK_SECONDS = 60.0
+    
+    def __init__(self, draft_lines: List[LyricLine]):
+        """
+        Args:
+            draft_lines: Linhas do rascunho, os mesmos objetos postos no projeto
+        """
+        self._draft = {id(line): (line, line.start, line.end, line.text) for line in draft_lines}
+    
+    def is_untouched(self, line: LyricLine) -> bool:
+        """Indica se a linha é do rascunho e não foi alterada."""
+        entry = self._draft.get(id(line))
+        return entry is not None and entry[0] is line and entry[1:] == (line.start, line.end, line.text)
+    
+    def spans(self, duration: float) -> List[Tuple[float, float]]:
+        """
+        Divide [0, duration] em trechos de ~``CHUNK_SECONDS``, cortando no
+        meio das pausas entre linhas do rascunho.
+        
+        Returns:
+            Lista de (início, fim) cobrindo o áudio inteiro
+        """
+        lines = sorted((entry[0] for entry in self._draft.values()), key=lambda line: line.start)
+        result = []
+        start = 0.0
+        for line, following in zip(lines, lines[1:]):
+            if line.end - start >= self.CHUNK_SECONDS:
+                cut = (line.end + max(following.start, line.end)) / 2
+                if start < cut < duration:
+                    result.append((start, cut))
+                    start = cut
+        if start < duration or not result:
+            result.append((start, duration))
+        return result
+    
+    def merge(self, project: SyncProject, start: float, end: float,
+              refined: List[LyricLine]) -> int:
+        """
+        Encaixa as linhas refinadas do trecho [start, end) no projeto.
+        
+        Args:
+            project: Projeto com as linhas atuais
+            start: Início do trecho refinado
+            end: Fim do trecho refinado
+            refined: Linhas transcritas pelo modelo maior nesse trecho
+        
+        Returns:
+            Quantidade de linhas refinadas inseridas
+        """
+        def middle(line_start: float, line_end: float) -> float:
+            return (line_start + line_end) / 2
+        
+        def inside(line: LyricLine) -> bool:
+            return start <= middle(line.start, line.end) < end
+        
+        present = {id(line) for line in project.lines}
+        kept = [line for line in project.lines if not (inside(line) and self.is_untouched(line))]
+        
+        # Regiões do usuário: linhas alteradas e linhas do rascunho removidas
+        blocked = [(line.start, line.end) for line in kept if inside(line)]
+        blocked += [(line_start, line_end) for line, line_start, line_end, _ in self._draft.values()
+                    if id(line) not in present and start <= middle(line_start, line_end) < end]
+        
+        new_lines = []
+        for line in sorted(refined, key=lambda line: line.start):
+            center = middle(line.start, line.end)
+            if any(block_start <= center <= block_end for block_start, block_end in blocked):
+                continue
+            
+            # Não sobrepor as linhas mantidas vizinhas
+            for other in kept:
+                if middle(other.start, other.end) <= center:
+                    line.start = max(line.start, other.end)
+                else:
+                    line.end = min(line.end, other.start)
+            if line.end > line.start:
+                new_lines.append(line)
+        
+        project.lines[:] = sorted(kept + new_lines, key=lambda line: line.start)
+        return len(new_lines)
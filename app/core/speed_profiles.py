@@ -0,0 +1,113 @@
+"""
+Módulo de perfis de velocidade dos modelos: fatores de tempo real medidos
+nesta máquina, usados para prever a duração das transcrições.
+"""
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from app.config import SPEED_PROFILES_PATH
+from app.core.fileio import atomic_open
+
+
+def format_duration(seconds: float) -> str:
+    """Formata uma duração prevista (ex.: "~3 min 20 s")."""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"~{seconds} s"
+    return f"~{seconds // 60} min {seconds % 60:02d} s"
+
+
+class SpeedProfiles:
+    """
+    Fatores de tempo real (RTF: segundos de processamento por segundo de
+    áudio) por dispositivo, ``compute_type`` e preset, persistidos em JSON.
+    
+    Os perfis são medidos por ``Transcriber.calibrate`` em um clipe curto;
+    sem medição não há previsão.
+    """
+    
+    def __init__(self, path: str = SPEED_PROFILES_PATH):
+        self.path = path
+        self.profiles: Dict[str, Dict[str, dict]] = {}
+        self.load()
+    
+    @staticmethod
+    def key(device: str, compute_type: str, preset: str) -> str:
+        """Chave de um conjunto de medições."""
+        return f"{device}/{compute_type}/{preset}"
+    
+    def load(self) -> None:
+        """Lê os perfis salvos (arquivo ausente ou inválido = sem perfis)."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self.profiles = {key: value for key, value in data.items() if isinstance(value, dict)}
+    
+    def save(self) -> None:
+        """Grava os perfis no disco."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with atomic_open(self.path) as f:
+            json.dump(self.profiles, f, indent=2)
+    
+    def record(self, device: str, compute_type: str, preset: str,
+               model_size: str, rtf: float) -> None:
+        """Registra o RTF medido de um modelo (sem salvar)."""
+        self.profiles.setdefault(self.key(device, compute_type, preset), {})[model_size] = {
+            "rtf": rtf,
+            "measured": datetime.now().isoformat(timespec="seconds")
+        }
+    
+    def get_rtf(self, device: str, compute_type: str, preset: str,
+                model_size: str) -> Optional[float]:
+        """Retorna o RTF medido, ou None se o modelo não foi calibrado."""
+        entry = self.profiles.get(self.key(device, compute_type, preset), {}).get(model_size)
+        if not isinstance(entry, dict):
+            return None
+        try:
+            return float(entry["rtf"])
+        except (KeyError, TypeError, ValueError):
+            return None
+    
+    def predict_duration(self, device: str, compute_type: str, preset: str,
+                         model_size: str, audio_duration: float) -> Optional[float]:
+        """
+        Prevê quanto tempo a transcrição vai levar.
+        
+        Returns:
+            Duração prevista em segundos, ou None sem medição
+        """
+        rtf = self.get_rtf(device, compute_type, preset, model_size)
+        return rtf * audio_duration if rtf is not None else None
+    
+    def choose_model(self, device: str, compute_type: str, preset: str,
+                     models: Iterable[str], audio_duration: float,
+                     deadline: float) -> Optional[str]:
+        """
+        Escolhe o modelo para um prazo.
+        
+        Args:
+            models: Modelos em ordem crescente de qualidade
+            audio_duration: Duração do áudio em segundos
+            deadline: Tempo disponível em segundos
+        
+        Returns:
+            O modelo de maior qualidade cuja previsão cabe no prazo; se nenhum
+            cabe, o mais rápido medido. None se nenhum modelo foi calibrado.
+        """
+        best = None
+        fastest = None
+        fastest_duration = None
+        for model_size in models:
+            duration = self.predict_duration(device, compute_type, preset, model_size, audio_duration)
+            if duration is None:
+                continue
+            if duration <= deadline:
+                best = model_size
+            if fastest_duration is None or duration < fastest_duration:
+                fastest, fastest_duration = model_size, duration
+        return best or fastest
@@ -2,16 +2,42 @@
 Modelo de dados para sincronização de letras com timestamps.
 """
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import json
 
 
+@dataclass
+class WordTiming:
+    """Tempo de uma palavra dentro de uma linha (ex.: alinhamento forçado)."""
+    start: float = 0.0
+    end: float = 0.0
+    text: str = ""
+    
+    def to_dict(self) -> dict:
+        """Converte para dicionário."""
+        return {
+            "start": self.start,
+            "end": self.end,
+            "text": self.text
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'WordTiming':
+        """Cria instância a partir de dicionário."""
+        return cls(
+            start=data.get("start", 0.0),
+            end=data.get("end", 0.0),
+            text=data.get("text", "")
+        )
+
+
 @dataclass
 class LyricLine:
     """Representa uma linha de letra com timestamps de início e fim."""
     start: float = 0.0
     end: float = 0.0
     text: str = ""
+    words: List[WordTiming] = field(default_factory=list)
     
     def __post_init__(self):
         """Validação básica após inicialização."""
@@ -22,11 +48,15 @@ class LyricLine:
     
     def to_dict(self) -> dict:
         """Converte para dicionário."""
-        return {
+        data = {
             "start": self.start,
             "end": self.end,
             "text": self.text
         }
+        # Tempos por palavra só quando existem
+        if self.words:
+            data["words"] = [word.to_dict() for word in self.words]
+        return data
     
     @classmethod
     def from_dict(cls, data: dict) -> 'LyricLine':
@@ -34,7 +64,8 @@ class LyricLine:
         return cls(
             start=data.get("start", 0.0),
             end=data.get("end", 0.0),
-            text=data.get("text", "")
+            text=data.get("text", ""),
+            words=[WordTiming.from_dict(word) for word in data.get("words", [])]
         )
     
     def is_empty(self) -> bool:
@@ -53,6 +84,7 @@ class SyncProject:
     language: str = "pt"
     model_size: str = "base"
     lines: List[LyricLine] = field(default_factory=list)
+    preset: str = "balanced"  # Preset de decodificação da transcrição
     
     def add_line(self, line: LyricLine) -> None:
         """Adiciona uma linha ao projeto."""
@@ -102,6 +134,36 @@ class SyncProject:
             # Remover próxima linha
             self.remove_line(index + 1)
     
+    def replace_range(self, start: float, end: float,
+                      new_lines: List[LyricLine]) -> Tuple[int, int]:
+        """
+        Substitui as linhas do trecho [start, end] por ``new_lines``.
+        
+        Saem as linhas com o meio dentro do trecho; as vizinhas ficam
+        intactas e as novas linhas são limitadas para não sobrepô-las.
+        
+        Returns:
+            (índice da primeira linha nova, quantidade de linhas novas)
+        """
+        def inside(line: LyricLine) -> bool:
+            return start <= (line.start + line.end) / 2 <= end
+        
+        kept = [line for line in self.lines if not inside(line)]
+        index = sum(1 for line in kept if (line.start + line.end) / 2 < start)
+        previous = kept[index - 1] if index > 0 else None
+        following = kept[index] if index < len(kept) else None
+        
+        new_lines = sorted(new_lines, key=lambda line: line.start)
+        for line in new_lines:
+            if previous is not None:
+                line.start = max(line.start, previous.end)
+            if following is not None:
+                line.end = min(line.end, following.start)
+            line.end = max(line.end, line.start)
+        
+        self.lines[:] = kept[:index] + new_lines + kept[index:]
+        return index, len(new_lines)
+    
     def _normalize_times(self) -> None:
         """Garante que os tempos estejam em ordem crescente e sem sobreposição."""
         if not self.lines:
@@ -129,6 +191,7 @@ class SyncProject:
             "audio_path": self.audio_path,
             "language": self.language,
             "model_size": self.model_size,
+            "preset": self.preset,
             "lines": [line.to_dict() for line in self.lines]
         }
     
@@ -140,7 +203,8 @@ class SyncProject:
             audio_path=data.get("audio_path", ""),
             language=data.get("language", "pt"),
             model_size=data.get("model_size", "base"),
-            lines=lines
+            lines=lines,
+            preset=data.get("preset", "balanced")
         )
     
     def to_json(self) -> str:
@@ -4,39 +4,120 @@ Módulo de transcrição usando faster-whisper.
 import os
 import subprocess
 import tempfile
-from typing import List, Optional, Tuple
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
-from faster_whisper import WhisperModel
-from pydub import AudioSegment
+import numpy as np
 
-from app.core.sync_model import LyricLine
+# faster_whisper e pydub são importados no primeiro uso: carregá-los aqui
+# atrasaria a abertura da janela
+
+from app.core.sync_model import LyricLine, WordTiming
+from app.core.alignment import LyricsAligner, SAMPLE_RATE
+from app.core.speed_profiles import SpeedProfiles
+
+
+# Contexto (segundos) de cada lado ao retranscrever um trecho
+RANGE_CONTEXT_PADDING = 5.0
+
+# Duração do clipe usado na calibração de velocidade
+CALIBRATION_CLIP_SECONDS = 30.0
+
+
+class TranscriptionCancelled(Exception):
+    """Levantada pelo callback de progresso para interromper uma transcrição."""
+    pass
+
+
+@lru_cache(maxsize=None)
+def cuda_device_count() -> int:
+    """
+    Número de GPUs CUDA visíveis para o CTranslate2, o backend do
+    faster-whisper. Consultado uma vez por processo, sem importar o torch.
+    """
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count()
+    except Exception:
+        return 0
 
 
 class Transcriber:
     """Classe para transcrição de áudio usando faster-whisper."""
     
-    # Modelos disponíveis com informações de performance
+    # Modelos disponíveis, em ordem crescente de qualidade. A velocidade
+    # depende da máquina: ver ``calibrate`` e ``predict_duration``.
     MODELS = {
-        "tiny": {"size": "39 MB", "speed": "~32x", "quality": "Baixa"},
-        "base": {"size": "74 MB", "speed": "~16x", "quality": "Média"},
-        "small": {"size": "244 MB", "speed": "~6x", "quality": "Boa"},
-        "medium": {"size": "769 MB", "speed": "~2x", "quality": "Muito Boa"},
-        "large-v3": {"size": "1550 MB", "speed": "~1x", "quality": "Excelente"}
+        "tiny": {"size": "39 MB", "quality": "Baixa"},
+        "base": {"size": "74 MB", "quality": "Média"},
+        "small": {"size": "244 MB", "quality": "Boa"},
+        "medium": {"size": "769 MB", "quality": "Muito Boa"},
+        "large-v3": {"size": "1550 MB", "quality": "Excelente"}
+    }
+    
+    # Presets de decodificação (velocidade x precisão). ``compute_type`` por
+    # dispositivo; ``cpu_threads`` 0 usa todos os núcleos.
+    PRESETS = {
+        "draft": {
+            "name": "Rascunho",
+            "beam_size": 1,
+            "best_of": 1,
+            "temperature": (0.0,),
+            "vad_filter": True,
+            "compute_type": {"cpu": "int8", "cuda": "int8_float16"},
+            "cpu_threads": 0
+        },
+        "balanced": {
+            "name": "Equilibrado",
+            "beam_size": 5,
+            "best_of": 5,
+            "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+            "vad_filter": False,
+            "compute_type": {"cpu": "int8", "cuda": "float16"},
+            "cpu_threads": 0
+        },
+        "accurate": {
+            "name": "Preciso",
+            "beam_size": 8,
+            "best_of": 5,
+            "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+            "vad_filter": False,
+            "compute_type": {"cpu": "float32", "cuda": "float16"},
+            "cpu_threads": 0
+        }
     }
+    DEFAULT_PRESET = "balanced"
     
-    def __init__(self):
+    def __init__(self, cpu_threads: int = 0):
+        """
+        Args:
+            cpu_threads: Threads por modelo quando o preset não fixa (0 usa
+                todos os núcleos; o servidor divide os núcleos entre workers)
+        """
         self.model = None
+        self.cpu_threads = cpu_threads
         self.current_model_size = None
+        # (modelo, compute_type, threads) do modelo carregado
+        self._model_key: Optional[Tuple[str, str, int]] = None
+        # Pré-carregamento e transcrição podem pedir o modelo ao mesmo tempo
+        self._model_lock = threading.Lock()
+        # Modelo que cada thread carregou por último: a transcrição usa o
+        # modelo que pediu mesmo que outra thread troque ``self.model`` depois
+        self._thread_models = threading.local()
         self.device = "cuda" if self._check_cuda() else "cpu"
+        
+        # Último áudio decodificado (caminho, amostras mono a 16 kHz)
+        self._audio: Optional[Tuple[str, np.ndarray]] = None
+        
+        # Fatores de tempo real medidos nesta máquina
+        self.speed_profiles = SpeedProfiles()
     
     def _check_cuda(self) -> bool:
         """Verifica se CUDA está disponível."""
-        try:
-            import torch
-            return torch.cuda.is_available()
-        except ImportError:
-            return False
+        return cuda_device_count() > 0
     
     def _check_ffmpeg(self) -> bool:
         """Verifica se FFmpeg está instalado."""
@@ -65,21 +146,62 @@ sudo apt install ffmpeg  # Ubuntu/Debian
 sudo yum install ffmpeg  # CentOS/RHEL
         """.strip()
     
-    def load_model(self, model_size: str = "base") -> bool:
-        """Carrega o modelo do Whisper."""
+    def get_preset(self, preset: str) -> dict:
+        """Retorna as opções de um preset (o padrão se o nome for desconhecido)."""
+        return self.PRESETS.get(preset, self.PRESETS[self.DEFAULT_PRESET])
+    
+    def get_compute_type(self, preset: str = DEFAULT_PRESET) -> str:
+        """Tipo de computação do preset no dispositivo atual."""
+        return self.get_preset(preset)["compute_type"][self.device]
+    
+    def load_model(self, model_size: str = "base", preset: str = DEFAULT_PRESET) -> bool:
+        """
+        Carrega o modelo do Whisper com o ``compute_type`` e as threads do
+        preset; recarrega só se algum dos dois mudar.
+        
+        Chamadas simultâneas esperam o carregamento em andamento, então uma
+        transcrição que pede o modelo sendo pré-carregado não o carrega de novo.
+        O modelo fica associado à thread que o pediu: ``transcribe`` e ``align``
+        nessa thread usam ele mesmo que outra thread carregue outro depois.
+        """
+        options = self.get_preset(preset)
+        compute_type = self.get_compute_type(preset)
+        cpu_threads = options["cpu_threads"] or self.cpu_threads or os.cpu_count() or 0
+        key = (model_size, compute_type, cpu_threads)
         try:
-            if self.current_model_size != model_size:
-                self.model = WhisperModel(
-                    model_size, 
-                    device=self.device,
-                    compute_type="float16" if self.device == "cuda" else "int8"
-                )
-                self.current_model_size = model_size
+            with self._model_lock:
+                if self._model_key != key:
+                    from faster_whisper import WhisperModel
+                    
+                    self.model = WhisperModel(
+                        model_size, 
+                        device=self.device,
+                        compute_type=compute_type,
+                        cpu_threads=cpu_threads
+                    )
+                    self.current_model_size = model_size
+                    self._model_key = key
+                self._thread_models.model = self.model
             return True
         except Exception as e:
             print(f"Erro ao carregar modelo: {e}")
             return False
     
+    def _loaded_model(self):
+        """Modelo carregado por esta thread (``self.model`` se ela não carregou)."""
+        return getattr(self._thread_models, "model", None) or self.model
+    
+    def is_model_loaded(self, model_size: str, preset: str = DEFAULT_PRESET) -> bool:
+        """Indica se o modelo já está carregado com a configuração do preset."""
+        return self._model_key is not None and self._model_key[:2] == (
+            model_size, self.get_compute_type(preset)
+        )
+    
+    def share_audio(self, other: 'Transcriber') -> None:
+        """Reaproveita o áudio já decodificado por outro transcritor."""
+        if other._audio is not None:
+            self._audio = other._audio
+    
     def convert_to_wav(self, audio_path: str) -> str:
         """Converte áudio para WAV se necessário."""
         audio_path = Path(audio_path)
@@ -98,6 +220,7 @@ sudo yum install ffmpeg  # CentOS/RHEL
         
         try:
             # Carregar com pydub e converter
+            from pydub import AudioSegment
             audio = AudioSegment.from_file(str(audio_path))
             audio.export(str(wav_path), format="wav")
             return str(wav_path)
@@ -105,69 +228,303 @@ sudo yum install ffmpeg  # CentOS/RHEL
             raise RuntimeError(f"Erro ao converter áudio: {e}")
     
     def transcribe(self, audio_path: str, language: str = "pt", 
-                   model_size: str = "base") -> List[LyricLine]:
+                   model_size: str = "base", preset: str = DEFAULT_PRESET,
+                   progress: Optional[Callable[[float], None]] = None) -> List[LyricLine]:
         """
         Transcreve o áudio e retorna lista de linhas com timestamps.
         
+        O áudio decodificado fica em memória (``load_audio``), e retranscrever
+        um trecho depois (``transcribe_range``) não decodifica de novo.
+        
         Args:
             audio_path: Caminho para o arquivo de áudio
             language: Código do idioma (ex: "pt", "en", "es")
             model_size: Tamanho do modelo ("tiny", "base", "small", "medium", "large-v3")
+            preset: Preset de decodificação ("draft", "balanced", "accurate")
+            progress: Chamado a cada segmento com a fração do áudio já
+                transcrita (fim do segmento / duração); pode levantar
+                ``TranscriptionCancelled`` para interromper
         
         Returns:
             Lista de LyricLine com timestamps e texto transcrito
         """
-        # Verificar se FFmpeg está disponível
-        if not self._check_ffmpeg():
-            raise RuntimeError("FFmpeg não encontrado. " + self.get_ffmpeg_instructions())
+        # Carregar modelo se necessário
+        if not self.load_model(model_size, preset):
+            raise RuntimeError(f"Falha ao carregar modelo {model_size}")
+        
+        audio = self.load_audio(audio_path)
+        return self._transcribe_audio(audio, language, preset, progress=progress)
+    
+    def transcribe_range(self, audio_path: str, start: float, end: float,
+                         language: str = "pt", model_size: str = "base",
+                         preset: str = DEFAULT_PRESET,
+                         padding: float = RANGE_CONTEXT_PADDING) -> List[LyricLine]:
+        """
+        Transcreve só o trecho [start, end] do áudio em memória.
+        
+        O modelo recebe ``padding`` segundos de contexto de cada lado, mas
+        só as palavras cujo meio cai dentro do trecho entram no resultado.
         
-        # Converter para WAV se necessário
-        wav_path = self.convert_to_wav(audio_path)
+        Args:
+            audio_path: Caminho para o arquivo de áudio
+            start: Início do trecho em segundos
+            end: Fim do trecho em segundos
+            language: Código do idioma
+            model_size: Tamanho do modelo
+            preset: Preset de decodificação
+            padding: Contexto extra de cada lado, em segundos
         
+        Returns:
+            Linhas do trecho, com tempos absolutos dentro de [start, end]
+        """
+        if end <= start:
+            return []
+        
+        if not self.load_model(model_size, preset):
+            raise RuntimeError(f"Falha ao carregar modelo {model_size}")
+        
+        audio = self.load_audio(audio_path)
+        clip_start = max(0.0, start - padding)
+        clip_end = min(len(audio) / SAMPLE_RATE, end + padding)
+        clip = audio[int(clip_start * SAMPLE_RATE):int(clip_end * SAMPLE_RATE)]
+        return self._transcribe_audio(clip, language, preset, clip_start, (start, end))
+    
+    def _transcribe_audio(self, audio: np.ndarray, language: str, preset: str,
+                          offset: float = 0.0,
+                          limits: Optional[Tuple[float, float]] = None,
+                          progress: Optional[Callable[[float], None]] = None) -> List[LyricLine]:
+        """Transcreve amostras com o modelo carregado (ver ``_segments_to_lines``)."""
         try:
-            # Carregar modelo se necessário
-            if not self.load_model(model_size):
-                raise RuntimeError(f"Falha ao carregar modelo {model_size}")
-            
-            # Transcrever
-            segments, info = self.model.transcribe(
-                wav_path,
+            segments, info = self._loaded_model().transcribe(
+                audio,
                 language=language,
-                beam_size=5,
-                word_timestamps=True
+                word_timestamps=True,
+                **self._decode_options(preset)
             )
+            if progress is not None:
+                segments = self._report_progress(segments, len(audio) / SAMPLE_RATE, progress)
+            return self._segments_to_lines(segments, offset, limits)
             
-            # Converter segmentos para LyricLine
-            lines = []
-            for segment in segments:
-                if segment.text.strip():  # Ignorar segmentos vazios
-                    # Garantir que os tempos são válidos
-                    start_time = float(segment.start) if segment.start is not None else 0.0
-                    end_time = float(segment.end) if segment.end is not None else max(start_time + 0.5, start_time)
-                    
-                    line = LyricLine(
-                        start=start_time,
-                        end=end_time,
-                        text=segment.text.strip()
-                    )
-                    lines.append(line)
+        except TranscriptionCancelled:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Erro na transcrição: {e}")
+    
+    @staticmethod
+    def _report_progress(segments, duration: float, progress: Callable[[float], None]):
+        """Repassa os segmentos (gerados sob demanda) informando o progresso."""
+        progress(0.0)
+        for segment in segments:
+            yield segment
+            if duration > 0 and segment.end is not None:
+                progress(min(float(segment.end) / duration, 1.0))
+    
+    def _decode_options(self, preset: str) -> dict:
+        """Opções do preset repassadas a ``WhisperModel.transcribe``."""
+        options = self.get_preset(preset)
+        return {
+            "beam_size": options["beam_size"],
+            "best_of": options["best_of"],
+            "temperature": list(options["temperature"]),
+            "vad_filter": options["vad_filter"]
+        }
+    
+    def _segments_to_lines(self, segments, offset: float = 0.0,
+                           limits: Optional[Tuple[float, float]] = None) -> List[LyricLine]:
+        """
+        Converte segmentos do faster-whisper em linhas.
+        
+        Args:
+            segments: Segmentos retornados por ``WhisperModel.transcribe``
+            offset: Somado aos tempos (início do trecho transcrito)
+            limits: (início, fim) absolutos; palavras fora ficam de fora
+        
+        Returns:
+            Lista de LyricLine
+        """
+        lines = []
+        for segment in segments:
+            if not segment.text.strip():  # Ignorar segmentos vazios
+                continue
             
-            return lines
+            words = [
+                (word.word, WordTiming(start=offset + float(word.start),
+                                       end=offset + float(word.end), text=word.word.strip()))
+                for word in (segment.words or []) if word.word.strip()
+            ]
             
+            if limits is not None:
+                # Contexto: manter só as palavras com o meio dentro do trecho
+                words = [(raw, word) for raw, word in words
+                         if limits[0] <= (word.start + word.end) / 2 < limits[1]]
+                if not words:
+                    continue
+                lines.append(LyricLine(
+                    start=max(words[0][1].start, limits[0]),
+                    end=min(words[-1][1].end, limits[1]),
+                    text="".join(raw for raw, _ in words).strip(),
+                    words=[word for _, word in words]
+                ))
+                continue
+            
+            # Garantir que os tempos são válidos
+            start_time = offset + float(segment.start) if segment.start is not None else offset
+            end_time = offset + float(segment.end) if segment.end is not None else start_time + 0.5
+            
+            lines.append(LyricLine(
+                start=start_time,
+                end=end_time,
+                text=segment.text.strip(),
+                words=[word for _, word in words]
+            ))
+        
+        return lines
+    
+    def load_audio(self, audio_path: str) -> np.ndarray:
+        """
+        Decodifica o áudio em mono a 16 kHz, mantendo em memória o último
+        arquivo para alinhamentos e retranscrições seguintes.
+        
+        Args:
+            audio_path: Caminho para o arquivo de áudio
+        
+        Returns:
+            Amostras float32
+        """
+        if self._audio is not None and self._audio[0] == audio_path:
+            return self._audio[1]
+        
+        from faster_whisper.audio import decode_audio
+        try:
+            audio = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
         except Exception as e:
-            raise RuntimeError(f"Erro na transcrição: {e}")
+            raise RuntimeError(f"Erro ao decodificar áudio: {e}")
         
-        finally:
-            # Limpar arquivo temporário se foi criado
-            if wav_path != audio_path and os.path.exists(wav_path):
-                try:
-                    os.unlink(wav_path)
-                except:
-                    pass
+        self._audio = (audio_path, audio)
+        return audio
     
-    def get_model_info(self, model_size: str) -> dict:
-        """Retorna informações sobre um modelo."""
-        return self.MODELS.get(model_size, {})
+    def align(self, audio_path: str, lines: List[LyricLine], language: str = "pt",
+              model_size: str = "base",
+              progress: Optional[Callable[[float], None]] = None) -> List[LyricLine]:
+        """
+        Alinha uma letra conhecida ao áudio (alinhamento forçado), sem
+        transcrever: bem mais rápido que ``transcribe`` e sem alterar o texto.
+        
+        Args:
+            audio_path: Caminho para o arquivo de áudio
+            lines: Linhas da letra, na ordem cantada
+            language: Código do idioma
+            model_size: Tamanho do modelo
+            progress: Chamado com a fração do áudio já percorrida
+        
+        Returns:
+            Cópias das linhas com tempos de linha e de palavra
+        """
+        if not self.load_model(model_size):
+            raise RuntimeError(f"Falha ao carregar modelo {model_size}")
+        
+        audio = self.load_audio(audio_path)
+        try:
+            return LyricsAligner(self._loaded_model(), language).align(audio, lines, progress)
+        except Exception as e:
+            raise RuntimeError(f"Erro no alinhamento: {e}")
+    
+    def is_model_installed(self, model_size: str) -> bool:
+        """Indica se o modelo já foi baixado (carrega sem rede)."""
+        from faster_whisper.utils import download_model
+        
+        try:
+            download_model(model_size, local_files_only=True)
+            return True
+        except Exception:
+            return False
+    
+    def get_installed_models(self) -> List[str]:
+        """Retorna os modelos já baixados (disponíveis sem rede)."""
+        return [model_size for model_size in self.MODELS if self.is_model_installed(model_size)]
+    
+    def calibrate(self, audio_path: str, models: Optional[List[str]] = None,
+                  preset: str = DEFAULT_PRESET, language: str = "pt",
+                  clip_seconds: float = CALIBRATION_CLIP_SECONDS,
+                  progress: Optional[Callable[[str, float], None]] = None) -> Dict[str, float]:
+        """
+        Mede o fator de tempo real de cada modelo transcrevendo o início de
+        ``audio_path`` e salva o resultado nos perfis de velocidade.
+        
+        Args:
+            audio_path: Áudio de referência (só os primeiros segundos são usados)
+            models: Modelos a medir (os instalados se omitido)
+            preset: Preset de decodificação medido
+            language: Código do idioma
+            clip_seconds: Duração do clipe de referência
+            progress: Chamado com (modelo, RTF) a cada medição
+        
+        Returns:
+            RTF por modelo
+        """
+        clip = self.load_audio(audio_path)[:int(clip_seconds * SAMPLE_RATE)]
+        duration = len(clip) / SAMPLE_RATE
+        if not duration:
+            raise RuntimeError("Áudio de referência vazio")
+        
+        compute_type = self.get_compute_type(preset)
+        results = {}
+        for model_size in models if models is not None else self.get_installed_models():
+            if not self.load_model(model_size, preset):
+                continue
+            
+            # Só a transcrição é cronometrada, não o carregamento
+            started = time.perf_counter()
+            self._transcribe_audio(clip, language, preset)
+            rtf = (time.perf_counter() - started) / duration
+            
+            self.speed_profiles.record(self.device, compute_type, preset, model_size, rtf)
+            results[model_size] = rtf
+            if progress:
+                progress(model_size, rtf)
+        
+        self.speed_profiles.save()
+        return results
+    
+    def predict_duration(self, model_size: str, audio_duration: float,
+                         preset: str = DEFAULT_PRESET) -> Optional[float]:
+        """
+        Prevê a duração da transcrição pelos perfis medidos.
+        
+        Returns:
+            Segundos previstos, ou None se o modelo não foi calibrado
+        """
+        return self.speed_profiles.predict_duration(
+            self.device, self.get_compute_type(preset), preset, model_size, audio_duration
+        )
+    
+    def choose_model(self, audio_duration: float, deadline: float,
+                     preset: str = DEFAULT_PRESET) -> Optional[str]:
+        """
+        Escolhe o modelo de maior qualidade que termina dentro do prazo
+        (ou o mais rápido, se nenhum cabe), pelos perfis medidos.
+        
+        Args:
+            audio_duration: Duração do áudio em segundos
+            deadline: Tempo disponível em segundos
+            preset: Preset de decodificação
+        
+        Returns:
+            Tamanho do modelo, ou None se nada foi calibrado
+        """
+        return self.speed_profiles.choose_model(
+            self.device, self.get_compute_type(preset), preset,
+            self.MODELS, audio_duration, deadline
+        )
+    
+    def get_model_info(self, model_size: str, preset: str = DEFAULT_PRESET) -> dict:
+        """Retorna informações sobre um modelo, com o RTF medido (ou None)."""
+        info = dict(self.MODELS.get(model_size, {}))
+        if info:
+            info["rtf"] = self.speed_profiles.get_rtf(
+                self.device, self.get_compute_type(preset), preset, model_size
+            )
+        return info
     
     def get_available_models(self) -> List[str]:
         """Retorna lista de modelos disponíveis."""
@@ -176,11 +533,7 @@ sudo yum install ffmpeg  # CentOS/RHEL
     def get_device_info(self) -> str:
         """Retorna informações sobre o dispositivo de processamento."""
         if self.device == "cuda":
-            try:
-                import torch
-                gpu_name = torch.cuda.get_device_name(0)
-                return f"GPU: {gpu_name}"
-            except:
-                return "GPU: CUDA disponível"
+            count = cuda_device_count()
+            return f"GPU: CUDA disponível ({count} {'dispositivo' if count == 1 else 'dispositivos'})"
         else:
             return "CPU: Processamento em CPU (mais lento)"
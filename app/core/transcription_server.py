@@ -0,0 +1,413 @@
+"""
+Módulo do servidor de transcrição: uma máquina com bastante CPU atende
+vários editores por uma API HTTP/JSON simples.
+
+Rotas:
+    GET    /health                      Estado do serviço
+    POST   /jobs?filename=&language=&model=&preset=&priority=
+                                        Envia o áudio (corpo da requisição)
+    GET    /jobs                        Lista os jobs
+    GET    /jobs/<id>                   Estado e progresso de um job
+    GET    /jobs/<id>/lines             Linhas transcritas (JSON do projeto)
+    GET    /jobs/<id>/export/<formato>  Resultado exportado (txt, srt, lrc, vtt, json)
+    DELETE /jobs/<id>                   Cancela o job, ou descarta o encerrado
+
+Não há autenticação: use só em rede local confiável.
+"""
+import json
+import os
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import BinaryIO, Callable, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from app.config import (
+    SERVER_SPOOL_DIR, SERVER_WORKERS, SERVER_MAX_PENDING, SERVER_KEEP_FINISHED,
+    SERVER_MAX_UPLOAD_BYTES, SERVER_RETRY_AFTER_SECONDS, SUPPORTED_LANGUAGES
+)
+from app.core.exporters import Exporter
+from app.core.job_queue import JobQueue, TranscriptionJob
+from app.core.transcriber import Transcriber
+
+
+# Tipo de conteúdo de cada formato de exportação
+CONTENT_TYPES = {
+    "txt": "text/plain; charset=utf-8",
+    "srt": "application/x-subrip; charset=utf-8",
+    "lrc": "text/plain; charset=utf-8",
+    "vtt": "text/vtt; charset=utf-8",
+    "json": "application/json; charset=utf-8"
+}
+
+# Tamanho dos blocos lidos do corpo da requisição
+_CHUNK_SIZE = 64 * 1024
+
+
+class QueueFull(Exception):
+    """A fila atingiu o limite de jobs pendentes."""
+
+
+class TranscriptionService:
+    """
+    Fila de transcrição atendida por um conjunto fixo de workers.
+    
+    Cada worker tem o próprio ``Transcriber``, criado uma vez: o modelo
+    carregado fica em memória entre os jobs, e o worker prefere os jobs que
+    usam o modelo que já tem. Os núcleos da CPU são divididos entre os
+    workers. Acima de ``max_pending`` jobs esperando, novos envios são
+    recusados (``QueueFull``) em vez de acumular áudio no disco.
+    
+    Os áudios recebidos e a fila ficam em ``spool_dir``; jobs interrompidos
+    ao parar o serviço voltam a pendentes na próxima inicialização.
+    """
+    
+    def __init__(self, spool_dir: str = SERVER_SPOOL_DIR, workers: int = SERVER_WORKERS,
+                 max_pending: int = SERVER_MAX_PENDING,
+                 keep_finished: int = SERVER_KEEP_FINISHED,
+                 transcriber_factory: Optional[Callable[[], Transcriber]] = None):
+        """
+        Args:
+            spool_dir: Pasta dos áudios recebidos e da fila
+            workers: Transcrições simultâneas
+            max_pending: Jobs esperando aceitos além dos que estão rodando
+            keep_finished: Jobs encerrados mantidos para consulta
+            transcriber_factory: Cria o transcritor de cada worker
+        """
+        self.spool_dir = spool_dir
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self.keep_finished = keep_finished
+        if transcriber_factory is None:
+            cpu_threads = max(1, (os.cpu_count() or 1) // self.workers)
+            transcriber_factory = lambda: Transcriber(cpu_threads=cpu_threads)
+        self.transcriber_factory = transcriber_factory
+        
+        os.makedirs(spool_dir, exist_ok=True)
+        self.job_queue = JobQueue(os.path.join(spool_dir, "jobs.json"))
+        
+        self._threads: List[threading.Thread] = []
+        self._wakeup = threading.Condition()
+        self._stopping = False
+        # Envios aceitos cujo áudio ainda está sendo recebido
+        self._reserved = 0
+    
+    def start(self) -> None:
+        """Inicia os workers (retomando jobs pendentes de uma execução anterior)."""
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"transcription-worker-{i}",
+                                      daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Para os workers; o job em andamento volta a pendente."""
+        with self._wakeup:
+            self._stopping = True
+            self._wakeup.notify_all()
+        self.job_queue.interrupt()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+    
+    def pending_count(self) -> int:
+        """Jobs esperando um worker."""
+        return sum(1 for job in self.job_queue.jobs if job.status == job.PENDING)
+    
+    def submit(self, audio: BinaryIO, size: int, filename: str = "", language: str = "pt",
+               model_size: str = "base", preset: str = Transcriber.DEFAULT_PRESET,
+               priority: int = 0) -> TranscriptionJob:
+        """
+        Grava o áudio recebido e o coloca na fila.
+        
+        Args:
+            audio: Stream com ``size`` bytes do arquivo de áudio
+            size: Tamanho do áudio em bytes
+            filename: Nome original (só a extensão é usada)
+        
+        Returns:
+            O job criado
+        
+        Raises:
+            QueueFull: Se já há ``max_pending`` jobs esperando
+        """
+        with self._wakeup:
+            if self.pending_count() + self._reserved >= self.max_pending:
+                raise QueueFull()
+            self._reserved += 1
+        
+        try:
+            extension = os.path.splitext(os.path.basename(filename))[1].lower()
+            path = os.path.join(self.spool_dir, uuid.uuid4().hex + extension)
+            try:
+                with open(path, 'wb') as f:
+                    remaining = size
+                    while remaining > 0:
+                        chunk = audio.read(min(_CHUNK_SIZE, remaining))
+                        if not chunk:
+                            raise ValueError("Áudio incompleto")
+                        f.write(chunk)
+                        remaining -= len(chunk)
+            except Exception:
+                self._remove_file(path)
+                raise
+            job = self.job_queue.add(path, language, model_size, preset, priority)
+        finally:
+            with self._wakeup:
+                self._reserved -= 1
+                self._wakeup.notify()
+        return job
+    
+    def cancel(self, job_id: str) -> bool:
+        """Cancela um job não encerrado, ou descarta um encerrado."""
+        job = self.job_queue.get(job_id)
+        if job is None:
+            return False
+        if job.is_finished:
+            return self.job_queue.remove(job_id)
+        if not self.job_queue.cancel(job_id):
+            return False
+        if job.is_finished:
+            # Estava pendente: o áudio não será mais usado
+            self._remove_file(job.audio_path)
+        return True
+    
+    def status(self, job: TranscriptionJob) -> dict:
+        """Estado público de um job (sem as linhas nem o caminho no servidor)."""
+        data = job.to_dict()
+        del data["lines"], data["audio_path"], data["sequence"]
+        data["line_count"] = len(job.lines)
+        if job.status == job.PENDING:
+            pending = [other for other in self.job_queue.ordered() if other.status == other.PENDING]
+            data["position"] = pending.index(job)
+        return data
+    
+    def _work(self) -> None:
+        """Laço de um worker: pega o próximo job e transcreve."""
+        transcriber = self.transcriber_factory()
+        
+        def has_model(job: TranscriptionJob) -> bool:
+            return transcriber.is_model_loaded(job.model_size, job.preset)
+        
+        while True:
+            with self._wakeup:
+                job = None
+                while not self._stopping:
+                    job = self.job_queue.claim(prefer=has_model)
+                    if job is not None:
+                        break
+                    self._wakeup.wait()
+                if job is None:
+                    return
+            
+            self.job_queue.process(job, transcriber)
+            if job.is_finished:
+                self._remove_file(job.audio_path)
+                self._discard_old_jobs()
+    
+    def _discard_old_jobs(self) -> None:
+        """Descarta os jobs encerrados mais antigos além de ``keep_finished``."""
+        finished = [job for job in self.job_queue.jobs if job.is_finished]
+        finished.sort(key=lambda job: (job.finished_at, job.sequence))
+        for job in finished[:max(0, len(finished) - self.keep_finished)]:
+            self.job_queue.remove(job.id)
+    
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        """Apaga um áudio recebido, se ainda existir."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class TranscriptionServer(ThreadingHTTPServer):
+    """Servidor HTTP que expõe um ``TranscriptionService``."""
+    
+    daemon_threads = True
+    
+    def __init__(self, address, service: TranscriptionService,
+                 max_upload_bytes: int = SERVER_MAX_UPLOAD_BYTES):
+        super().__init__(address, _RequestHandler)
+        self.service = service
+        self.max_upload_bytes = max_upload_bytes
+    
+    @property
+    def url(self) -> str:
+        """Endereço base do servidor."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Rotas da API (ver docstring do módulo)."""
+    
+    server: TranscriptionServer
+    
+    def do_GET(self) -> None:
+        parts = self._path_parts()
+        service = self.server.service
+        
+        if parts == ["health"]:
+            jobs = service.job_queue.jobs
+            self._send_json(200, {
+                "workers": service.workers,
+                "running": sum(1 for job in jobs if job.status == job.RUNNING),
+                "pending": service.pending_count(),
+                "max_pending": service.max_pending
+            })
+            return
+        if parts == ["jobs"]:
+            self._send_json(200, {"jobs": [service.status(job)
+                                           for job in service.job_queue.ordered()]})
+            return
+        
+        if len(parts) < 2 or parts[0] != "jobs":
+            self._send_error(404, "Rota não encontrada")
+            return
+        job = service.job_queue.get(parts[1])
+        if job is None:
+            self._send_error(404, "Job não encontrado")
+            return
+        
+        if len(parts) == 2:
+            self._send_json(200, service.status(job))
+        elif parts[2:] == ["lines"]:
+            if self._require_done(job):
+                self._send_json(200, {"lines": [line.to_dict() for line in job.lines]})
+        elif len(parts) == 4 and parts[2] == "export":
+            format_type = parts[3]
+            if format_type not in Exporter.FORMATS:
+                self._send_error(404, f"Formato não suportado: {format_type}")
+            elif self._require_done(job):
+                body = Exporter.render_bytes(job.lines, format_type)
+                self._send(200, body, CONTENT_TYPES.get(format_type, "application/octet-stream"))
+        else:
+            self._send_error(404, "Rota não encontrada")
+    
+    def do_POST(self) -> None:
+        if self._path_parts() != ["jobs"]:
+            self._send_error(404, "Rota não encontrada")
+            return
+        
+        try:
+            size = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._send_error(411, "Content-Length obrigatório")
+            return
+        if size <= 0:
+            self._send_error(400, "Áudio vazio")
+            return
+        if size > self.server.max_upload_bytes:
+            self.close_connection = True
+            self._send_error(413, "Áudio maior que o limite do servidor")
+            return
+        
+        query = {key: values[-1] for key, values in parse_qs(urlparse(self.path).query).items()}
+        language = query.get("language", "pt")
+        model_size = query.get("model", "base")
+        preset = query.get("preset", Transcriber.DEFAULT_PRESET)
+        try:
+            priority = int(query.get("priority", 0))
+        except ValueError:
+            priority = None
+        error = None
+        if language not in SUPPORTED_LANGUAGES:
+            error = f"Idioma não suportado: {language}"
+        elif model_size not in Transcriber.MODELS:
+            error = f"Modelo desconhecido: {model_size}"
+        elif preset not in Transcriber.PRESETS:
+            error = f"Preset desconhecido: {preset}"
+        elif priority is None:
+            error = "Prioridade deve ser um número inteiro"
+        if error:
+            self._discard_body(size)
+            self._send_error(400, error)
+            return
+        
+        try:
+            job = self.server.service.submit(self.rfile, size, query.get("filename", ""),
+                                             language, model_size, preset, priority)
+        except QueueFull:
+            # Ler o corpo para o cliente receber a resposta em vez de um erro de conexão
+            self._discard_body(size)
+            self._send_error(503, "Fila cheia, tente novamente mais tarde",
+                             {"Retry-After": str(SERVER_RETRY_AFTER_SECONDS)})
+            return
+        except ValueError as e:
+            self.close_connection = True
+            self._send_error(400, str(e))
+            return
+        
+        self._send_json(202, self.server.service.status(job),
+                        {"Location": f"/jobs/{job.id}"})
+    
+    def do_DELETE(self) -> None:
+        parts = self._path_parts()
+        if len(parts) != 2 or parts[0] != "jobs":
+            self._send_error(404, "Rota não encontrada")
+            return
+        if not self.server.service.cancel(parts[1]):
+            self._send_error(404, "Job não encontrado")
+            return
+        job = self.server.service.job_queue.get(parts[1])
+        self._send_json(200, self.server.service.status(job) if job else {"id": parts[1]})
+    
+    def _path_parts(self) -> List[str]:
+        """Partes do caminho da requisição, sem a query."""
+        return [part for part in urlparse(self.path).path.split("/") if part]
+    
+    def _require_done(self, job: TranscriptionJob) -> bool:
+        """Responde 409 se o job ainda não tem resultado."""
+        if job.status == job.DONE:
+            return True
+        self._send_error(409, f"Job não concluído ({job.status})")
+        return False
+    
+    def _discard_body(self, size: int) -> None:
+        """Lê e descarta o corpo da requisição."""
+        while size > 0:
+            chunk = self.rfile.read(min(_CHUNK_SIZE, size))
+            if not chunk:
+                break
+            size -= len(chunk)
+    
+    def _send(self, code: int, body: bytes, content_type: str,
+              headers: Optional[dict] = None) -> None:
+        """Envia uma resposta completa."""
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _send_json(self, code: int, data: dict, headers: Optional[dict] = None) -> None:
+        """Envia um objeto JSON."""
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self._send(code, body, CONTENT_TYPES["json"], headers)
+    
+    def _send_error(self, code: int, message: str, headers: Optional[dict] = None) -> None:
+        """Envia um erro em JSON."""
+        self._send_json(code, {"error": message}, headers)
+
+
+def serve(host: str, port: int, service: TranscriptionService,
+          max_upload_bytes: int = SERVER_MAX_UPLOAD_BYTES) -> TranscriptionServer:
+    """
+    Cria o servidor HTTP e inicia os workers (o chamador roda
+    ``serve_forever`` e, ao encerrar, fecha o servidor e chama ``service.stop``).
+    
+    Args:
+        host: Endereço de escuta ("0.0.0.0" para aceitar outras máquinas)
+        port: Porta (0 escolhe uma livre)
+        service: Serviço de transcrição
+        max_upload_bytes: Tamanho máximo do áudio enviado
+    
+    Returns:
+        O servidor, já escutando
+    """
+    server = TranscriptionServer((host, port), service, max_upload_bytes)
+    service.start()
+    return server
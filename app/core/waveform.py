@@ -1,20 +1,181 @@
 """
 Módulo para geração e manipulação de waveform de áudio.
 """
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import librosa
-from typing import Tuple, Optional, List
+from typing import Tuple, Optional, List, Iterable
 from pathlib import Path
 
 
+def compute_peaks(samples: np.ndarray, columns: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula o envelope de picos (mínimo e máximo) de ``samples`` em
+    ``columns`` colunas, uma por pixel na tela.
+    
+    Args:
+        samples: Amostras do trecho a desenhar
+        columns: Número de colunas desejado
+        
+    Returns:
+        Tupla com (mínimos, máximos), cada um com ``columns`` valores
+    """
+    if columns <= 0 or len(samples) == 0:
+        return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.float32)
+    
+    # Início de cada coluna; com menos amostras que colunas, as
+    # colunas repetem a amostra mais próxima
+    edges = np.linspace(0, len(samples), columns, endpoint=False).astype(np.int64)
+    mins = np.minimum.reduceat(samples, edges)
+    maxs = np.maximum.reduceat(samples, edges)
+    return mins, maxs
+
+
+class WaveformAnalysis:
+    """
+    Resumo de um waveform recebido em blocos: picos (mínimo e máximo) a
+    cada ``peak_block`` amostras, RMS a cada ``rms_window`` amostras e
+    totais para as estatísticas.
+    
+    Nenhuma amostra é guardada além do resto de um bloco incompleto, então
+    a memória depende só do número de blocos, não do áudio decodificado.
+    """
+    
+    def __init__(self, peak_block: int = 256, rms_window: int = 1024):
+        self.peak_block = peak_block
+        self.rms_window = rms_window
+        
+        self.samples = 0
+        self.max_amplitude = 0.0
+        self.sum_squares = 0.0
+        self.zero_crossings = 0
+        
+        self._mins: List[np.ndarray] = []
+        self._maxs: List[np.ndarray] = []
+        self._rms: List[np.ndarray] = []
+        self._peak_rest = np.zeros(0, dtype=np.float32)
+        self._rms_rest = np.zeros(0, dtype=np.float32)
+        self._last_sign: Optional[float] = None
+        self.finished = False
+    
+    def feed(self, samples: np.ndarray) -> None:
+        """
+        Acrescenta amostras mono ao resumo.
+        
+        Args:
+            samples: Amostras float32
+        """
+        if not len(samples):
+            return
+        
+        self.samples += len(samples)
+        self.max_amplitude = max(self.max_amplitude, float(np.max(np.abs(samples))))
+        self.sum_squares += float(np.dot(samples.astype(np.float64), samples))
+        
+        signs = np.sign(samples)
+        self.zero_crossings += int(np.count_nonzero(np.diff(signs)))
+        if self._last_sign is not None and signs[0] != self._last_sign:
+            self.zero_crossings += 1
+        self._last_sign = signs[-1]
+        
+        data = np.concatenate((self._peak_rest, samples))
+        complete = len(data) - len(data) % self.peak_block
+        if complete:
+            blocks = data[:complete].reshape(-1, self.peak_block)
+            self._mins.append(blocks.min(axis=1))
+            self._maxs.append(blocks.max(axis=1))
+        self._peak_rest = data[complete:].copy()
+        
+        data = np.concatenate((self._rms_rest, samples))
+        complete = len(data) - len(data) % self.rms_window
+        if complete:
+            windows = data[:complete].reshape(-1, self.rms_window)
+            self._rms.append(np.sqrt(np.mean(windows ** 2, axis=1)))
+        self._rms_rest = data[complete:].copy()
+    
+    def finish(self) -> None:
+        """Fecha o último bloco e a última janela, mesmo incompletos."""
+        if self.finished:
+            return
+        if len(self._peak_rest):
+            self._mins.append(self._peak_rest.min(keepdims=True))
+            self._maxs.append(self._peak_rest.max(keepdims=True))
+        if len(self._rms_rest):
+            self._rms.append(np.sqrt(np.mean(self._rms_rest ** 2, keepdims=True)))
+        self._peak_rest = self._rms_rest = np.zeros(0, dtype=np.float32)
+        self.finished = True
+    
+    @staticmethod
+    def _join(parts: List[np.ndarray]) -> np.ndarray:
+        """Concatena os pedaços acumulados (cópia da lista: seguro entre threads)."""
+        parts = list(parts)
+        if not parts:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(parts)
+    
+    def get_peaks(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Retorna (mínimos, máximos) por bloco de ``peak_block`` amostras."""
+        return self._join(self._mins), self._join(self._maxs)
+    
+    def get_rms(self) -> np.ndarray:
+        """Retorna o RMS por janela de ``rms_window`` amostras."""
+        return self._join(self._rms)
+    
+    def get_rms_total(self) -> float:
+        """Retorna o RMS de todo o áudio recebido."""
+        return float(np.sqrt(self.sum_squares / self.samples)) if self.samples else 0.0
+
+
 class WaveformGenerator:
     """Classe para gerar waveform de arquivos de áudio."""
     
+    # Níveis de detalhe do envelope: blocos de 256, 1024, 4096... amostras
+    PEAK_BASE_BLOCK = 256
+    PEAK_LEVEL_FACTOR = 4
+    
+    # Janela de RMS calculada durante o carregamento em blocos
+    RMS_WINDOW = 1024
+    
+    # Frames extras lidos em volta de um trecho relido do arquivo
+    SEGMENT_MARGIN = 256
+    
     def __init__(self, target_sample_rate: int = 22050):
         self.target_sample_rate = target_sample_rate
         self.waveform_data: Optional[np.ndarray] = None
         self.duration: float = 0.0
         self.sample_rate: int = 0
+        
+        # Pirâmide de picos [(tamanho do bloco, mínimos, máximos)], criada sob demanda
+        self._peak_levels: Optional[List[Tuple[int, np.ndarray, np.ndarray]]] = None
+        self._peak_lock = threading.Lock()
+        
+        # Carregamento em blocos (ver begin_stream); sem keep_samples só o
+        # resumo fica em memória e trechos são relidos do arquivo
+        self.analysis: Optional[WaveformAnalysis] = None
+        self.audio_path: Optional[str] = None
+        self.loaded_samples: int = 0
+        self._source_rate: int = 0
+        self._resampler = None
+    
+    @classmethod
+    def from_array(cls, waveform_data: np.ndarray, sample_rate: int) -> 'WaveformGenerator':
+        """
+        Cria gerador a partir de amostras já decodificadas (sem cópia).
+        
+        Args:
+            waveform_data: Amostras mono
+            sample_rate: Taxa de amostragem
+            
+        Returns:
+            WaveformGenerator pronto para consultas
+        """
+        generator = cls(target_sample_rate=sample_rate)
+        generator.waveform_data = waveform_data
+        generator.sample_rate = sample_rate
+        generator.duration = len(waveform_data) / sample_rate if sample_rate else 0.0
+        return generator
     
     def load_audio(self, audio_path: str) -> bool:
         """
@@ -27,13 +188,16 @@ class WaveformGenerator:
             True se carregado com sucesso, False caso contrário
         """
         try:
-            # Carregar áudio com librosa
+            # Carregar áudio com librosa (importado só aqui: é pesado)
+            import librosa
             y, sr = librosa.load(audio_path, sr=self.target_sample_rate)
             
             # Armazenar dados
             self.waveform_data = y
             self.sample_rate = sr
             self.duration = len(y) / sr
+            self.analysis = None
+            self._peak_levels = None
             
             return True
             
@@ -41,6 +205,129 @@ class WaveformGenerator:
             print(f"Erro ao carregar áudio para waveform: {e}")
             return False
     
+    def load_audio_stream(self, audio_path: str, keep_samples: bool = False) -> bool:
+        """
+        Carrega arquivo de áudio em blocos, calculando picos, RMS e
+        silêncio sem manter o áudio inteiro em memória.
+        
+        Args:
+            audio_path: Caminho para o arquivo de áudio
+            keep_samples: Guarda também as amostras reamostradas
+            
+        Returns:
+            True se carregado com sucesso, False caso contrário
+        """
+        from app.core.audio_loader import AudioLoader
+        
+        loader = AudioLoader(audio_path)
+        try:
+            loader.open()
+            self.begin_stream(loader.sample_rate, loader.frames,
+                              keep_samples=keep_samples, audio_path=audio_path)
+            for block in loader.blocks():
+                self.feed_block(block)
+            self.end_stream()
+            return True
+            
+        except Exception as e:
+            print(f"Erro ao carregar áudio para waveform: {e}")
+            return False
+        finally:
+            loader.close()
+    
+    def begin_stream(self, source_rate: int, total_frames: int, keep_samples: bool = True,
+                     audio_path: Optional[str] = None) -> None:
+        """
+        Prepara o carregamento do waveform em blocos (ver ``feed_block``).
+        
+        Args:
+            source_rate: Taxa de amostragem do arquivo
+            total_frames: Número total de frames do arquivo
+            keep_samples: Guarda as amostras; se False, só o resumo fica em memória
+            audio_path: Arquivo de origem, relido para trechos com zoom alto
+        """
+        self.sample_rate = self.target_sample_rate
+        self.audio_path = audio_path
+        self._source_rate = source_rate
+        # Reamostragem contínua entre blocos (sem emendas nas bordas)
+        self._resampler = None
+        if source_rate != self.sample_rate:
+            import soxr
+            self._resampler = soxr.ResampleStream(source_rate, self.sample_rate, 1, dtype='float32')
+        total = int(math.ceil(total_frames * self.sample_rate / source_rate))
+        
+        self.waveform_data = np.zeros(total, dtype=np.float32) if keep_samples else None
+        self.duration = total / self.sample_rate
+        self.loaded_samples = 0
+        self.analysis = WaveformAnalysis(self.PEAK_BASE_BLOCK, self.RMS_WINDOW)
+        self._peak_levels = None
+    
+    def feed_block(self, block: np.ndarray) -> None:
+        """
+        Acrescenta um bloco decodificado (frames, canais) ao waveform.
+        
+        Args:
+            block: Amostras float32 entre -1 e 1
+        """
+        if self.analysis is None or not len(block):
+            return
+        
+        mono = block.mean(axis=1, dtype=np.float32) if block.ndim > 1 else block
+        if self._resampler is not None:
+            mono = self._resampler.resample_chunk(mono)
+        self._write_samples(mono)
+    
+    def _write_samples(self, mono: np.ndarray) -> None:
+        """Acrescenta amostras já reamostradas ao resumo (e ao waveform, se guardado)."""
+        if not len(mono):
+            return
+        
+        if self.waveform_data is not None:
+            start = self.loaded_samples
+            end = min(start + len(mono), len(self.waveform_data))
+            mono = mono[:end - start]
+            self.waveform_data[start:end] = mono
+        
+        self.analysis.feed(mono)
+        self.loaded_samples += len(mono)
+    
+    def end_stream(self) -> None:
+        """Encerra o carregamento em blocos, ajustando a duração real."""
+        if self._resampler is not None:
+            self._write_samples(self._resampler.resample_chunk(np.zeros(0, dtype=np.float32), last=True))
+            self._resampler = None
+        if self.analysis is not None:
+            self.analysis.finish()
+        if self.waveform_data is not None and self.loaded_samples < len(self.waveform_data):
+            self.waveform_data = self.waveform_data[:self.loaded_samples]
+        self.duration = self.loaded_samples / self.sample_rate
+        self._peak_levels = None
+    
+    def is_streamed(self) -> bool:
+        """Indica se as amostras não estão em memória (apenas o resumo)."""
+        return self.waveform_data is None and self.analysis is not None
+    
+    def get_preview_data(self) -> Tuple[Optional[np.ndarray], float, float]:
+        """
+        Retorna uma prévia grosseira do waveform durante o carregamento:
+        mínimos e máximos intercalados, que desenhados como amostras
+        formam o envelope.
+        
+        Returns:
+            Tupla com (prévia, duração, taxa equivalente da prévia)
+        """
+        if self.analysis is None:
+            return None, self.duration, 0.0
+        
+        mins, maxs = self.analysis.get_peaks()
+        blocks = max(len(mins), -(-int(round(self.duration * self.sample_rate)) // self.PEAK_BASE_BLOCK))
+        preview = np.zeros(2 * blocks, dtype=np.float32)
+        preview[0:2 * len(mins):2] = mins
+        preview[1:2 * len(maxs):2] = maxs
+        
+        preview_rate = 2 * self.sample_rate / self.PEAK_BASE_BLOCK
+        return preview, self.duration, preview_rate
+    
     def get_waveform_data(self) -> Tuple[Optional[np.ndarray], float, int]:
         """
         Retorna dados do waveform.
@@ -62,7 +349,7 @@ class WaveformGenerator:
             Array numpy com o segmento ou None se inválido
         """
         if self.waveform_data is None:
-            return None
+            return self._read_segment(start_time, end_time)
         
         # Converter tempos para índices
         start_idx = int(start_time * self.sample_rate)
@@ -77,6 +364,174 @@ class WaveformGenerator:
         
         return self.waveform_data[start_idx:end_idx]
     
+    def _read_segment(self, start_time: float, end_time: float) -> Optional[np.ndarray]:
+        """Decodifica um trecho direto do arquivo (modo sem amostras em memória)."""
+        if not self.audio_path or not self._source_rate:
+            return None
+        
+        start_idx = max(0, int(start_time * self.sample_rate))
+        end_idx = min(self.get_sample_count(), int(end_time * self.sample_rate))
+        if start_idx >= end_idx:
+            return None
+        
+        # Margem de contexto para o filtro de reamostragem não distorcer as bordas
+        ratio = self._source_rate / self.sample_rate
+        margin = self.SEGMENT_MARGIN
+        start = int(start_idx * ratio)
+        first = max(0, start - margin)
+        stop = int(math.ceil(end_idx * ratio)) + margin
+        
+        try:
+            import soundfile as sf
+            data, rate = sf.read(self.audio_path, start=first, stop=stop,
+                                 dtype='float32', always_2d=True)
+        except Exception:
+            return None
+        
+        mono = data.mean(axis=1, dtype=np.float32)
+        if rate != self.sample_rate:
+            import soxr
+            mono = soxr.resample(mono, rate, self.sample_rate)
+        
+        offset = int(round((start - first) / ratio))
+        segment = mono[offset:offset + end_idx - start_idx]
+        return segment if len(segment) else None
+    
+    def get_sample_count(self) -> int:
+        """Retorna o número de amostras do waveform (na taxa ``sample_rate``)."""
+        if self.waveform_data is not None:
+            return len(self.waveform_data)
+        return self.loaded_samples
+    
+    def _get_samples(self, start: int, end: int) -> Optional[np.ndarray]:
+        """Retorna as amostras ``[start, end)``, da memória ou relidas do arquivo."""
+        if self.waveform_data is not None:
+            return self.waveform_data[start:end]
+        segment = self._read_segment(start / self.sample_rate, end / self.sample_rate)
+        if segment is None:
+            return None
+        # A releitura pode diferir em uma amostra por arredondamento
+        if len(segment) < end - start:
+            segment = np.pad(segment, (0, end - start - len(segment)), mode='edge')
+        return segment
+    
+    def _get_peak_levels(self) -> List[Tuple[int, np.ndarray, np.ndarray]]:
+        """Retorna a pirâmide de picos, calculando-a na primeira chamada."""
+        with self._peak_lock:
+            if self._peak_levels is not None:
+                return self._peak_levels
+            
+            levels = []
+            block = self.PEAK_BASE_BLOCK
+            if self.analysis is not None and self.analysis.finished:
+                # Nível base já calculado durante o carregamento
+                mins, maxs = self.analysis.get_peaks()
+            elif self.waveform_data is not None and len(self.waveform_data) > block:
+                edges = np.arange(0, len(self.waveform_data), block)
+                mins = np.minimum.reduceat(self.waveform_data, edges)
+                maxs = np.maximum.reduceat(self.waveform_data, edges)
+            else:
+                mins = maxs = np.zeros(0, dtype=np.float32)
+            
+            if len(mins) > 1:
+                levels.append((block, mins, maxs))
+                
+                # Cada nível seguinte agrupa PEAK_LEVEL_FACTOR blocos do anterior
+                while len(mins) > self.PEAK_LEVEL_FACTOR:
+                    block *= self.PEAK_LEVEL_FACTOR
+                    edges = np.arange(0, len(mins), self.PEAK_LEVEL_FACTOR)
+                    mins = np.minimum.reduceat(mins, edges)
+                    maxs = np.maximum.reduceat(maxs, edges)
+                    levels.append((block, mins, maxs))
+            
+            self._peak_levels = levels
+            return levels
+    
+    def get_peak_columns(self, start_sample: int, samples_per_column: float,
+                         columns: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcula o envelope de picos a partir de ``start_sample``, com
+        ``samples_per_column`` amostras por coluna, usando o nível de
+        detalhe mais grosso que ainda tem a resolução pedida.
+        
+        Args:
+            start_sample: Primeira amostra
+            samples_per_column: Amostras por coluna (pixel)
+            columns: Número máximo de colunas
+            
+        Returns:
+            Tupla com (mínimos, máximos); menos colunas se o áudio acabar antes
+        """
+        empty = np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.float32)
+        total = self.get_sample_count()
+        if not total or columns <= 0 or samples_per_column <= 0:
+            return empty
+        
+        start_sample = max(0, int(start_sample))
+        end_sample = min(total, int(math.ceil(start_sample + samples_per_column * columns)))
+        if start_sample >= end_sample:
+            return empty
+        
+        columns = int(math.ceil((end_sample - start_sample) / samples_per_column))
+        column_starts = start_sample + (np.arange(columns) * samples_per_column).astype(np.int64)
+        
+        levels = self._get_peak_levels()
+        level = None
+        for candidate in levels:
+            if candidate[0] <= samples_per_column:
+                level = candidate
+        
+        if level is None:
+            # Resolução acima da pirâmide: usar as próprias amostras
+            segment = self._get_samples(start_sample, end_sample)
+            if segment is not None and len(segment) == end_sample - start_sample:
+                edges = column_starts - start_sample
+                return np.minimum.reduceat(segment, edges), np.maximum.reduceat(segment, edges)
+            if not levels:
+                return empty
+            # Amostras indisponíveis: o nível base é o melhor que há
+            level = levels[0]
+        
+        block, mins, maxs = level
+        first_block = start_sample // block
+        last_block = min(len(mins), -(-end_sample // block))
+        edges = column_starts // block - first_block
+        return (np.minimum.reduceat(mins[first_block:last_block], edges),
+                np.maximum.reduceat(maxs[first_block:last_block], edges))
+    
+    def get_peaks(self, start_time: float, end_time: float,
+                  columns: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcula o envelope de picos entre dois tempos em ``columns`` colunas.
+        
+        Args:
+            start_time: Tempo de início em segundos
+            end_time: Tempo de fim em segundos
+            columns: Número de colunas (pixels)
+            
+        Returns:
+            Tupla com (mínimos, máximos)
+        """
+        if columns <= 0 or end_time <= start_time:
+            return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.float32)
+        samples_per_column = (end_time - start_time) * self.sample_rate / columns
+        return self.get_peak_columns(int(start_time * self.sample_rate),
+                                     samples_per_column, columns)
+    
+    def get_peak_amplitude(self) -> float:
+        """Retorna a maior amplitude absoluta do waveform."""
+        if self.analysis is not None and self.analysis.finished:
+            return self.analysis.max_amplitude
+        
+        levels = self._get_peak_levels()
+        if levels:
+            _, mins, maxs = levels[-1]
+        elif self.waveform_data is not None and len(self.waveform_data):
+            mins = maxs = self.waveform_data
+        else:
+            return 0.0
+        return float(max(-np.min(mins), np.max(maxs)))
+    
     def get_rms_energy(self, window_size: int = 1024) -> np.ndarray:
         """
         Calcula energia RMS do waveform em janelas.
@@ -87,17 +542,24 @@ class WaveformGenerator:
         Returns:
             Array com energia RMS por janela
         """
-        if self.waveform_data is None:
+        # Já calculado durante o carregamento em blocos
+        if (self.analysis is not None and self.analysis.finished
+                and window_size == self.analysis.rms_window):
+            return self.analysis.get_rms()
+        
+        if self.waveform_data is None or not len(self.waveform_data):
             return np.array([])
         
-        # Calcular RMS em janelas
-        rms = []
-        for i in range(0, len(self.waveform_data), window_size):
-            window = self.waveform_data[i:i + window_size]
-            if len(window) > 0:
-                rms.append(np.sqrt(np.mean(window**2)))
+        # Janelas completas de uma vez; a última, incompleta, à parte
+        data = self.waveform_data
+        complete = len(data) - len(data) % window_size
+        windows = data[:complete].reshape(-1, window_size)
+        rms = np.sqrt(np.mean(windows.astype(np.float64) ** 2, axis=1))
+        if complete < len(data):
+            rest = data[complete:].astype(np.float64)
+            rms = np.append(rms, np.sqrt(np.mean(rest ** 2)))
         
-        return np.array(rms)
+        return rms
     
     def get_spectral_centroid(self, window_size: int = 1024) -> np.ndarray:
         """
@@ -130,54 +592,35 @@ class WaveformGenerator:
         
         return np.array(centroids)
     
-    def detect_silence(self, threshold: float = 0.01, min_duration: float = 0.1) -> List[Tuple[float, float]]:
+    def detect_silence(self, threshold: float = 0.01, min_duration: float = 0.1,
+                       window_size: int = 1024) -> List[Tuple[float, float]]:
         """
         Detecta períodos de silêncio no áudio.
         
         Args:
             threshold: Limiar de energia para considerar silêncio
             min_duration: Duração mínima para considerar um período de silêncio
+            window_size: Tamanho da janela de RMS em samples
             
         Returns:
             Lista de tuplas (início, fim) dos períodos de silêncio
         """
-        if self.waveform_data is None:
+        # Calcular energia RMS
+        rms = self.get_rms_energy(window_size)
+        if not len(rms):
             return []
         
-        # Calcular energia RMS
-        rms = self.get_rms_energy()
-        
-        # Detectar silêncio
-        silence_mask = rms < threshold
-        
-        # Encontrar períodos contínuos de silêncio
-        silence_periods = []
-        in_silence = False
-        silence_start = 0
-        
-        for i, is_silent in enumerate(silence_mask):
-            if is_silent and not in_silence:
-                # Início de silêncio
-                in_silence = True
-                silence_start = i
-            elif not is_silent and in_silence:
-                # Fim de silêncio
-                in_silence = False
-                silence_duration = (i - silence_start) * window_size / self.sample_rate
-                if silence_duration >= min_duration:
-                    start_time = silence_start * window_size / self.sample_rate
-                    end_time = i * window_size / self.sample_rate
-                    silence_periods.append((start_time, end_time))
-        
-        # Verificar se termina em silêncio
-        if in_silence:
-            silence_duration = (len(silence_mask) - silence_start) * window_size / self.sample_rate
-            if silence_duration >= min_duration:
-                start_time = silence_start * window_size / self.sample_rate
-                end_time = len(self.waveform_data) / self.sample_rate
-                silence_periods.append((start_time, end_time))
-        
-        return silence_periods
+        # Bordas dos trechos contínuos de silêncio (em janelas)
+        silent = np.concatenate(([False], rms < threshold, [False]))
+        changes = np.flatnonzero(silent[1:] != silent[:-1])
+        starts, ends = changes[0::2], changes[1::2]
+        
+        window_duration = window_size / self.sample_rate
+        start_times = starts * window_duration
+        end_times = np.minimum(ends * window_duration, self.duration)
+        keep = (end_times - start_times) >= min_duration
+        
+        return list(zip(start_times[keep].tolist(), end_times[keep].tolist()))
     
     def get_peak_positions(self, threshold: float = 0.5) -> List[float]:
         """
@@ -241,7 +684,17 @@ class WaveformGenerator:
             Dicionário com estatísticas
         """
         if self.waveform_data is None:
-            return {}
+            if not self.is_streamed():
+                return {}
+            # Totais acumulados durante o carregamento em blocos
+            return {
+                "duration": self.duration,
+                "sample_rate": self.sample_rate,
+                "samples": self.analysis.samples,
+                "max_amplitude": self.analysis.max_amplitude,
+                "rms": self.analysis.get_rms_total(),
+                "zero_crossings": self.analysis.zero_crossings
+            }
         
         return {
             "duration": self.duration,
@@ -251,3 +704,133 @@ class WaveformGenerator:
             "rms": float(np.sqrt(np.mean(self.waveform_data**2))),
             "zero_crossings": int(np.sum(np.diff(np.sign(self.waveform_data)) != 0))
         }
+
+
+class PeakTileCache:
+    """
+    Cache de blocos ("tiles") do envelope de picos para a visualização.
+    
+    Cada tile cobre ``tile_columns`` colunas em uma resolução fixa de
+    amostras por coluna (potência de 2), de modo que rolar e aproximar
+    reaproveitam tiles já calculados. Tiles vizinhos ao trecho visível
+    são calculados em segundo plano, numa única thread que dura enquanto
+    o cache existir (``reset`` troca o gerador sem criar outra).
+    """
+    
+    def __init__(self, generator: WaveformGenerator, tile_columns: int = 512,
+                 max_tiles: int = 256):
+        self.generator = generator
+        self.tile_columns = tile_columns
+        self.max_tiles = max_tiles
+        
+        self._tiles: 'OrderedDict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]]' = OrderedDict()
+        self._pending = set()
+        self._lock = threading.Lock()
+        # Incrementada a cada ``reset``: tiles do gerador anterior são ignorados
+        self._generation = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="peak-tiles")
+    
+    @staticmethod
+    def resolution_for(samples_per_pixel: float) -> int:
+        """Maior potência de 2 que não excede ``samples_per_pixel``."""
+        if samples_per_pixel < 2:
+            return 1
+        return 1 << int(math.floor(math.log2(samples_per_pixel)))
+    
+    def tile_samples(self, resolution: int) -> int:
+        """Número de amostras cobertas por um tile."""
+        return resolution * self.tile_columns
+    
+    def get(self, resolution: int, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna um tile, calculando-o agora se ainda não estiver no cache.
+        
+        Args:
+            resolution: Amostras por coluna
+            index: Índice do tile nessa resolução
+            
+        Returns:
+            Tupla com (mínimos, máximos) do tile
+        """
+        key = (resolution, index)
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+                return tile
+        
+        tile = self._compute(resolution, index)
+        self._store(key, tile)
+        return tile
+    
+    def prefetch(self, resolution: int, indices: Iterable[int]) -> None:
+        """Agenda o cálculo em segundo plano dos tiles ainda ausentes."""
+        last_index = self._last_index(resolution)
+        for index in indices:
+            key = (resolution, index)
+            if not 0 <= index <= last_index:
+                continue
+            with self._lock:
+                if key in self._tiles or key in self._pending:
+                    continue
+                self._pending.add(key)
+                generation = self._generation
+            self._executor.submit(self._prefetch_one, key, generation)
+    
+    def clear(self) -> None:
+        """Descarta todos os tiles (ex.: ao carregar outro áudio)."""
+        with self._lock:
+            self._tiles.clear()
+    
+    def reset(self, generator: WaveformGenerator) -> None:
+        """
+        Passa a usar outro gerador (ex.: prévia atualizada durante o
+        carregamento), descartando os tiles e os pré-carregamentos do anterior.
+        """
+        with self._lock:
+            self.generator = generator
+            self._generation += 1
+            self._tiles.clear()
+            self._pending.clear()
+    
+    def shutdown(self) -> None:
+        """Encerra a thread de pré-carregamento."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _last_index(self, resolution: int) -> int:
+        """Índice do último tile com dados nessa resolução."""
+        total = self.generator.get_sample_count()
+        if not total:
+            return -1
+        return (total - 1) // self.tile_samples(resolution)
+    
+    def _compute(self, resolution: int, index: int,
+                 generator: Optional[WaveformGenerator] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Calcula um tile a partir do gerador (o atual se omitido)."""
+        return (generator or self.generator).get_peak_columns(
+            index * self.tile_samples(resolution), resolution, self.tile_columns
+        )
+    
+    def _prefetch_one(self, key: Tuple[int, int], generation: int) -> None:
+        """Calcula um tile na thread de pré-carregamento."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            generator = self.generator
+        try:
+            self._store(key, self._compute(*key, generator), generation)
+        finally:
+            with self._lock:
+                if generation == self._generation:
+                    self._pending.discard(key)
+    
+    def _store(self, key: Tuple[int, int], tile: Tuple[np.ndarray, np.ndarray],
+               generation: Optional[int] = None) -> None:
+        """Guarda um tile, descartando os menos usados acima do limite."""
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._tiles[key] = tile
+            self._tiles.move_to_end(key)
+            while len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
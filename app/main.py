@@ -3,56 +3,39 @@ Ponto de entrada principal do AurantisSync.
 """
 import sys
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 # Add the project root to the Python path for absolute imports
 sys.path.append(str(Path(__file__).parent.parent))
 
 from PySide6.QtWidgets import QApplication, QMessageBox, QSplashScreen
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap, QFont
 
-from app.ui.main_window_improved import MainWindow
+
+# Dependências verificadas na inicialização: (módulo, pacote no pip)
+REQUIRED_DEPENDENCIES = [
+    ("faster_whisper", "faster-whisper"),
+    ("pydub", "pydub"),
+    ("sounddevice", "sounddevice"),
+    ("librosa", "librosa"),
+    ("matplotlib", "matplotlib"),
+    ("numpy", "numpy"),
+    ("scipy", "scipy"),
+    ("soxr", "soxr"),
+]
 
 
 def check_dependencies():
-    """Verifica se todas as dependências estão instaladas."""
-    missing_deps = []
+    """
+    Verifica se todas as dependências estão instaladas.
     
-    try:
-        import faster_whisper
-    except ImportError:
-        missing_deps.append("faster-whisper")
-    
-    try:
-        import pydub
-    except ImportError:
-        missing_deps.append("pydub")
-    
-    try:
-        import sounddevice
-    except ImportError:
-        missing_deps.append("sounddevice")
-    
-    try:
-        import librosa
-    except ImportError:
-        missing_deps.append("librosa")
-    
-    try:
-        import matplotlib
-    except ImportError:
-        missing_deps.append("matplotlib")
-    
-    try:
-        import numpy
-    except ImportError:
-        missing_deps.append("numpy")
-    
-    try:
-        import scipy
-    except ImportError:
-        missing_deps.append("scipy")
+    Os módulos só são localizados (``find_spec``), não importados: cada um
+    é carregado no primeiro uso, sem atrasar a abertura da janela.
+    """
+    missing_deps = [package for module, package in REQUIRED_DEPENDENCIES
+                    if find_spec(module) is None]
     
     if missing_deps:
         return False, missing_deps
@@ -116,19 +99,16 @@ def main():
     splash.show()
     app.processEvents()
     
-    # Simular carregamento
-    QTimer.singleShot(2000, splash.close)
-    
     try:
+        # Importada depois do splash: a janela puxa o resto da aplicação
+        from app.ui.main_window_improved import MainWindow
+        
         # Criar janela principal
         main_window = MainWindow()
         
         # Fechar splash e mostrar janela principal
-        def show_main_window():
-            splash.close()
-            main_window.show()
-        
-        QTimer.singleShot(2000, show_main_window)
+        main_window.show()
+        splash.finish(main_window)
         
         # Executar aplicação
         sys.exit(app.exec())
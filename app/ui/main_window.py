@@ -3,24 +3,39 @@ Janela principal do aplicativo AurantisSync.
 """
 import os
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                               QSplitter, QGroupBox, QPushButton, QComboBox, 
+                               QSplitter, QGroupBox, QPushButton, QComboBox, QCheckBox,
                                QLabel, QProgressBar, QTextEdit, QFileDialog, 
-                               QMessageBox, QMenuBar, QMenu, QStatusBar, QApplication)
+                               QMessageBox, QMenuBar, QMenu, QStatusBar, QApplication,
+                               QInputDialog, QAbstractItemView, QDockWidget)
 from PySide6.QtCore import Qt, QTimer, Signal, QThread
 from PySide6.QtGui import QAction, QKeySequence, QFont
 
+from app.config import (
+    WAVEFORM_KEEP_SAMPLES_MAX_DURATION, PREVIEW_PRE_ROLL, PREVIEW_POST_ROLL,
+    POSITION_POLL_INTERVAL_MS, GUIDED_SYNC_REACTION_OFFSET, DRAFT_MODEL, DRAFT_PRESET,
+    MODEL_PREFETCH_DELAY_MS
+)
 from app.core.sync_model import SyncProject, LyricLine
 from app.core.transcriber import Transcriber
-from app.core.audio_player import AudioPlayer
+from app.core.audio_player import AudioPlayer, remove_stale_caches
+from app.core.audio_loader import AudioLoader
 from app.core.waveform import WaveformGenerator
+from app.core.guided_sync import GuidedSync
+from app.core.job_queue import JobQueue
+from app.core.refinement import DraftRefinement
+from app.core.speed_profiles import format_duration
 from app.core.exporters import Exporter, ExportError
+from app.core.importers import Importer, ImporterError
 from app.core.project_io import ProjectIO
 from app.widgets.waveform_widget import WaveformWidget
 from app.widgets.lines_table import LinesTableWidget
+from app.widgets.job_queue_widget import JobQueueWidget
 
 
 class TranscriptionThread(QThread):
@@ -29,22 +44,25 @@ class TranscriptionThread(QThread):
     finished = Signal(list)
     error = Signal(str)
     
-    def __init__(self, transcriber, audio_path, language, model_size):
+    def __init__(self, transcriber, audio_path, language, model_size, preset):
         super().__init__()
         self.transcriber = transcriber
         self.audio_path = audio_path
         self.language = language
         self.model_size = model_size
+        self.preset = preset
     
     def run(self):
         try:
             self.progress.emit("Carregando modelo...")
-            if not self.transcriber.load_model(self.model_size):
+            if not self.transcriber.load_model(self.model_size, self.preset):
                 self.error.emit("Falha ao carregar modelo do Whisper")
                 return
             
             self.progress.emit("Transcrevendo áudio...")
-            lines = self.transcriber.transcribe(self.audio_path, self.language, self.model_size)
+            lines = self.transcriber.transcribe(
+                self.audio_path, self.language, self.model_size, self.preset
+            )
             
             self.progress.emit("Transcrição concluída!")
             self.finished.emit(lines)
@@ -53,6 +71,253 @@ class TranscriptionThread(QThread):
             self.error.emit(str(e))
 
 
+class ModelPrefetchThread(QThread):
+    """Thread de baixa prioridade que deixa modelo e áudio prontos para transcrever."""
+    finished = Signal(str)
+    
+    def __init__(self, transcriber, audio_path, model_size, preset):
+        super().__init__()
+        self.transcriber = transcriber
+        self.audio_path = audio_path
+        self.model_size = model_size
+        self.preset = preset
+    
+    def run(self):
+        # Modelos ainda não baixados ficam para o clique em "Transcrever"
+        if self.isInterruptionRequested() or not self.transcriber.is_model_installed(self.model_size):
+            return
+        if not self.transcriber.load_model(self.model_size, self.preset):
+            return
+        if self.isInterruptionRequested():
+            return
+        
+        try:
+            self.transcriber.load_audio(self.audio_path)
+        except RuntimeError:
+            return
+        
+        self.finished.emit(self.model_size)
+
+
+class RangeTranscriptionThread(QThread):
+    """Thread para retranscrever um trecho do áudio em background."""
+    progress = Signal(str)
+    finished = Signal(float, float, list)
+    error = Signal(str)
+    
+    def __init__(self, transcriber, audio_path, start, end, language, model_size, preset):
+        super().__init__()
+        self.transcriber = transcriber
+        self.audio_path = audio_path
+        self.start_time = start
+        self.end_time = end
+        self.language = language
+        self.model_size = model_size
+        self.preset = preset
+    
+    def run(self):
+        try:
+            self.progress.emit(f"Retranscrevendo {self.start_time:.2f}s - {self.end_time:.2f}s...")
+            lines = self.transcriber.transcribe_range(
+                self.audio_path, self.start_time, self.end_time,
+                self.language, self.model_size, self.preset
+            )
+            self.finished.emit(self.start_time, self.end_time, lines)
+            
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class JobQueueThread(QThread):
+    """Thread que transcreve os jobs da fila, um de cada vez."""
+    job_updated = Signal(str)
+    
+    def __init__(self, job_queue, transcriber):
+        super().__init__()
+        self.job_queue = job_queue
+        self.transcriber = transcriber
+    
+    def run(self):
+        while not self.isInterruptionRequested():
+            job = self.job_queue.next_job()
+            if job is None:
+                return
+            self.job_queue.process(
+                job, self.transcriber, on_progress=lambda job: self.job_updated.emit(job.id)
+            )
+            self.job_updated.emit(job.id)
+
+
+class RefinementThread(QThread):
+    """Thread para refinar o rascunho, trecho a trecho, em segundo plano."""
+    progress = Signal(str)
+    chunk_refined = Signal(float, float, list)
+    refined = Signal()                 # Todos os trechos refinados
+    error = Signal(str)
+    
+    def __init__(self, transcriber, audio_path, spans, language, model_size, preset):
+        super().__init__()
+        self.transcriber = transcriber
+        self.audio_path = audio_path
+        self.spans = spans
+        self.language = language
+        self.model_size = model_size
+        self.preset = preset
+    
+    def run(self):
+        try:
+            for number, (start, end) in enumerate(self.spans, 1):
+                if self.isInterruptionRequested():
+                    return
+                self.progress.emit(f"Refinando com {self.model_size}: trecho {number}/{len(self.spans)}")
+                lines = self.transcriber.transcribe_range(
+                    self.audio_path, start, end, self.language, self.model_size, self.preset
+                )
+                if self.isInterruptionRequested():
+                    return
+                self.chunk_refined.emit(start, end, lines)
+            
+            self.refined.emit()
+            
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class AlignmentThread(QThread):
+    """Thread para alinhar a letra conhecida ao áudio em background."""
+    progress = Signal(str)
+    finished = Signal(list)
+    error = Signal(str)
+    
+    def __init__(self, transcriber, audio_path, lines, language, model_size):
+        super().__init__()
+        self.transcriber = transcriber
+        self.audio_path = audio_path
+        self.lines = lines
+        self.language = language
+        self.model_size = model_size
+    
+    def run(self):
+        try:
+            self.progress.emit("Carregando modelo...")
+            if not self.transcriber.load_model(self.model_size):
+                self.error.emit("Falha ao carregar modelo do Whisper")
+                return
+            
+            self.progress.emit("Alinhando letra ao áudio...")
+            lines = self.transcriber.align(
+                self.audio_path, self.lines, self.language, self.model_size,
+                progress=lambda fraction: self.progress.emit(f"Alinhando... {fraction:.0%}")
+            )
+            
+            self.progress.emit("Alinhamento concluído!")
+            self.finished.emit(lines)
+            
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class CalibrationThread(QThread):
+    """Thread para medir a velocidade dos modelos instalados."""
+    progress = Signal(str)
+    finished = Signal(dict)
+    error = Signal(str)
+    
+    def __init__(self, transcriber, audio_path, language, preset):
+        super().__init__()
+        self.transcriber = transcriber
+        self.audio_path = audio_path
+        self.language = language
+        self.preset = preset
+    
+    def run(self):
+        try:
+            self.progress.emit("Calibrando velocidade dos modelos instalados...")
+            results = self.transcriber.calibrate(
+                self.audio_path, preset=self.preset, language=self.language,
+                progress=lambda model, rtf: self.progress.emit(f"{model}: {rtf:.3f}x tempo real")
+            )
+            self.finished.emit(results)
+            
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class AudioLoadThread(QThread):
+    """Thread para decodificar o áudio em background, bloco a bloco."""
+    playback_ready = Signal()          # Primeiros segundos prontos para tocar
+    progress = Signal(float)           # Segundos já decodificados
+    loaded = Signal()                  # Áudio inteiro decodificado
+    error = Signal(str)
+    
+    # Segundos em buffer antes de liberar a reprodução
+    PLAYBACK_BUFFER_SECONDS = 3.0
+    # Intervalo mínimo entre atualizações da prévia do waveform
+    PROGRESS_INTERVAL = 0.25
+    
+    def __init__(self, audio_player, waveform_generator, audio_path, player_lock):
+        super().__init__()
+        self.audio_player = audio_player
+        self.waveform_generator = waveform_generator
+        self.audio_path = audio_path
+        # O player é compartilhado com o próximo carregamento: cada escrita
+        # confere a interrupção sob este lock, o mesmo usado ao cancelar
+        self.player_lock = player_lock
+    
+    def run(self):
+        loader = AudioLoader(self.audio_path)
+        try:
+            loader.open()
+            with self.player_lock:
+                if self.isInterruptionRequested():
+                    return
+                self.audio_player.begin_loading(loader.sample_rate, loader.channels, loader.frames)
+            # Arquivos longos: só o resumo do waveform fica em memória
+            self.waveform_generator.begin_stream(
+                loader.sample_rate, loader.frames,
+                keep_samples=loader.duration <= WAVEFORM_KEEP_SAMPLES_MAX_DURATION,
+                audio_path=self.audio_path
+            )
+            
+            ready = False
+            last_progress = 0.0
+            for block in loader.blocks():
+                with self.player_lock:
+                    if self.isInterruptionRequested():
+                        return
+                    self.audio_player.append_block(block)
+                
+                self.waveform_generator.feed_block(block)
+                buffered = self.audio_player.get_buffered_duration()
+                
+                if not ready and buffered >= self.PLAYBACK_BUFFER_SECONDS:
+                    ready = True
+                    self.playback_ready.emit()
+                
+                now = time.monotonic()
+                if now - last_progress >= self.PROGRESS_INTERVAL:
+                    last_progress = now
+                    self.progress.emit(buffered)
+            
+            with self.player_lock:
+                if self.isInterruptionRequested():
+                    return
+                self.audio_player.finish_loading()
+            self.waveform_generator.end_stream()
+            
+            if not ready:
+                self.playback_ready.emit()
+            self.loaded.emit()
+            
+        except Exception as e:
+            with self.player_lock:
+                if not self.isInterruptionRequested():
+                    self.audio_player.finish_loading()
+            self.error.emit(str(e))
+        finally:
+            loader.close()
+
+
 class MainWindow(QMainWindow):
     """Janela principal do aplicativo."""
     
@@ -60,25 +325,51 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.project = SyncProject()
         self.transcriber = Transcriber()
+        # Fila e refinamento rodam junto com o editor: cada um tem o próprio
+        # transcritor, para não trocar o modelo (nem o áudio) do outro
+        self.job_transcriber = Transcriber()
+        self.refinement_transcriber = Transcriber()
+        remove_stale_caches()
         self.audio_player = AudioPlayer()
         self.waveform_generator = WaveformGenerator()
         self.project_io = ProjectIO()
         
-        # Thread de transcrição
+        # Threads de transcrição, alinhamento e de carregamento do áudio
         self.transcription_thread = None
+        self.alignment_thread = None
+        self.range_thread = None
+        self.audio_load_thread = None
+        self.audio_load_lock = threading.Lock()
+        
+        # Refinamento do rascunho em segundo plano
+        self.refinement_thread = None
+        self.refinement: Optional[DraftRefinement] = None
+        self.refinement_target = None  # (modelo, preset) após o rascunho
+        self.refinement_queue = []     # Trechos refinados aguardando encaixe
+        self.stopping_threads = []     # Threads canceladas ainda em execução
+        
+        # Pré-carregamento do modelo ao abrir o áudio
+        self.prefetch_thread = None
+        
+        # Fila de transcrição (persistente) e seu worker
+        self.job_queue = JobQueue()
+        self.job_thread = None
+        self.job_statuses = {}  # Último estado de cada job exibido no log
         
         # Estado da aplicação
         self.current_audio_path = ""
         self.is_playing = False
         self.guided_sync_mode = False
+        self.guided_sync: Optional[GuidedSync] = None
+        self.reaction_offset = GUIDED_SYNC_REACTION_OFFSET
+        self.preview_line_index = None  # Linha tocando em loop
         
         self.setup_ui()
         self.setup_connections()
         self.setup_autosave()
-        
-        # Configurar callbacks do audio player
-        self.audio_player.on_position_changed = self.on_audio_position_changed
-        self.audio_player.on_playback_finished = self.on_playback_finished
+        self.setup_position_timer()
+        self.setup_model_prefetch()
+        self.setup_job_queue()
     
     def setup_ui(self):
         """Configura a interface do usuário."""
@@ -148,6 +439,11 @@ class MainWindow(QMainWindow):
         
         file_menu.addSeparator()
         
+        import_action = QAction("Importar Letras...", self)
+        import_action.setShortcut(QKeySequence("Ctrl+I"))
+        import_action.triggered.connect(self.import_lyrics)
+        file_menu.addAction(import_action)
+        
         export_menu = file_menu.addMenu("Exportar")
         
         export_txt_action = QAction("Texto (TXT)", self)
@@ -205,6 +501,23 @@ class MainWindow(QMainWindow):
         guided_sync_action.triggered.connect(self.toggle_guided_sync)
         tools_menu.addAction(guided_sync_action)
         
+        tools_menu.addSeparator()
+        
+        calibrate_action = QAction("Calibrar Velocidade dos Modelos", self)
+        calibrate_action.triggered.connect(self.start_calibration)
+        tools_menu.addAction(calibrate_action)
+        
+        deadline_action = QAction("Escolher Modelo pelo Prazo...", self)
+        deadline_action.triggered.connect(self.choose_model_for_deadline)
+        tools_menu.addAction(deadline_action)
+        
+        tools_menu.addSeparator()
+        
+        queue_action = QAction("Fila de Transcrição", self)
+        queue_action.setShortcut(QKeySequence("Ctrl+J"))
+        queue_action.triggered.connect(self.show_job_queue)
+        tools_menu.addAction(queue_action)
+        
         # Menu Ajuda
         help_menu = menubar.addMenu("Ajuda")
         
@@ -250,9 +563,25 @@ class MainWindow(QMainWindow):
         self.model_combo = QComboBox()
         self.model_combo.addItems(["tiny", "base", "small", "medium", "large-v3"])
         self.model_combo.setCurrentText("base")
-        self.model_combo.setToolTip("tiny: Rápido, Baixa qualidade\nbase: Equilibrado\nsmall: Boa qualidade\nmedium: Muito boa qualidade\nlarge-v3: Excelente qualidade")
         transcribe_layout.addWidget(self.model_combo)
         
+        transcribe_layout.addWidget(QLabel("Preset:"))
+        self.preset_combo = QComboBox()
+        for preset, options in Transcriber.PRESETS.items():
+            self.preset_combo.addItem(options["name"], preset)
+        self.preset_combo.setCurrentIndex(self.preset_combo.findData(Transcriber.DEFAULT_PRESET))
+        self.preset_combo.setToolTip("Rascunho: Mais rápido (busca gulosa, VAD)\nEquilibrado: Padrão\nPreciso: Busca maior, sem quantização na CPU")
+        self.preset_combo.currentIndexChanged.connect(self.update_model_estimates)
+        transcribe_layout.addWidget(self.preset_combo)
+        self.update_model_estimates()
+        
+        self.two_pass_check = QCheckBox("Rascunho rápido")
+        self.two_pass_check.setToolTip(
+            f"Transcreve primeiro com o modelo {DRAFT_MODEL} para começar a editar logo;\n"
+            "o modelo escolhido refina em segundo plano as linhas não editadas"
+        )
+        transcribe_layout.addWidget(self.two_pass_check)
+        
         audio_layout.addLayout(transcribe_layout)
         
         # Botão transcrever
@@ -261,6 +590,13 @@ class MainWindow(QMainWindow):
         self.transcribe_btn.setEnabled(False)
         audio_layout.addWidget(self.transcribe_btn)
         
+        # Botão alinhar (letra já conhecida)
+        self.align_btn = QPushButton("Alinhar Letra")
+        self.align_btn.setToolTip("Encontra os tempos das linhas e palavras da letra atual sem alterar o texto")
+        self.align_btn.clicked.connect(self.start_alignment)
+        self.align_btn.setEnabled(False)
+        audio_layout.addWidget(self.align_btn)
+        
         # Barra de progresso
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
@@ -346,10 +682,8 @@ class MainWindow(QMainWindow):
         self.lines_table.capture_end_requested.connect(self.capture_end_time)
         self.lines_table.split_line_requested.connect(self.split_line)
         self.lines_table.merge_line_requested.connect(self.merge_line)
-        
-        # Audio player
-        self.audio_player.on_position_changed = self.on_audio_position_changed
-        self.audio_player.on_playback_finished = self.on_playback_finished
+        self.lines_table.preview_line_requested.connect(self.preview_line)
+        self.lines_table.retranscribe_requested.connect(self.retranscribe_lines)
     
     def setup_autosave(self):
         """Configura o sistema de autosave."""
@@ -357,6 +691,46 @@ class MainWindow(QMainWindow):
         self.autosave_timer.timeout.connect(self.autosave)
         self.autosave_timer.start(30000)  # 30 segundos
     
+    def setup_position_timer(self):
+        """
+        Configura o timer que consulta o relógio do player durante a
+        reprodução; a thread de áudio não chama a interface.
+        """
+        self.position_timer = QTimer()
+        self.position_timer.setInterval(POSITION_POLL_INTERVAL_MS)
+        self.position_timer.timeout.connect(self.poll_audio_position)
+    
+    def setup_model_prefetch(self):
+        """
+        Pré-carrega o modelo da primeira passada quando modelo, preset ou modo
+        mudam, depois de uma pausa para não carregar cada opção percorrida.
+        """
+        self.prefetch_timer = QTimer()
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(MODEL_PREFETCH_DELAY_MS)
+        self.prefetch_timer.timeout.connect(self.start_model_prefetch)
+        
+        self.model_combo.currentTextChanged.connect(self.schedule_model_prefetch)
+        self.preset_combo.currentIndexChanged.connect(self.schedule_model_prefetch)
+        self.two_pass_check.toggled.connect(self.schedule_model_prefetch)
+    
+    def setup_job_queue(self):
+        """
+        Painel da fila de transcrição. Jobs pendentes de uma sessão anterior
+        voltam a rodar logo na abertura.
+        """
+        self.job_queue_widget = JobQueueWidget(self.job_queue)
+        self.job_queue_widget.add_requested.connect(self.add_jobs)
+        self.job_queue_widget.open_requested.connect(self.open_job_result)
+        self.job_queue_widget.queue_changed.connect(self.start_job_worker)
+        
+        self.job_queue_dock = QDockWidget("Fila de Transcrição", self)
+        self.job_queue_dock.setWidget(self.job_queue_widget)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.job_queue_dock)
+        self.job_queue_dock.setVisible(self.job_queue.has_pending())
+        
+        self.start_job_worker()
+    
     def log_message(self, message: str):
         """Adiciona mensagem ao log."""
         self.status_log.append(f"[{self.get_current_time()}] {message}")
@@ -378,34 +752,95 @@ class MainWindow(QMainWindow):
             self.load_audio(file_path)
     
     def load_audio(self, file_path: str):
-        """Carrega arquivo de áudio."""
+        """Carrega arquivo de áudio em background, mostrando o waveform aos poucos."""
         self.log_message(f"Carregando áudio: {os.path.basename(file_path)}")
         
-        # Carregar no audio player
-        if not self.audio_player.load_audio(file_path):
-            QMessageBox.critical(self, "Erro", "Falha ao carregar arquivo de áudio")
-            return
-        
-        # Gerar waveform
-        if not self.waveform_generator.load_audio(file_path):
-            QMessageBox.critical(self, "Erro", "Falha ao gerar waveform")
-            return
+        # Abrir outro arquivo cancela o carregamento e o refinamento em andamento
+        self.cancel_audio_loading()
+        self.cancel_refinement()
+        # Gerador novo: o anterior pode continuar em uso pela visualização
+        self.waveform_generator = WaveformGenerator()
         
-        # Atualizar interface
-        waveform_data, duration, sample_rate = self.waveform_generator.get_waveform_data()
-        self.waveform_widget.load_waveform(waveform_data, duration, sample_rate)
+        self.is_playing = False
+        self.preview_line_index = None
+        self.waveform_widget.set_playing(False)
+        self.waveform_widget.play_button.setEnabled(False)
         
-        # Atualizar projeto
+        # Atualizar projeto (a transcrição lê direto do arquivo)
         self.project.audio_path = file_path
         self.current_audio_path = file_path
         
         # Atualizar status
-        self.audio_status_label.setText(f"Áudio: {os.path.basename(file_path)}")
+        self.audio_status_label.setText(f"Carregando: {os.path.basename(file_path)}")
         self.transcribe_btn.setEnabled(True)
+        self.align_btn.setEnabled(True)
+        
+        self.audio_load_thread = AudioLoadThread(
+            self.audio_player, self.waveform_generator, file_path, self.audio_load_lock
+        )
+        self.audio_load_thread.playback_ready.connect(self.on_audio_playback_ready)
+        self.audio_load_thread.progress.connect(self.on_audio_load_progress)
+        self.audio_load_thread.loaded.connect(self.on_audio_load_finished)
+        self.audio_load_thread.error.connect(self.on_audio_load_error)
+        self.audio_load_thread.start()
+        
+        # Deixar o modelo pronto enquanto o usuário ouve o áudio
+        self.start_model_prefetch()
         
-        self.log_message("Áudio carregado com sucesso!")
         self.mark_project_modified()
     
+    def cancel_audio_loading(self):
+        """Interrompe o carregamento de áudio em andamento, se houver."""
+        thread = self.audio_load_thread
+        if thread is None:
+            return
+        
+        self.audio_load_thread = None
+        # Sem esperar a decodificação: sob o lock, a thread antiga não volta a
+        # escrever no player, e os sinais já enfileirados são ignorados nos slots
+        with self.audio_load_lock:
+            thread.requestInterruption()
+        self.stopping_threads = [t for t in self.stopping_threads if t.isRunning()] + [thread]
+        self.audio_player.stop()
+    
+    def is_current_audio_load(self) -> bool:
+        """Verifica se o sinal recebido veio do carregamento atual."""
+        return self.sender() is self.audio_load_thread
+    
+    def on_audio_playback_ready(self):
+        """Chamado quando os primeiros segundos do áudio estão prontos."""
+        if self.is_current_audio_load():
+            self.waveform_widget.play_button.setEnabled(True)
+    
+    def on_audio_load_progress(self, seconds: float):
+        """Atualiza a prévia do waveform durante o carregamento."""
+        if not self.is_current_audio_load():
+            return
+        
+        preview, duration, preview_rate = self.waveform_generator.get_preview_data()
+        if preview is not None:
+            self.waveform_widget.load_waveform(preview, duration, preview_rate, keep_view=True)
+    
+    def on_audio_load_finished(self):
+        """Chamado quando todo o áudio foi decodificado."""
+        if not self.is_current_audio_load():
+            return
+        
+        self.waveform_widget.load_generator(self.waveform_generator, keep_view=True)
+        
+        self.audio_status_label.setText(f"Áudio: {os.path.basename(self.current_audio_path)}")
+        self.log_message("Áudio carregado com sucesso!")
+        self.update_model_estimates()
+    
+    def on_audio_load_error(self, error_message: str):
+        """Chamado quando há erro no carregamento do áudio."""
+        if not self.is_current_audio_load():
+            return
+        
+        self.audio_status_label.setText("Nenhum áudio carregado")
+        QMessageBox.critical(self, "Erro", f"Falha ao carregar arquivo de áudio:\n{error_message}")
+        self.log_message(f"Erro: {error_message}")
+    
     def start_transcription(self):
         """Inicia processo de transcrição."""
         if not self.current_audio_path:
@@ -418,22 +853,33 @@ class MainWindow(QMainWindow):
                                self.transcriber.get_ffmpeg_instructions())
             return
         
+        # Uma nova transcrição substitui o rascunho em refinamento
+        self.cancel_refinement()
+        
         # Configurar interface
         self.transcribe_btn.setEnabled(False)
+        self.align_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminado
         
         # Obter configurações
         language = self.language_combo.currentText()
         model_size = self.model_combo.currentText()
+        preset = self.preset_combo.currentData()
         
         # Atualizar projeto
         self.project.language = language
         self.project.model_size = model_size
+        self.project.preset = preset
+        
+        # Duas passadas: rascunho com o modelo rápido, refinamento depois
+        draft_model, draft_preset = self.first_pass_model()
+        if (draft_model, draft_preset) != (model_size, preset):
+            self.refinement_target = (model_size, preset)
         
         # Iniciar thread de transcrição
         self.transcription_thread = TranscriptionThread(
-            self.transcriber, self.current_audio_path, language, model_size
+            self.transcriber, self.current_audio_path, language, draft_model, draft_preset
         )
         self.transcription_thread.progress.connect(self.log_message)
         self.transcription_thread.finished.connect(self.on_transcription_finished)
@@ -444,6 +890,7 @@ class MainWindow(QMainWindow):
         """Chamado quando transcrição termina."""
         self.progress_bar.setVisible(False)
         self.transcribe_btn.setEnabled(True)
+        self.align_btn.setEnabled(True)
         
         # Atualizar projeto
         self.project.lines = lines
@@ -456,11 +903,434 @@ class MainWindow(QMainWindow):
         
         self.log_message(f"Transcrição concluída! {len(lines)} linhas geradas.")
         self.mark_project_modified()
+        
+        if self.refinement_target is not None:
+            self.start_refinement(lines)
+    
+    def first_pass_model(self) -> tuple:
+        """(modelo, preset) da primeira passada da transcrição."""
+        model_size = self.model_combo.currentText()
+        if self.two_pass_check.isChecked() and model_size != DRAFT_MODEL:
+            return DRAFT_MODEL, DRAFT_PRESET
+        return model_size, self.preset_combo.currentData()
+    
+    def schedule_model_prefetch(self):
+        """Troca o pré-carregamento em andamento pelo da nova configuração."""
+        self.cancel_model_prefetch()
+        if self.current_audio_path:
+            self.prefetch_timer.start()
+    
+    def start_model_prefetch(self):
+        """Carrega em segundo plano o modelo que "Transcrever" vai usar."""
+        self.cancel_model_prefetch()
+        
+        if not self.current_audio_path:
+            return
+        
+        model_size, preset = self.first_pass_model()
+        self.prefetch_thread = ModelPrefetchThread(
+            self.transcriber, self.current_audio_path, model_size, preset
+        )
+        self.prefetch_thread.finished.connect(self.on_model_prefetched)
+        self.prefetch_thread.start(QThread.LowPriority)
+    
+    def cancel_model_prefetch(self):
+        """
+        Descarta o pré-carregamento em andamento. Um modelo já sendo
+        carregado termina de carregar; o próximo ``load_model`` espera por ele.
+        """
+        self.prefetch_timer.stop()
+        
+        thread = self.prefetch_thread
+        if thread is None:
+            return
+        
+        self.prefetch_thread = None
+        thread.requestInterruption()
+        self.stopping_threads = [t for t in self.stopping_threads if t.isRunning()] + [thread]
+    
+    def on_model_prefetched(self, model_size: str):
+        """Chamado quando o modelo pré-carregado está pronto."""
+        if self.sender() is self.prefetch_thread:
+            self.log_message(f"Modelo {model_size} carregado e pronto para transcrever")
+    
+    def show_job_queue(self):
+        """Mostra o painel da fila de transcrição."""
+        self.job_queue_dock.show()
+        self.job_queue_dock.raise_()
+    
+    def add_jobs(self):
+        """Adiciona áudios à fila com o idioma, modelo e preset atuais."""
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self, "Adicionar Áudios à Fila", "",
+            "Arquivos de Áudio (*.wav *.mp3 *.m4a *.flac *.ogg);;Todos os Arquivos (*)"
+        )
+        if not file_paths:
+            return
+        
+        for file_path in file_paths:
+            self.job_queue.add(
+                file_path, self.language_combo.currentText(),
+                self.model_combo.currentText(), self.preset_combo.currentData()
+            )
+        self.log_message(f"{len(file_paths)} áudio(s) adicionado(s) à fila")
+        self.refresh_job_queue()
+        self.start_job_worker()
+    
+    def start_job_worker(self):
+        """Inicia o worker da fila se há jobs pendentes e ele está parado."""
+        if self.job_thread is not None and self.job_thread.isRunning():
+            return
+        if not self.job_queue.has_pending():
+            return
+        
+        self.job_thread = JobQueueThread(self.job_queue, self.job_transcriber)
+        self.job_thread.job_updated.connect(self.on_job_updated)
+        self.job_thread.finished.connect(self.on_job_worker_finished)
+        self.job_thread.start(QThread.LowPriority)
+    
+    def predict_job_duration(self, job) -> Optional[float]:
+        """Duração prevista de um job pelo RTF medido (None sem medição)."""
+        if not job.duration:
+            return None
+        return self.transcriber.predict_duration(job.model_size, job.duration, job.preset)
+    
+    def refresh_job_queue(self):
+        """Atualiza o painel da fila com progresso e previsões."""
+        self.job_queue_widget.refresh(self.job_queue.remaining_times(self.predict_job_duration))
+    
+    def on_job_updated(self, job_id: str):
+        """Chamado quando um job muda de estado ou avança."""
+        self.refresh_job_queue()
+        
+        job = self.job_queue.get(job_id)
+        if job is None or self.job_statuses.get(job_id) == job.status:
+            return
+        
+        self.job_statuses[job_id] = job.status
+        if job.status == job.DONE:
+            self.log_message(f"Fila: {job.name} transcrito ({len(job.lines)} linhas)")
+        elif job.status == job.FAILED:
+            self.log_message(f"Fila: erro em {job.name}: {job.error}")
+    
+    def on_job_worker_finished(self):
+        """Chamado quando o worker da fila para."""
+        self.refresh_job_queue()
+        # Jobs devolvidos à fila enquanto o worker terminava
+        if self.sender() is self.job_thread:
+            self.start_job_worker()
+    
+    def open_job_result(self, job_id: str):
+        """Abre no editor o resultado de um job concluído."""
+        job = self.job_queue.get(job_id)
+        if job is None or job.status != job.DONE:
+            return
+        
+        if self.has_unsaved_changes():
+            reply = QMessageBox.question(
+                self, "Projeto não salvo",
+                "Deseja salvar as alterações antes de abrir o resultado?",
+                QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel
+            )
+            
+            if reply == QMessageBox.Save:
+                if not self.save_project():
+                    return
+            elif reply == QMessageBox.Cancel:
+                return
+        
+        self.load_project(job.to_project(), None)
+        self.mark_project_modified()
+    
+    def start_refinement(self, draft_lines: list):
+        """Refina o rascunho em segundo plano com o modelo escolhido."""
+        model_size, preset = self.refinement_target
+        self.refinement_target = None
+        
+        duration = self.audio_player.get_duration() or max((line.end for line in draft_lines), default=0.0)
+        if duration <= 0:
+            return
+        
+        self.refinement = DraftRefinement(draft_lines)
+        self.refinement_queue = []
+        spans = self.refinement.spans(duration)
+        
+        # O áudio já decodificado pelo rascunho não é decodificado de novo
+        self.refinement_transcriber.share_audio(self.transcriber)
+        self.refinement_thread = RefinementThread(
+            self.refinement_transcriber, self.current_audio_path, spans,
+            self.project.language, model_size, preset
+        )
+        self.refinement_thread.progress.connect(self.on_refinement_progress)
+        self.refinement_thread.chunk_refined.connect(self.on_chunk_refined)
+        self.refinement_thread.refined.connect(self.on_refinement_finished)
+        self.refinement_thread.error.connect(self.on_refinement_error)
+        self.refinement_thread.start(QThread.LowPriority)
+        
+        self.log_message(f"Rascunho pronto para edição; refinando com {model_size} em segundo plano...")
+    
+    def cancel_refinement(self):
+        """Interrompe o refinamento em andamento, se houver."""
+        self.refinement_target = None
+        self.refinement = None
+        self.refinement_queue = []
+        
+        thread = self.refinement_thread
+        if thread is None:
+            return
+        
+        self.refinement_thread = None
+        # Não espera o trecho atual; sinais da thread antiga são ignorados nos slots
+        thread.requestInterruption()
+        self.stopping_threads = [t for t in self.stopping_threads if t.isRunning()] + [thread]
+    
+    def is_current_refinement(self) -> bool:
+        """Verifica se o sinal recebido veio do refinamento atual."""
+        return self.sender() is self.refinement_thread
+    
+    def on_refinement_progress(self, message: str):
+        """Mostra o andamento do refinamento."""
+        if self.is_current_refinement():
+            self.log_message(message)
+    
+    def on_chunk_refined(self, start: float, end: float, lines: list):
+        """Guarda um trecho refinado para encaixar no projeto."""
+        if not self.is_current_refinement():
+            return
+        self.refinement_queue.append((start, end, lines))
+        self.apply_refinements()
+    
+    def apply_refinements(self):
+        """
+        Encaixa os trechos refinados pendentes. Espera o usuário terminar de
+        editar uma célula ou a sincronização guiada, que dependem dos índices.
+        """
+        if self.refinement is None or not self.refinement_queue:
+            return
+        
+        if (self.lines_table.table.state() == QAbstractItemView.EditingState
+                or self.guided_sync_mode):
+            QTimer.singleShot(500, self.apply_refinements)
+            return
+        
+        current = self.lines_table.get_current_line()
+        count = 0
+        for start, end, lines in self.refinement_queue:
+            count += self.refinement.merge(self.project, start, end, lines)
+        self.refinement_queue = []
+        
+        self.lines_table.set_lines(self.project.lines)
+        self.waveform_widget.update_lines(self.project.lines)
+        if current is not None and current in self.project.lines:
+            self.lines_table.select_line(self.project.lines.index(current))
+        
+        if count:
+            self.mark_project_modified()
+    
+    def on_refinement_finished(self):
+        """Chamado quando todos os trechos foram refinados."""
+        if self.is_current_refinement():
+            self.log_message("Refinamento concluído.")
+    
+    def on_refinement_error(self, error_message: str):
+        """Chamado quando há erro no refinamento (o rascunho continua valendo)."""
+        if self.is_current_refinement():
+            self.log_message(f"Erro no refinamento: {error_message}")
+    
+    def start_alignment(self):
+        """Alinha as linhas atuais ao áudio (alinhamento forçado)."""
+        if not self.current_audio_path:
+            QMessageBox.warning(self, "Aviso", "Nenhum áudio carregado")
+            return
+        if not self.project.get_non_empty_lines():
+            QMessageBox.warning(self, "Aviso", "Adicione ou importe a letra antes de alinhar")
+            return
+        
+        self.transcribe_btn.setEnabled(False)
+        self.align_btn.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)
+        
+        language = self.language_combo.currentText()
+        model_size = self.model_combo.currentText()
+        self.project.language = language
+        self.project.model_size = model_size
+        
+        self.alignment_thread = AlignmentThread(
+            self.transcriber, self.current_audio_path, list(self.project.lines),
+            language, model_size
+        )
+        self.alignment_thread.progress.connect(self.log_message)
+        self.alignment_thread.finished.connect(self.on_alignment_finished)
+        self.alignment_thread.error.connect(self.on_transcription_error)
+        self.alignment_thread.start()
+    
+    def on_alignment_finished(self, aligned: list):
+        """Aplica os tempos alinhados às linhas cujo texto não mudou no meio tempo."""
+        self.progress_bar.setVisible(False)
+        self.transcribe_btn.setEnabled(True)
+        self.align_btn.setEnabled(True)
+        
+        updated = []
+        for i, (line, result) in enumerate(zip(self.project.lines, aligned)):
+            if line.text == result.text and result.words:
+                line.start = result.start
+                line.end = result.end
+                line.words = result.words
+                updated.append(i)
+        
+        self.lines_table.update_rows(updated)
+        self.waveform_widget.update_lines(self.project.lines)
+        
+        self.log_message(f"Alinhamento concluído! {len(updated)} linhas sincronizadas.")
+        self.mark_project_modified()
+    
+    def retranscribe_lines(self, first: int, last: int):
+        """Retranscreve só o trecho coberto pelas linhas ``first`` a ``last``."""
+        if not self.current_audio_path:
+            QMessageBox.warning(self, "Aviso", "Nenhum áudio carregado")
+            return
+        if not (0 <= first <= last < len(self.project.lines)):
+            return
+        # O resultado de outra tarefa ainda vai substituir as linhas
+        task = self.running_line_task()
+        if task:
+            QMessageBox.warning(self, "Aviso", f"Aguarde {task} terminar antes de retranscrever um trecho")
+            return
+        
+        start = self.project.lines[first].start
+        end = max(line.end for line in self.project.lines[first:last + 1])
+        if end <= start:
+            QMessageBox.warning(self, "Aviso", "As linhas selecionadas não têm tempos válidos")
+            return
+        
+        self.transcribe_btn.setEnabled(False)
+        self.align_btn.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)
+        
+        self.range_thread = RangeTranscriptionThread(
+            self.transcriber, self.current_audio_path, start, end,
+            self.language_combo.currentText(), self.model_combo.currentText(),
+            self.preset_combo.currentData()
+        )
+        self.range_thread.progress.connect(self.log_message)
+        self.range_thread.finished.connect(self.on_range_transcription_finished)
+        self.range_thread.error.connect(self.on_transcription_error)
+        self.range_thread.start()
+    
+    def running_line_task(self) -> Optional[str]:
+        """Descrição da tarefa em segundo plano que altera as linhas, se houver."""
+        tasks = (
+            (self.transcription_thread, "a transcrição"),
+            (self.alignment_thread, "o alinhamento"),
+            (self.refinement_thread, "o refinamento"),
+            (self.range_thread, "a retranscrição em andamento"),
+        )
+        for thread, description in tasks:
+            if thread is not None and thread.isRunning():
+                return description
+        return None
+    
+    def on_range_transcription_finished(self, start: float, end: float, lines: list):
+        """Encaixa as linhas retranscritas no projeto, preservando as vizinhas."""
+        self.progress_bar.setVisible(False)
+        self.transcribe_btn.setEnabled(True)
+        self.align_btn.setEnabled(True)
+        
+        index, count = self.project.replace_range(start, end, lines)
+        self.lines_table.set_lines(self.project.lines)
+        self.waveform_widget.update_lines(self.project.lines)
+        if count:
+            self.lines_table.select_line(index)
+        
+        self.log_message(f"Trecho {start:.2f}s - {end:.2f}s retranscrito: {count} linhas.")
+        self.mark_project_modified()
+    
+    def update_model_estimates(self):
+        """Mostra no seletor de modelo a qualidade e a duração prevista para o áudio atual."""
+        preset = self.preset_combo.currentData()
+        duration = self.audio_player.get_duration()
+        
+        tips = []
+        for index in range(self.model_combo.count()):
+            model_size = self.model_combo.itemText(index)
+            info = self.transcriber.get_model_info(model_size, preset)
+            tip = f"{model_size}: Qualidade {info.get('quality', '?')}, {info.get('size', '?')}"
+            if info.get("rtf") is None:
+                tip += " (velocidade não calibrada)"
+            elif duration:
+                tip += f", {format_duration(info['rtf'] * duration)} para este áudio"
+            else:
+                tip += f", {info['rtf']:.2f}x tempo real"
+            self.model_combo.setItemData(index, tip, Qt.ToolTipRole)
+            tips.append(tip)
+        self.model_combo.setToolTip("\n".join(tips))
+    
+    def start_calibration(self):
+        """Mede a velocidade dos modelos instalados no início do áudio atual."""
+        if not self.current_audio_path:
+            QMessageBox.warning(self, "Aviso", "Carregue um áudio para usar como referência")
+            return
+        
+        self.transcribe_btn.setEnabled(False)
+        self.align_btn.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)
+        
+        self.calibration_thread = CalibrationThread(
+            self.transcriber, self.current_audio_path,
+            self.language_combo.currentText(), self.preset_combo.currentData()
+        )
+        self.calibration_thread.progress.connect(self.log_message)
+        self.calibration_thread.finished.connect(self.on_calibration_finished)
+        self.calibration_thread.error.connect(self.on_transcription_error)
+        self.calibration_thread.start()
+    
+    def on_calibration_finished(self, results: dict):
+        """Chamado quando a calibração termina."""
+        self.progress_bar.setVisible(False)
+        self.transcribe_btn.setEnabled(True)
+        self.align_btn.setEnabled(True)
+        
+        self.update_model_estimates()
+        if results:
+            self.log_message(f"Calibração concluída: {len(results)} modelos medidos.")
+        else:
+            self.log_message("Nenhum modelo instalado para calibrar.")
+    
+    def choose_model_for_deadline(self):
+        """Seleciona o melhor modelo que termina a transcrição dentro de um prazo."""
+        duration = self.audio_player.get_duration()
+        if not duration:
+            QMessageBox.warning(self, "Aviso", "Nenhum áudio carregado")
+            return
+        
+        minutes, ok = QInputDialog.getDouble(
+            self, "Escolher Modelo pelo Prazo",
+            "Tempo disponível para a transcrição (minutos):", 5.0, 0.1, 600.0, 1
+        )
+        if not ok:
+            return
+        
+        preset = self.preset_combo.currentData()
+        model_size = self.transcriber.choose_model(duration, minutes * 60, preset)
+        if model_size is None:
+            QMessageBox.information(
+                self, "Escolher Modelo pelo Prazo",
+                "Nenhum modelo calibrado. Use Ferramentas > Calibrar Velocidade dos Modelos."
+            )
+            return
+        
+        self.model_combo.setCurrentText(model_size)
+        estimate = self.transcriber.predict_duration(model_size, duration, preset)
+        self.log_message(f"Modelo {model_size} selecionado: {format_duration(estimate)} previstos")
     
     def on_transcription_error(self, error_message: str):
         """Chamado quando há erro na transcrição."""
         self.progress_bar.setVisible(False)
         self.transcribe_btn.setEnabled(True)
+        self.align_btn.setEnabled(True)
         
         QMessageBox.critical(self, "Erro na Transcrição", error_message)
         self.log_message(f"Erro: {error_message}")
@@ -473,9 +1343,12 @@ class MainWindow(QMainWindow):
         if self.is_playing:
             self.audio_player.pause()
             self.is_playing = False
+            self.position_timer.stop()
+            self.on_audio_position_changed(self.audio_player.get_position())
         else:
             self.audio_player.play()
             self.is_playing = True
+            self.position_timer.start()
         
         self.waveform_widget.set_playing(self.is_playing)
     
@@ -483,6 +1356,18 @@ class MainWindow(QMainWindow):
         """Vai para posição específica no áudio."""
         self.audio_player.seek(position)
     
+    def poll_audio_position(self):
+        """Atualiza o cursor com a posição audível (timer na taxa da tela)."""
+        if not self.is_playing:
+            self.position_timer.stop()
+            return
+        
+        self.on_audio_position_changed(self.audio_player.get_position())
+        
+        # O player chegou ao fim do áudio
+        if not self.audio_player.is_playing:
+            self.on_playback_finished()
+    
     def on_audio_position_changed(self, position: float):
         """Chamado quando posição do áudio muda."""
         self.waveform_widget.set_position(position)
@@ -490,6 +1375,7 @@ class MainWindow(QMainWindow):
     def on_playback_finished(self):
         """Chamado quando reprodução termina."""
         self.is_playing = False
+        self.position_timer.stop()
         self.waveform_widget.set_playing(False)
     
     def on_position_changed(self, position: float):
@@ -501,6 +1387,7 @@ class MainWindow(QMainWindow):
         if 0 <= line_index < len(self.project.lines):
             self.project.lines[line_index] = line
             self.waveform_widget.update_lines(self.project.lines)
+            self.refresh_line_preview(line_index)
             self.mark_project_modified()
     
     def on_line_selected(self, line_index: int):
@@ -512,8 +1399,9 @@ class MainWindow(QMainWindow):
         current_position = self.audio_player.get_position()
         if 0 <= line_index < len(self.project.lines):
             self.project.lines[line_index].start = current_position
-            self.lines_table.update_table()
+            self.lines_table.update_rows([line_index])
             self.waveform_widget.update_lines(self.project.lines)
+            self.refresh_line_preview(line_index)
             self.mark_project_modified()
     
     def capture_end_time(self, line_index: int):
@@ -521,10 +1409,65 @@ class MainWindow(QMainWindow):
         current_position = self.audio_player.get_position()
         if 0 <= line_index < len(self.project.lines):
             self.project.lines[line_index].end = current_position
-            self.lines_table.update_table()
+            self.lines_table.update_rows([line_index])
             self.waveform_widget.update_lines(self.project.lines)
+            self.refresh_line_preview(line_index)
             self.mark_project_modified()
     
+    def preview_line(self, line_index: int):
+        """
+        Toca a linha em loop, com margens antes e depois; pedir o preview
+        da mesma linha de novo desliga o loop.
+        """
+        if not self.audio_player.is_audio_loaded():
+            return
+        if not 0 <= line_index < len(self.project.lines):
+            return
+        
+        if self.preview_line_index == line_index:
+            self.stop_line_preview()
+            return
+        
+        self.preview_line_index = line_index
+        loop_start = self.refresh_line_preview(line_index)
+        if loop_start is None:
+            self.preview_line_index = None
+            return
+        
+        self.audio_player.seek(loop_start)
+        if not self.is_playing:
+            self.toggle_playback()
+        
+        self.waveform_widget.highlight_line(line_index)
+        self.log_message(f"Repetindo linha {line_index + 1} (clique de novo ou Esc para parar)")
+    
+    def refresh_line_preview(self, line_index: int) -> Optional[float]:
+        """
+        Reaplica o loop se ``line_index`` é a linha em preview (ex.: tempos
+        editados), sem interromper a reprodução.
+        
+        Returns:
+            Início do loop em segundos, ou None se não há loop
+        """
+        if line_index != self.preview_line_index:
+            return None
+        
+        line = self.project.lines[line_index]
+        if line.end <= line.start:
+            return None
+        
+        loop_start = max(0.0, line.start - PREVIEW_PRE_ROLL)
+        self.audio_player.set_loop(loop_start, line.end + PREVIEW_POST_ROLL)
+        return loop_start
+    
+    def stop_line_preview(self):
+        """Desliga o loop da linha; a reprodução continua normalmente."""
+        if self.preview_line_index is None:
+            return
+        self.preview_line_index = None
+        self.audio_player.clear_loop()
+        self.log_message("Repetição de linha desativada")
+    
     def split_line(self, line_index: int):
         """Divide uma linha."""
         if 0 <= line_index < len(self.project.lines):
@@ -550,6 +1493,31 @@ class MainWindow(QMainWindow):
         self.mark_project_modified()
         QMessageBox.information(self, "Normalização", "Tempos normalizados com sucesso!")
     
+    def import_lyrics(self):
+        """Importa linhas já sincronizadas (SRT, VTT, LRC ou JSON)."""
+        patterns = " ".join(f"*{info['extension']}" for info in Importer.FORMATS.values())
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Importar Letras", "",
+            f"Letras e Legendas ({patterns});;Todos os Arquivos (*)"
+        )
+        
+        if not file_path:
+            return
+        
+        try:
+            lines = Importer.import_lines(file_path)
+        except ImporterError as e:
+            QMessageBox.critical(self, "Erro na Importação", str(e))
+            return
+        
+        # Atualizar projeto
+        self.project.lines = lines
+        self.lines_table.set_lines(lines)
+        self.waveform_widget.update_lines(lines)
+        
+        self.log_message(f"Importadas {len(lines)} linhas de {os.path.basename(file_path)}")
+        self.mark_project_modified()
+    
     def export_format(self, format_type: str):
         """Exporta para formato específico."""
         if not self.project.lines:
@@ -636,6 +1604,7 @@ class MainWindow(QMainWindow):
                 return
         
         # Limpar projeto
+        self.cancel_refinement()
         self.project = SyncProject()
         self.current_audio_path = ""
         self.lines_table.clear_lines()
@@ -644,6 +1613,7 @@ class MainWindow(QMainWindow):
         # Resetar interface
         self.audio_status_label.setText("Nenhum áudio carregado")
         self.transcribe_btn.setEnabled(False)
+        self.align_btn.setEnabled(False)
         self.project_status_label.setText("Projeto não salvo")
         
         self.log_message("Novo projeto criado")
@@ -675,27 +1645,32 @@ class MainWindow(QMainWindow):
             else:
                 QMessageBox.critical(self, "Erro", "Falha ao carregar projeto")
     
-    def load_project(self, project: SyncProject, file_path: str):
-        """Carrega projeto na interface."""
+    def load_project(self, project: SyncProject, file_path: Optional[str]):
+        """Carrega projeto na interface (``file_path`` None: projeto ainda não salvo)."""
+        self.cancel_refinement()
         self.project = project
         self.project_io.current_project_path = file_path
         
+        # Atualizar configurações (antes do áudio, que pré-carrega o modelo)
+        self.language_combo.setCurrentText(project.language)
+        self.model_combo.setCurrentText(project.model_size)
+        self.preset_combo.setCurrentIndex(max(0, self.preset_combo.findData(project.preset)))
+        
         # Carregar áudio se existir
         if project.audio_path and os.path.exists(project.audio_path):
             self.load_audio(project.audio_path)
         
-        # Atualizar configurações
-        self.language_combo.setCurrentText(project.language)
-        self.model_combo.setCurrentText(project.model_size)
-        
         # Atualizar linhas
         self.lines_table.set_lines(project.lines)
         self.waveform_widget.update_lines(project.lines)
         
         # Atualizar status
-        self.project_status_label.setText(f"Projeto: {os.path.basename(file_path)}")
-        
-        self.log_message(f"Projeto carregado: {os.path.basename(file_path)}")
+        if file_path:
+            self.project_status_label.setText(f"Projeto: {os.path.basename(file_path)}")
+            self.log_message(f"Projeto carregado: {os.path.basename(file_path)}")
+        else:
+            self.project_status_label.setText("Projeto não salvo")
+            self.log_message(f"Transcrição de {os.path.basename(project.audio_path)} aberta")
     
     def save_project(self) -> bool:
         """Salva projeto atual."""
@@ -745,18 +1720,68 @@ class MainWindow(QMainWindow):
     
     def toggle_guided_sync(self):
         """Alterna modo de sincronização guiada."""
-        self.guided_sync_mode = not self.guided_sync_mode
-        
         if self.guided_sync_mode:
-            QMessageBox.information(
-                self, "Sincronização Guiada",
-                "Modo de sincronização guiada ativado.\n\n"
-                "• Pressione Enter para capturar início da linha\n"
-                "• Pressione Enter novamente para capturar fim\n"
-                "• O áudio tocará automaticamente"
-            )
-        else:
+            self.stop_guided_sync()
             QMessageBox.information(self, "Sincronização Guiada", "Modo de sincronização guiada desativado.")
+            return
+        
+        if not self.audio_player.is_audio_loaded() or not self.project.lines:
+            QMessageBox.warning(self, "Sincronização Guiada",
+                                "Carregue um áudio e adicione as linhas da letra primeiro.")
+            return
+        
+        QMessageBox.information(
+            self, "Sincronização Guiada",
+            "Modo de sincronização guiada ativado.\n\n"
+            "• Pressione Enter no início de cada linha (a anterior termina junto)\n"
+            "• Shift+Enter marca o fim da linha antes de uma pausa\n"
+            "• Backspace desfaz a última marcação\n"
+            "• O áudio tocará automaticamente"
+        )
+        
+        # Começar na linha selecionada
+        start_index = max(0, self.lines_table.table.currentRow())
+        self.guided_sync = GuidedSync(self.project, self.reaction_offset)
+        self.guided_sync.start(start_index)
+        self.guided_sync_mode = True
+        self.lines_table.select_line(start_index)
+        
+        if not self.is_playing:
+            self.toggle_playback()
+        self.log_message(f"Sincronização guiada a partir da linha {start_index + 1}")
+    
+    def stop_guided_sync(self):
+        """Encerra a sessão e oferece o atraso de reação medido nela."""
+        self.guided_sync_mode = False
+        engine, self.guided_sync = self.guided_sync, None
+        if engine is None:
+            return
+        engine.stop()
+        
+        offset = engine.estimate_reaction_offset()
+        if offset is None or abs(offset - self.reaction_offset) < 0.005:
+            return
+        reply = QMessageBox.question(
+            self, "Calibrar Atraso de Reação",
+            f"Seus toques ficaram em média {offset * 1000:.0f} ms após os tempos "
+            f"existentes das linhas.\n\nUsar esse valor como atraso de reação "
+            f"(atual: {self.reaction_offset * 1000:.0f} ms)?"
+        )
+        if reply == QMessageBox.Yes:
+            self.reaction_offset = offset
+            self.log_message(f"Atraso de reação calibrado: {offset * 1000:.0f} ms")
+    
+    def apply_guided_sync_marks(self, indices: list):
+        """Reflete na interface as linhas marcadas na sincronização guiada."""
+        if not indices:
+            return
+        self.lines_table.update_rows(indices)
+        self.waveform_widget.update_lines(self.project.lines)
+        
+        current = self.guided_sync.current_line
+        if current is not None:
+            self.lines_table.select_line(current)
+        self.mark_project_modified()
     
     def show_about(self):
         """Mostra diálogo sobre."""
@@ -770,12 +1795,24 @@ class MainWindow(QMainWindow):
     
     def keyPressEvent(self, event):
         """Trata eventos de teclado."""
+        # Tempo do toque lido antes de qualquer outro trabalho
+        timestamp = self.audio_player.get_position()
+        
         if event.key() == Qt.Key_Space:
             self.toggle_playback()
-        elif event.key() == Qt.Key_Return or event.key() == Qt.Key_Enter:
-            if self.guided_sync_mode:
-                # Implementar lógica de sincronização guiada
-                pass
+        elif event.key() == Qt.Key_Escape and self.preview_line_index is not None:
+            self.stop_line_preview()
+        elif event.key() in (Qt.Key_Return, Qt.Key_Enter) and self.guided_sync_mode:
+            if event.isAutoRepeat():
+                return
+            if event.modifiers() & Qt.ShiftModifier:
+                self.apply_guided_sync_marks(self.guided_sync.mark_end(timestamp))
+            else:
+                self.apply_guided_sync_marks(self.guided_sync.tap(timestamp))
+                if self.guided_sync.current_line is None:
+                    self.log_message("Sincronização guiada: todas as linhas marcadas")
+        elif event.key() == Qt.Key_Backspace and self.guided_sync_mode:
+            self.apply_guided_sync_marks(self.guided_sync.undo())
         else:
             super().keyPressEvent(event)
     
@@ -796,8 +1833,19 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
         
-        # Parar reprodução
-        self.audio_player.stop()
+        # Parar carregamento, refinamento e reprodução, liberando o cache do áudio
+        self.cancel_audio_loading()
+        self.cancel_refinement()
+        self.cancel_model_prefetch()
+        for thread in self.stopping_threads:
+            thread.wait()
+        
+        # O job em andamento volta para a fila e continua na próxima abertura
+        if self.job_thread is not None:
+            self.job_queue.interrupt()
+            self.job_thread.requestInterruption()
+            self.job_thread.wait()
+        self.audio_player.close()
         
         # Limpar autosave
         if self.project_io.current_project_path:
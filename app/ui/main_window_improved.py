@@ -12,20 +12,15 @@ from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QSplitter, QPushButton, QComboBox, QLabel, 
     QTableWidget, QTableWidgetItem, QHeaderView,
-    QFileDialog, QMessageBox, QApplication
+    QFileDialog, QMessageBox
 )
 from PySide6.QtCore import Qt, QThread, Signal
 from PySide6.QtGui import QKeySequence
 
-import numpy as np
-import matplotlib
-matplotlib.use("QtAgg")  # Backend Qt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
 from app.core.sync_model import LyricLine
 from app.core.transcriber import Transcriber
 from app.core.exporters import Exporter
+from app.widgets.waveform_view import WaveformView
 
 
 @dataclass
@@ -75,27 +70,6 @@ class TranscriptionThread(QThread):
             self.error.emit(str(e))
 
 
-class WaveformWidget(FigureCanvas):
-    """Widget de waveform simplificado (compatível com MVP)."""
-    def __init__(self, parent=None):
-        self.fig = Figure(figsize=(6, 2), tight_layout=True)
-        super().__init__(self.fig)
-        self.ax = self.fig.add_subplot(111)
-        self.ax.set_title("Waveform")
-        self.ax.set_xlabel("Tempo (s)")
-        self.ax.set_ylabel("Amplitude")
-
-    def plot_wave(self, y, sr):
-        self.ax.clear()
-        t = np.arange(len(y)) / float(sr)
-        self.ax.plot(t, y, linewidth=0.8)
-        self.ax.set_xlabel("Tempo (s)")
-        self.ax.set_ylabel("Amplitude")
-        self.ax.set_title("Waveform")
-        self.ax.margins(x=0)
-        self.draw()
-
-
 class MainWindow(QMainWindow):
     """Janela principal melhorada com funcionalidades do MVP."""
     
@@ -141,7 +115,7 @@ class MainWindow(QMainWindow):
         top_bar.addStretch(1)
 
         # Waveform + table
-        self.wave = WaveformWidget()
+        self.wave = WaveformView()
 
         self.table = QTableWidget(0, 3)
         self.table.setHorizontalHeaderLabels(["Início (s)", "Fim (s)", "Texto"])
@@ -221,9 +195,8 @@ class MainWindow(QMainWindow):
         lang = self.lang_combo.currentText()
         model_size = self.model_combo.currentText()
 
-        # Desabilitar controles durante transcrição
-        self.setEnabled(False)
-        QApplication.processEvents()
+        # Só o botão fica desabilitado: tabela e waveform seguem editáveis
+        self.btn_transcribe.setEnabled(False)
 
         # Criar e iniciar thread de transcrição
         self.transcription_thread = TranscriptionThread(
@@ -241,16 +214,20 @@ class MainWindow(QMainWindow):
 
     def on_transcription_finished(self, lines: List[Line]):
         """Chamado quando a transcrição é concluída."""
+        self.btn_transcribe.setEnabled(True)
+        # Outro áudio foi aberto durante a transcrição: descartar
+        if self.sender().audio_path != self.audio_path:
+            return
+
         self.lines = lines
         self.populate_table()
         QMessageBox.information(self, "Transcrição", 
                               f"Transcrição concluída. {len(self.lines)} linhas detectadas.")
-        self.setEnabled(True)
 
     def on_transcription_error(self, error_message: str):
         """Chamado quando há erro na transcrição."""
+        self.btn_transcribe.setEnabled(True)
         QMessageBox.critical(self, "Transcrição", f"Erro ao transcrever:\n{error_message}")
-        self.setEnabled(True)
 
     def populate_table(self):
         """Popula a tabela com as linhas transcritas."""
@@ -0,0 +1,172 @@
+"""
+Widget da fila de transcrição.
+"""
+from typing import Dict, Optional
+
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
+                               QTableWidgetItem, QPushButton, QHeaderView,
+                               QAbstractItemView)
+from PySide6.QtCore import Qt, Signal
+
+from app.core.job_queue import JobQueue, TranscriptionJob
+from app.core.speed_profiles import format_duration
+
+
+class JobQueueWidget(QWidget):
+    """Lista dos jobs da fila com progresso, previsão de término e ações."""
+    
+    # Sinais
+    add_requested = Signal()       # Solicitação para adicionar áudios
+    open_requested = Signal(str)   # Solicitação para abrir o resultado de um job
+    queue_changed = Signal()       # Jobs voltaram para a fila (o worker deve rodar)
+    
+    STATUS_LABELS = {
+        TranscriptionJob.PENDING: "Na fila",
+        TranscriptionJob.RUNNING: "Transcrevendo",
+        TranscriptionJob.DONE: "Concluído",
+        TranscriptionJob.FAILED: "Erro",
+        TranscriptionJob.CANCELLED: "Cancelado"
+    }
+    
+    def __init__(self, queue: JobQueue, parent=None):
+        super().__init__(parent)
+        self.queue = queue
+        self.remaining: Dict[str, Optional[float]] = {}
+        self.setup_ui()
+        self.refresh()
+    
+    def setup_ui(self):
+        """Configura a interface do widget."""
+        layout = QVBoxLayout(self)
+        
+        # Tabela
+        self.table = QTableWidget()
+        self.table.setColumnCount(6)
+        self.table.setHorizontalHeaderLabels(
+            ["Arquivo", "Modelo", "Prioridade", "Estado", "Progresso", "Término"]
+        )
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        for column in range(1, 6):
+            header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.itemSelectionChanged.connect(self.update_controls_state)
+        self.table.itemDoubleClicked.connect(lambda item: self.open_result())
+        layout.addWidget(self.table)
+        
+        # Ações
+        controls_layout = QHBoxLayout()
+        
+        self.add_btn = QPushButton("Adicionar Áudios…")
+        self.add_btn.clicked.connect(self.add_requested.emit)
+        
+        self.up_btn = QPushButton("Prioridade +")
+        self.up_btn.clicked.connect(lambda: self.change_priority(1))
+        
+        self.down_btn = QPushButton("Prioridade −")
+        self.down_btn.clicked.connect(lambda: self.change_priority(-1))
+        
+        self.cancel_btn = QPushButton("Cancelar")
+        self.cancel_btn.clicked.connect(self.cancel_job)
+        
+        self.retry_btn = QPushButton("Tentar de Novo")
+        self.retry_btn.clicked.connect(self.retry_job)
+        
+        self.remove_btn = QPushButton("Remover")
+        self.remove_btn.clicked.connect(self.remove_job)
+        
+        self.open_btn = QPushButton("Abrir no Editor")
+        self.open_btn.clicked.connect(self.open_result)
+        
+        for button in (self.add_btn, self.up_btn, self.down_btn, self.cancel_btn,
+                       self.retry_btn, self.remove_btn, self.open_btn):
+            controls_layout.addWidget(button)
+        controls_layout.addStretch()
+        
+        layout.addLayout(controls_layout)
+    
+    def refresh(self, remaining: Optional[Dict[str, Optional[float]]] = None):
+        """
+        Reconstrói a tabela a partir da fila, mantendo a seleção.
+        
+        Args:
+            remaining: Segundos até cada job terminar (``JobQueue.remaining_times``)
+        """
+        if remaining is not None:
+            self.remaining = remaining
+        
+        selected = self.selected_job()
+        jobs = self.queue.ordered()
+        
+        self.table.blockSignals(True)
+        self.table.setRowCount(len(jobs))
+        for row, job in enumerate(jobs):
+            eta = self.remaining.get(job.id)
+            values = [
+                job.name,
+                job.model_size,
+                str(job.priority),
+                self.STATUS_LABELS.get(job.status, job.status),
+                f"{job.progress:.0%}",
+                format_duration(eta) if eta is not None and not job.is_finished else "—"
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                item.setData(Qt.UserRole, job.id)
+                if column == 0:
+                    item.setToolTip(job.error or job.audio_path)
+                self.table.setItem(row, column, item)
+            if selected is not None and job.id == selected.id:
+                self.table.selectRow(row)
+        self.table.blockSignals(False)
+        self.update_controls_state()
+    
+    def selected_job(self) -> Optional[TranscriptionJob]:
+        """Retorna o job selecionado."""
+        row = self.table.currentRow()
+        item = self.table.item(row, 0) if row >= 0 and self.table.selectedItems() else None
+        return self.queue.get(item.data(Qt.UserRole)) if item is not None else None
+    
+    def update_controls_state(self):
+        """Habilita as ações válidas para o job selecionado."""
+        job = self.selected_job()
+        self.up_btn.setEnabled(job is not None and job.status == job.PENDING)
+        self.down_btn.setEnabled(job is not None and job.status == job.PENDING)
+        self.cancel_btn.setEnabled(job is not None and not job.is_finished)
+        self.retry_btn.setEnabled(job is not None and job.status in (job.FAILED, job.CANCELLED))
+        self.remove_btn.setEnabled(job is not None and job.status != job.RUNNING)
+        self.open_btn.setEnabled(job is not None and job.status == job.DONE)
+    
+    def change_priority(self, delta: int):
+        """Sobe ou desce a prioridade do job selecionado."""
+        job = self.selected_job()
+        if job is not None and self.queue.set_priority(job.id, job.priority + delta):
+            self.refresh()
+    
+    def cancel_job(self):
+        """Cancela o job selecionado."""
+        job = self.selected_job()
+        if job is not None and self.queue.cancel(job.id):
+            self.refresh()
+    
+    def retry_job(self):
+        """Põe de novo na fila o job selecionado."""
+        job = self.selected_job()
+        if job is not None and self.queue.retry(job.id):
+            self.refresh()
+            self.queue_changed.emit()
+    
+    def remove_job(self):
+        """Remove o job selecionado da fila."""
+        job = self.selected_job()
+        if job is not None and self.queue.remove(job.id):
+            self.refresh()
+    
+    def open_result(self):
+        """Pede para abrir o resultado do job selecionado."""
+        job = self.selected_job()
+        if job is not None and job.status == job.DONE:
+            self.open_requested.emit(job.id)
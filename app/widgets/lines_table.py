@@ -5,9 +5,10 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
                                QTableWidgetItem, QPushButton, QLineEdit, QLabel,
                                QHeaderView, QMessageBox, QMenu, QAbstractItemView)
 from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QAction
+from PySide6.QtGui import QFont, QAction, QBrush, QColor
 
 from app.core.sync_model import LyricLine
+from app.core.exporters import Exporter
 
 
 class LinesTableWidget(QWidget):
@@ -20,11 +21,14 @@ class LinesTableWidget(QWidget):
     capture_end_requested = Signal(int)        # Solicitação para capturar fim
     split_line_requested = Signal(int)         # Solicitação para dividir linha
     merge_line_requested = Signal(int)         # Solicitação para unir linha
+    preview_line_requested = Signal(int)       # Solicitação para tocar a linha em loop
+    retranscribe_requested = Signal(int, int)  # Solicitação para retranscrever linhas (primeira, última)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.lines = []
         self.current_audio_position = 0.0
+        self.issue_rows = set()  # Linhas marcadas com problemas de tempo
         self.setup_ui()
         self.setup_shortcuts()
     
@@ -133,9 +137,25 @@ class LinesTableWidget(QWidget):
             preview_btn.clicked.connect(lambda checked, idx=i: self.preview_line(idx))
             self.table.setCellWidget(i, 3, preview_btn)
         
+        self.issue_rows.clear()
+        self.refresh_validation()
         self.table.blockSignals(False)
         self.update_controls_state()
     
+    def update_rows(self, rows):
+        """Atualiza só os tempos das linhas indicadas, sem reconstruir a tabela."""
+        self.table.blockSignals(True)
+        for row in rows:
+            if not 0 <= row < len(self.lines):
+                continue
+            line = self.lines[row]
+            for column, value in ((0, line.start), (1, line.end)):
+                item = self.table.item(row, column)
+                if item is not None:
+                    item.setText(f"{value:.2f}")
+        self.refresh_validation()
+        self.table.blockSignals(False)
+    
     def on_item_changed(self, item):
         """Chamado quando um item da tabela é alterado."""
         row = item.row()
@@ -151,11 +171,17 @@ class LinesTableWidget(QWidget):
                     line.end = float(item.text())
                 elif column == 2:  # Texto
                     line.text = item.text()
+                    line.words = []  # Tempos por palavra não valem mais
                 
                 # Emitir sinal de mudança
                 self.line_changed.emit(row, line)
                 self.update_status()
                 
+                if column in (0, 1):
+                    self.table.blockSignals(True)
+                    self.refresh_validation()
+                    self.table.blockSignals(False)
+                
             except ValueError:
                 # Reverter valor inválido
                 if column == 0:
@@ -165,6 +191,28 @@ class LinesTableWidget(QWidget):
                 QMessageBox.warning(self, "Valor Inválido", 
                                   "Por favor, insira um número válido.")
     
+    def refresh_validation(self):
+        """Marca em vermelho os tempos das linhas com problemas de temporização."""
+        messages = {}
+        for issue in Exporter.validate_lines(self.lines):
+            messages.setdefault(issue.index, []).append(issue.message)
+        
+        # Só as linhas que mudaram de estado são tocadas
+        for row in self.issue_rows | set(messages):
+            row_messages = messages.get(row)
+            for column in (0, 1):
+                item = self.table.item(row, column)
+                if item is None:
+                    continue
+                if row_messages:
+                    item.setForeground(QBrush(QColor("red")))
+                    item.setToolTip("\n".join(row_messages))
+                else:
+                    item.setForeground(QBrush())
+                    item.setToolTip("")
+        
+        self.issue_rows = set(messages)
+    
     def on_row_changed(self, current_item, previous_item):
         """Chamado quando a linha selecionada muda."""
         self.update_controls_state()
@@ -243,10 +291,8 @@ class LinesTableWidget(QWidget):
     def preview_line(self, line_index: int):
         """Preview de uma linha específica."""
         if 0 <= line_index < len(self.lines):
-            line = self.lines[line_index]
-            # Emitir sinal para a janela principal tocar o trecho
-            # Isso será implementado na janela principal
-            pass
+            # A janela principal toca o trecho em loop
+            self.preview_line_requested.emit(line_index)
     
     def add_line(self, line: LyricLine = None):
         """Adiciona uma nova linha."""
@@ -312,9 +358,18 @@ class LinesTableWidget(QWidget):
         insert_action = QAction("Inserir Linha", self)
         insert_action.triggered.connect(lambda: self.insert_line(row))
         
+        # Linhas selecionadas (ou a linha clicada)
+        rows = sorted({index.row() for index in self.table.selectedIndexes()} | {row})
+        retranscribe_action = QAction("Retranscrever Trecho", self)
+        retranscribe_action.triggered.connect(
+            lambda: self.retranscribe_requested.emit(rows[0], rows[-1])
+        )
+        
         menu.addAction(add_action)
         menu.addAction(remove_action)
         menu.addAction(insert_action)
+        menu.addSeparator()
+        menu.addAction(retranscribe_action)
         
         menu.exec_(self.table.mapToGlobal(position))
     
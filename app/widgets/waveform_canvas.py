@@ -0,0 +1,417 @@
+"""
+Visualização de waveform com matplotlib (alternativa ao WaveformView nativo).
+"""
+import numpy as np
+from PySide6.QtWidgets import QWidget, QVBoxLayout
+from PySide6.QtCore import Signal
+import matplotlib
+matplotlib.use("QtAgg")  # Backend Qt
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.transforms import Bbox
+
+from app.core.exporters import timing_arrays
+
+
+class WaveformCanvas(QWidget):
+    """Plot do waveform, das linhas de letra e do cursor com matplotlib."""
+    
+    # Sinais
+    seek_requested = Signal(float)        # Clique no plot
+    view_changed = Signal(float, float)   # Trecho visível (início, fim)
+    
+    # Cores alternadas das regiões (face, borda) com transparência
+    REGION_FACE_COLORS = (to_rgba('lightblue', 0.3), to_rgba('lightgreen', 0.3))
+    REGION_EDGE_COLOR = to_rgba('blue', 0.3)
+    
+    # Largura mínima (em pixels) de uma região para receber rótulo
+    LABEL_MIN_WIDTH_PX = 60
+    
+    # Menor trecho visível (segundos)
+    MIN_VIEW_DURATION = 0.05
+    
+    # Colunas do envelope plotado quando o gerador não guarda as amostras
+    ENVELOPE_COLUMNS = 8192
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.waveform_data = None
+        self.duration = 0.0
+        self.sample_rate = 0
+        self.current_position = 0.0
+        self.lines = []  # Lista de LyricLine para mostrar no waveform
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Canvas do matplotlib
+        self.figure = Figure(figsize=(12, 3), dpi=100)
+        self.canvas = FigureCanvas(self.figure)
+        self.canvas.setMinimumHeight(150)
+        layout.addWidget(self.canvas)
+        
+        # Conectar eventos do mouse
+        self.canvas.mpl_connect('button_press_event', self.on_mouse_click)
+        
+        # Fundo em cache para desenhar o cursor via blitting
+        self._background = None
+        self._cursor_x = None  # Última posição do cursor em pixels
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+        
+        self.setup_plot()
+    
+    def setup_plot(self):
+        """Configura o plot do matplotlib."""
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_xlabel('Tempo (s)')
+        self.ax.set_ylabel('Amplitude')
+        self.ax.grid(True, alpha=0.3)
+        
+        # Linha do cursor (animada: fica fora do desenho normal do canvas)
+        self.cursor_line, = self.ax.plot([], [], 'r-', linewidth=2, alpha=0.8, animated=True)
+        
+        # Regiões das linhas de letra (uma única coleção) e rótulos visíveis
+        self._setup_regions()
+        
+        self.figure.tight_layout()
+    
+    def load_waveform(self, waveform_data: np.ndarray, duration: float, sample_rate: float,
+                      keep_view: bool = False):
+        """
+        Carrega dados do waveform.
+        
+        Args:
+            waveform_data: Dados do waveform
+            duration: Duração em segundos
+            sample_rate: Taxa de amostragem
+            keep_view: Mantém o trecho visível (ex.: prévia sendo substituída)
+        """
+        view = (self.view_start, self.view_end) if keep_view and self.waveform_data is not None else None
+        
+        self.waveform_data = waveform_data
+        self.duration = duration
+        self.sample_rate = sample_rate
+        
+        # Plotar waveform
+        self.plot_waveform()
+        if view is not None:
+            self.set_view(*view)
+    
+    def load_generator(self, generator, keep_view: bool = False):
+        """
+        Exibe o waveform de um gerador; sem amostras em memória, plota o
+        envelope de picos (mínimos e máximos intercalados).
+        
+        Args:
+            generator: WaveformGenerator já carregado
+            keep_view: Mantém o trecho visível
+        """
+        if generator.waveform_data is not None:
+            self.load_waveform(generator.waveform_data, generator.duration,
+                               generator.sample_rate, keep_view)
+            return
+        
+        mins, maxs = generator.get_peaks(0.0, generator.duration, self.ENVELOPE_COLUMNS)
+        envelope = np.empty(2 * len(mins), dtype=np.float32)
+        envelope[0::2] = mins
+        envelope[1::2] = maxs
+        rate = len(envelope) / generator.duration if generator.duration else 1.0
+        self.load_waveform(envelope, generator.duration, rate, keep_view)
+    
+    def plot_wave(self, y, sr):
+        """Método simplificado para plotar waveform (compatível com MVP)."""
+        self.ax.clear()
+        t = np.arange(len(y)) / float(sr)
+        self.ax.plot(t, y, linewidth=0.8)
+        self.ax.set_xlabel("Tempo (s)")
+        self.ax.set_ylabel("Amplitude")
+        self.ax.set_title("Waveform")
+        self.ax.margins(x=0)
+        self.canvas.draw()
+    
+    def plot_waveform(self):
+        """Plota o waveform no canvas."""
+        if self.waveform_data is None:
+            return
+        
+        self.ax.clear()
+        
+        # Criar array de tempo
+        time = np.linspace(0, self.duration, len(self.waveform_data))
+        
+        # Plotar waveform
+        self.ax.plot(time, self.waveform_data, 'b-', linewidth=0.5, alpha=0.7)
+        self.ax.fill_between(time, self.waveform_data, alpha=0.3)
+        
+        # Configurar eixos
+        self.ax.set_xlim(0, self.duration)
+        self.ax.set_xlabel('Tempo (s)')
+        self.ax.set_ylabel('Amplitude')
+        self.ax.grid(True, alpha=0.3)
+        
+        # Adicionar linhas de letra se existirem
+        self._setup_regions()
+        self.plot_lyric_lines()
+        
+        # Adicionar cursor
+        self.cursor_line, = self.ax.plot([self.current_position, self.current_position], [-1, 1],
+                                         'r-', linewidth=2, alpha=0.8, animated=True)
+        
+        self.figure.tight_layout()
+        self.canvas.draw()
+    
+    def _setup_regions(self):
+        """Cria a coleção de regiões das linhas após limpar o eixo."""
+        self.regions = PolyCollection([], linewidths=1)
+        self.ax.add_collection(self.regions, autolim=False)
+        self.line_labels = {}  # índice da linha -> Text
+        
+        # Arrays com o estado desenhado, usados para detectar mudanças
+        self._region_verts = np.zeros((0, 4, 2))
+        self._drawn_starts = np.zeros(0)
+        self._drawn_ends = np.zeros(0)
+        self._drawn_valid = np.zeros(0, dtype=bool)
+        self._drawn_texts = []
+        
+        self.ax.callbacks.connect('xlim_changed', lambda ax: self.on_xlim_changed())
+    
+    def plot_lyric_lines(self):
+        """Plota as linhas de letra no waveform como uma única PolyCollection."""
+        starts, ends, valid = timing_arrays(self.lines)
+        count = len(self.lines)
+        
+        # Retângulos [início, fim] x [-1, 1]; linhas vazias ficam invisíveis
+        verts = np.empty((count, 4, 2))
+        verts[:, 0:2, 0] = starts[:, None]
+        verts[:, 2:4, 0] = ends[:, None]
+        verts[:, :, 1] = (-1, 1, 1, -1)
+        self._region_verts = verts
+        self.regions.set_verts(verts, closed=True)
+        
+        face_colors = np.empty((count, 4))
+        face_colors[0::2] = self.REGION_FACE_COLORS[0]
+        face_colors[1::2] = self.REGION_FACE_COLORS[1]
+        edge_colors = np.tile(self.REGION_EDGE_COLOR, (count, 1))
+        face_colors[~valid, 3] = 0.0
+        edge_colors[~valid, 3] = 0.0
+        self.regions.set_facecolor(face_colors)
+        self.regions.set_edgecolor(edge_colors)
+        
+        self._drawn_starts = starts
+        self._drawn_ends = ends
+        self._drawn_valid = valid
+        self._drawn_texts = [line.text for line in self.lines]
+        
+        for label in self.line_labels.values():
+            label.remove()
+        self.line_labels.clear()
+        self.update_labels()
+    
+    def update_region(self, line_index: int):
+        """Atualiza, no lugar, apenas a região e o rótulo de uma linha."""
+        line = self.lines[line_index]
+        valid = not line.is_empty()
+        
+        verts = self._region_verts[line_index]
+        verts[0:2, 0] = line.start
+        verts[2:4, 0] = line.end
+        path = self.regions.get_paths()[line_index]
+        path.vertices = np.vstack([verts, verts[:1]])
+        
+        if valid != self._drawn_valid[line_index]:
+            alpha = self.REGION_FACE_COLORS[0][3] if valid else 0.0
+            face_colors = self.regions.get_facecolor()
+            edge_colors = self.regions.get_edgecolor()
+            face_colors[line_index, 3] = alpha
+            edge_colors[line_index, 3] = alpha
+            self.regions.set_facecolor(face_colors)
+            self.regions.set_edgecolor(edge_colors)
+        self.regions.stale = True
+        
+        self._drawn_starts[line_index] = line.start
+        self._drawn_ends[line_index] = line.end
+        self._drawn_valid[line_index] = valid
+        self._drawn_texts[line_index] = line.text
+        
+        label = self.line_labels.pop(line_index, None)
+        if label is not None:
+            label.remove()
+        self.update_labels()
+    
+    def update_labels(self):
+        """Mostra rótulos apenas das linhas visíveis e largas o suficiente."""
+        if not len(self._drawn_starts):
+            return
+        
+        xmin, xmax = self.ax.get_xlim()
+        width_px = self.ax.bbox.width or 1.0
+        min_duration = self.LABEL_MIN_WIDTH_PX * (xmax - xmin) / width_px
+        
+        visible = (self._drawn_valid & (self._drawn_ends > xmin) & (self._drawn_starts < xmax) &
+                   (self._drawn_ends - self._drawn_starts > min_duration))
+        wanted = set(np.flatnonzero(visible).tolist())
+        
+        for index in list(self.line_labels):
+            if index not in wanted:
+                self.line_labels.pop(index).remove()
+        
+        for index in wanted - set(self.line_labels):
+            text = self._drawn_texts[index]
+            mid_time = (self._drawn_starts[index] + self._drawn_ends[index]) / 2
+            self.line_labels[index] = self.ax.text(
+                mid_time, 0.8, text[:20] + "..." if len(text) > 20 else text,
+                ha='center', va='center', fontsize=8, rotation=0
+            )
+    
+    def on_xlim_changed(self):
+        """Atualiza rótulos e avisa a mudança do trecho visível."""
+        self.update_labels()
+        self.view_changed.emit(self.view_start, self.view_end)
+    
+    def update_lines(self, lines: list):
+        """
+        Atualiza as linhas de letra exibidas.
+        
+        Só as regiões que mudaram são tocadas; o waveform não é replotado.
+        """
+        self.lines = lines
+        if self.waveform_data is None:
+            return
+        
+        starts, ends, valid = timing_arrays(lines)
+        if len(starts) != len(self._drawn_starts):
+            self.plot_lyric_lines()
+        else:
+            changed = np.flatnonzero((starts != self._drawn_starts) | (ends != self._drawn_ends) |
+                                     (valid != self._drawn_valid))
+            changed = set(changed.tolist())
+            changed.update(i for i, line in enumerate(lines) if line.text != self._drawn_texts[i])
+            if not changed:
+                return
+            for line_index in sorted(changed):
+                self.update_region(line_index)
+        
+        self.canvas.draw_idle()
+    
+    def set_position(self, position: float):
+        """Define a posição atual do cursor."""
+        self.current_position = position
+        self.update_cursor()
+    
+    def update_cursor(self):
+        """
+        Atualiza a posição do cursor no plot.
+        
+        Com o fundo em cache, apenas as colunas entre a posição antiga e a
+        nova do cursor são repintadas; o waveform e as linhas não são redesenhados.
+        """
+        if self.cursor_line is None:
+            return
+        
+        self.cursor_line.set_data([self.current_position, self.current_position], [-1, 1])
+        
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        
+        x = self.ax.transData.transform((self.current_position, 0))[0]
+        previous_x = self._cursor_x if self._cursor_x is not None else x
+        self._cursor_x = x
+        
+        # Margem para cobrir a espessura da linha
+        margin = 3
+        axes_box = self.ax.bbox
+        x0 = max(axes_box.x0, min(x, previous_x) - margin)
+        x1 = min(axes_box.x1, max(x, previous_x) + margin)
+        
+        self.canvas.restore_region(self._background)
+        self.ax.draw_artist(self.cursor_line)
+        if x1 > x0:
+            self.canvas.blit(Bbox.from_extents(x0, axes_box.y0, x1, axes_box.y1))
+    
+    def on_draw(self, event):
+        """Guarda o fundo após cada redesenho completo e desenha o cursor por cima."""
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._cursor_x = None
+        if self.cursor_line is not None:
+            self.ax.draw_artist(self.cursor_line)
+            # O próximo blit precisa apagar o cursor desenhado aqui
+            xdata = self.cursor_line.get_xdata()
+            if len(xdata):
+                self._cursor_x = self.ax.transData.transform((xdata[0], 0))[0]
+    
+    def on_mouse_click(self, event):
+        """Chamado quando o mouse é clicado no plot."""
+        if event.inaxes == self.ax and event.button == 1:  # Botão esquerdo
+            position = event.xdata
+            if position is not None:
+                self.seek_requested.emit(position)
+    
+    def highlight_line(self, line_index: int):
+        """Destaca uma linha específica no waveform."""
+        if 0 <= line_index < len(self.lines):
+            line = self.lines[line_index]
+            if not line.is_empty():
+                # Destacar a linha
+                self.ax.axvspan(line.start, line.end, alpha=0.5, color='yellow')
+                self.canvas.draw()
+    
+    def clear_highlights(self):
+        """Remove todos os destaques."""
+        # Remover spans de destaque
+        for span in self.ax.collections:
+            if hasattr(span, '_highlight'):
+                span.remove()
+        self.canvas.draw()
+    
+    def zoom_to_line(self, line_index: int):
+        """Faz zoom para uma linha específica."""
+        if 0 <= line_index < len(self.lines):
+            line = self.lines[line_index]
+            if not line.is_empty():
+                # Adicionar margem
+                margin = (line.end - line.start) * 0.1
+                self.ax.set_xlim(max(0, line.start - margin), 
+                               min(self.duration, line.end + margin))
+                self.canvas.draw()
+    
+    def reset_zoom(self):
+        """Reseta o zoom para mostrar todo o waveform."""
+        self.ax.set_xlim(0, self.duration)
+        self.canvas.draw()
+    
+    @property
+    def view_start(self) -> float:
+        """Início do trecho visível em segundos."""
+        return float(self.ax.get_xlim()[0])
+    
+    @property
+    def view_end(self) -> float:
+        """Fim do trecho visível em segundos."""
+        return float(self.ax.get_xlim()[1])
+    
+    def set_view(self, start: float, end: float):
+        """
+        Define o trecho visível, limitado à duração do áudio.
+        
+        Args:
+            start: Início em segundos
+            end: Fim em segundos
+        """
+        length = min(max(end - start, self.MIN_VIEW_DURATION), self.duration)
+        start = max(0.0, min(start, self.duration - length))
+        self.ax.set_xlim(start, start + length)
+        self.canvas.draw_idle()
+    
+    def zoom(self, factor: float, anchor: float = None):
+        """Aplica zoom mantendo ``anchor`` (segundos) no mesmo ponto da tela."""
+        start, end = self.view_start, self.view_end
+        if anchor is None:
+            anchor = (start + end) / 2
+        self.set_view(anchor - (anchor - start) * factor, anchor + (end - anchor) * factor)
+    
+    def scroll(self, seconds: float):
+        """Desloca o trecho visível em ``seconds``."""
+        self.set_view(self.view_start + seconds, self.view_end + seconds)
@@ -0,0 +1,350 @@
+"""
+Visualização nativa de waveform desenhada com QPainter.
+"""
+import numpy as np
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, Signal, QRect, QLineF, QPointF
+from PySide6.QtGui import QPainter, QPen, QColor, QPixmap, QPolygonF, QFontMetrics
+
+from app.core.waveform import WaveformGenerator, PeakTileCache
+from app.core.exporters import timing_arrays
+
+
+class WaveformView(QWidget):
+    """
+    Waveform, linhas de letra e cursor desenhados direto com QPainter.
+    
+    O envelope de picos é pedido ao ``WaveformGenerator`` apenas para o
+    trecho visível, em tiles com a resolução do zoom atual (os vizinhos são
+    calculados em segundo plano), e guardado em um QPixmap junto com as
+    regiões; mover o cursor só repinta as colunas por onde ele passou.
+    """
+    
+    # Sinais
+    seek_requested = Signal(float)        # Clique no waveform
+    view_changed = Signal(float, float)   # Trecho visível (início, fim)
+    
+    # Cores
+    BACKGROUND_COLOR = QColor(255, 255, 255)
+    WAVE_COLOR = QColor(31, 119, 180)
+    AXIS_COLOR = QColor(200, 200, 200)
+    REGION_COLORS = (QColor(173, 216, 230, 77), QColor(144, 238, 144, 77))
+    REGION_BORDER_COLOR = QColor(0, 0, 255, 77)
+    HIGHLIGHT_COLOR = QColor(255, 255, 0, 128)
+    CURSOR_COLOR = QColor(255, 0, 0, 204)
+    TEXT_COLOR = QColor(40, 40, 40)
+    
+    # Menor trecho visível (segundos) e largura mínima de rótulo (pixels)
+    MIN_VIEW_DURATION = 0.05
+    LABEL_MIN_WIDTH_PX = 60
+    
+    # Tiles pré-carregados de cada lado do trecho visível
+    PREFETCH_TILES = 2
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.waveform_data = None
+        self.duration = 0.0
+        self.sample_rate = 0
+        self.current_position = 0.0
+        self.lines = []  # Lista de LyricLine para mostrar no waveform
+        self.highlighted_line = None
+        
+        # Trecho visível em segundos
+        self.view_start = 0.0
+        self.view_end = 0.0
+        
+        self._generator = None  # WaveformGenerator com a pirâmide de picos
+        self._tiles = None      # PeakTileCache do áudio atual
+        self._peak_scale = 1.0
+        self._starts = np.zeros(0)
+        self._ends = np.zeros(0)
+        self._valid = np.zeros(0, dtype=bool)
+        self._cache = None      # QPixmap com envelope e regiões
+        self._cursor_x = None   # Última coluna onde o cursor foi pintado
+        
+        self.setMinimumHeight(150)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setFocusPolicy(Qt.ClickFocus)
+    
+    def load_waveform(self, waveform_data: np.ndarray, duration: float, sample_rate: float,
+                      keep_view: bool = False):
+        """
+        Carrega dados do waveform.
+        
+        Args:
+            waveform_data: Dados do waveform (mono)
+            duration: Duração em segundos
+            sample_rate: Taxa de amostragem
+            keep_view: Mantém o trecho visível (ex.: prévia sendo substituída)
+        """
+        generator = WaveformGenerator.from_array(waveform_data, sample_rate)
+        generator.duration = duration
+        self.load_generator(generator, keep_view)
+    
+    def load_generator(self, generator: WaveformGenerator, keep_view: bool = False):
+        """
+        Exibe o waveform de um gerador, que pode estar só com o resumo de
+        picos em memória (carregamento em blocos sem amostras).
+        
+        Args:
+            generator: Gerador já carregado
+            keep_view: Mantém o trecho visível
+        """
+        self.waveform_data = generator.waveform_data
+        self.duration = generator.duration
+        self.sample_rate = generator.sample_rate
+        
+        # Um único cache por view: a prévia é trocada a cada bloco carregado
+        self._generator = generator
+        if self._tiles is None:
+            self._tiles = PeakTileCache(generator)
+        else:
+            self._tiles.reset(generator)
+        
+        peak = self._generator.get_peak_amplitude()
+        self._peak_scale = peak if peak > 0 else 1.0
+        
+        if keep_view and self.view_end > self.view_start:
+            self.set_view(self.view_start, self.view_end)
+            self.invalidate()
+            return
+        
+        # Força repintura mesmo se o trecho visível não mudou
+        self.view_start = self.view_end = 0.0
+        self.set_view(0.0, self.duration)
+    
+    def plot_wave(self, y, sr):
+        """Método simplificado para plotar waveform (compatível com MVP)."""
+        self.load_waveform(np.asarray(y), len(y) / float(sr), sr)
+    
+    def update_lines(self, lines: list):
+        """Atualiza as linhas de letra exibidas."""
+        self.lines = lines
+        self._starts, self._ends, self._valid = timing_arrays(lines)
+        self.invalidate()
+    
+    def set_position(self, position: float):
+        """Move o cursor, repintando apenas as colunas antiga e nova."""
+        self.current_position = position
+        
+        x = self.time_to_x(position)
+        height = self.height()
+        if self._cursor_x is not None:
+            self.update(QRect(self._cursor_x - 2, 0, 5, height))
+        self.update(QRect(x - 2, 0, 5, height))
+        self._cursor_x = x
+    
+    def highlight_line(self, line_index: int):
+        """Destaca uma linha específica no waveform."""
+        if 0 <= line_index < len(self.lines):
+            self.highlighted_line = line_index
+            self.invalidate()
+    
+    def clear_highlights(self):
+        """Remove todos os destaques."""
+        self.highlighted_line = None
+        self.invalidate()
+    
+    def zoom_to_line(self, line_index: int):
+        """Faz zoom para uma linha específica."""
+        if 0 <= line_index < len(self.lines):
+            line = self.lines[line_index]
+            if not line.is_empty():
+                # Adicionar margem
+                margin = (line.end - line.start) * 0.1
+                self.set_view(line.start - margin, line.end + margin)
+    
+    def reset_zoom(self):
+        """Reseta o zoom para mostrar todo o waveform."""
+        self.set_view(0.0, self.duration)
+    
+    def set_view(self, start: float, end: float):
+        """
+        Define o trecho visível, limitado à duração do áudio.
+        
+        Args:
+            start: Início em segundos
+            end: Fim em segundos
+        """
+        length = min(max(end - start, self.MIN_VIEW_DURATION), self.duration)
+        start = max(0.0, min(start, self.duration - length))
+        
+        if (start, start + length) == (self.view_start, self.view_end):
+            return
+        
+        self.view_start = start
+        self.view_end = start + length
+        self.invalidate()
+        self.view_changed.emit(self.view_start, self.view_end)
+    
+    def zoom(self, factor: float, anchor: float = None):
+        """
+        Aplica zoom mantendo ``anchor`` (segundos) no mesmo ponto da tela.
+        
+        Args:
+            factor: Fator sobre a duração visível (< 1 aproxima, > 1 afasta)
+            anchor: Tempo que fica fixo; centro do trecho se omitido
+        """
+        if anchor is None:
+            anchor = (self.view_start + self.view_end) / 2
+        self.set_view(anchor - (anchor - self.view_start) * factor,
+                      anchor + (self.view_end - anchor) * factor)
+    
+    def scroll(self, seconds: float):
+        """Desloca o trecho visível em ``seconds``."""
+        self.set_view(self.view_start + seconds, self.view_end + seconds)
+    
+    def time_to_x(self, seconds: float) -> int:
+        """Converte tempo em coluna de pixel."""
+        span = self.view_end - self.view_start
+        if span <= 0:
+            return 0
+        return int(round((seconds - self.view_start) / span * self.width()))
+    
+    def x_to_time(self, x: float) -> float:
+        """Converte coluna de pixel em tempo."""
+        width = max(self.width(), 1)
+        return self.view_start + x / width * (self.view_end - self.view_start)
+    
+    def invalidate(self):
+        """Descarta o desenho em cache e agenda repintura completa."""
+        self._cache = None
+        self.update()
+    
+    def _render_cache(self) -> QPixmap:
+        """Desenha envelope, regiões e destaque em um QPixmap."""
+        pixmap = QPixmap(self.size())
+        pixmap.fill(self.BACKGROUND_COLOR)
+        
+        painter = QPainter(pixmap)
+        self._paint_regions(painter)
+        self._paint_envelope(painter)
+        painter.end()
+        
+        return pixmap
+    
+    def _paint_regions(self, painter: QPainter):
+        """Desenha as regiões e rótulos das linhas visíveis."""
+        if not len(self._starts) or self.view_end <= self.view_start:
+            return
+        
+        height = self.height()
+        visible = self._valid & (self._ends > self.view_start) & (self._starts < self.view_end)
+        metrics = QFontMetrics(painter.font())
+        
+        painter.setPen(QPen(self.REGION_BORDER_COLOR, 1))
+        for index in np.flatnonzero(visible).tolist():
+            x0 = self.time_to_x(self._starts[index])
+            x1 = self.time_to_x(self._ends[index])
+            rect = QRect(x0, 0, max(x1 - x0, 1), height - 1)
+            
+            color = self.HIGHLIGHT_COLOR if index == self.highlighted_line \
+                else self.REGION_COLORS[index % 2]
+            painter.setBrush(color)
+            painter.drawRect(rect)
+            
+            if rect.width() >= self.LABEL_MIN_WIDTH_PX:
+                text = metrics.elidedText(self.lines[index].text, Qt.ElideRight, rect.width() - 4)
+                painter.setPen(self.TEXT_COLOR)
+                painter.drawText(rect.adjusted(2, 2, -2, 0), Qt.AlignHCenter | Qt.AlignTop, text)
+                painter.setPen(QPen(self.REGION_BORDER_COLOR, 1))
+    
+    def _paint_envelope(self, painter: QPainter):
+        """Desenha o envelope de picos do trecho visível a partir dos tiles."""
+        width = self.width()
+        middle = self.height() / 2
+        painter.setPen(self.AXIS_COLOR)
+        painter.drawLine(0, int(middle), width, int(middle))
+        
+        span = self.view_end - self.view_start
+        if self._generator is None or width <= 0 or span <= 0:
+            return
+        
+        scale = (middle - 2) / self._peak_scale
+        pixels_per_sample = width / (span * self.sample_rate)
+        painter.setPen(self.WAVE_COLOR)
+        
+        if pixels_per_sample > 1:
+            # Zoom alto: menos de uma amostra por pixel, desenha a própria curva
+            first = max(0, int(self.view_start * self.sample_rate))
+            samples = self._generator.get_waveform_segment(
+                self.view_start, self.view_end + 1.0 / self.sample_rate
+            )
+            if samples is None or len(samples) == 0:
+                return
+            xs = (np.arange(first, first + len(samples)) - self.view_start * self.sample_rate)
+            xs = xs * pixels_per_sample
+            ys = middle - samples * scale
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist())]))
+            return
+        
+        # Resolução em potência de 2 para reaproveitar tiles entre zooms próximos
+        resolution = self._tiles.resolution_for(1.0 / pixels_per_sample)
+        tile_samples = self._tiles.tile_samples(resolution)
+        first_tile = int(self.view_start * self.sample_rate) // tile_samples
+        last_tile = int(self.view_end * self.sample_rate) // tile_samples
+        
+        mins = []
+        maxs = []
+        for index in range(first_tile, last_tile + 1):
+            tile_mins, tile_maxs = self._tiles.get(resolution, index)
+            mins.append(tile_mins)
+            maxs.append(tile_maxs)
+        mins = np.concatenate(mins)
+        maxs = np.concatenate(maxs)
+        
+        self._tiles.prefetch(resolution, [
+            *range(first_tile - self.PREFETCH_TILES, first_tile),
+            *range(last_tile + 1, last_tile + 1 + self.PREFETCH_TILES),
+        ])
+        
+        xs = ((first_tile * tile_samples + np.arange(len(mins)) * resolution)
+              - self.view_start * self.sample_rate) * pixels_per_sample
+        inside = (xs > -1) & (xs < width + 1)
+        xs = xs[inside].tolist()
+        tops = (middle - maxs[inside] * scale).tolist()
+        bottoms = (middle - mins[inside] * scale).tolist()
+        painter.drawLines([QLineF(x, top, x, bottom)
+                           for x, top, bottom in zip(xs, tops, bottoms)])
+    
+    def paintEvent(self, event):
+        """Copia o cache para a área suja e desenha o cursor por cima."""
+        if self._cache is None or self._cache.size() != self.size():
+            self._cache = self._render_cache()
+        
+        painter = QPainter(self)
+        rect = event.rect()
+        painter.drawPixmap(rect, self._cache, rect)
+        
+        x = self.time_to_x(self.current_position)
+        if rect.left() - 2 <= x <= rect.right() + 2:
+            painter.setPen(QPen(self.CURSOR_COLOR, 2))
+            painter.drawLine(x, 0, x, self.height())
+        self._cursor_x = x
+        painter.end()
+    
+    def resizeEvent(self, event):
+        """Redesenha o cache no novo tamanho."""
+        self._cache = None
+        super().resizeEvent(event)
+    
+    def mousePressEvent(self, event):
+        """Clique com o botão esquerdo solicita seek."""
+        if event.button() == Qt.LeftButton and self.duration > 0:
+            position = min(max(self.x_to_time(event.position().x()), 0.0), self.duration)
+            self.seek_requested.emit(position)
+        else:
+            super().mousePressEvent(event)
+    
+    def wheelEvent(self, event):
+        """Ctrl + roda aplica zoom no ponto do mouse; roda sozinha rola o trecho."""
+        steps = event.angleDelta().y() / 120.0
+        if event.modifiers() & Qt.ControlModifier:
+            anchor = self.x_to_time(event.position().x())
+            self.zoom(0.8 ** steps, anchor)
+        else:
+            steps = steps or -event.angleDelta().x() / 120.0
+            self.scroll(-steps * 0.1 * (self.view_end - self.view_start))
+        event.accept()
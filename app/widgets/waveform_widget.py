@@ -2,16 +2,12 @@
 Widget customizado para visualização de waveform.
 """
 import numpy as np
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QPushButton
-from PySide6.QtCore import Qt, Signal, QTimer, QRect
-from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont
-import matplotlib
-matplotlib.use("QtAgg")  # Backend Qt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from matplotlib.patches import Rectangle
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QPushButton, QScrollBar
+from PySide6.QtCore import Qt, Signal, QTimer
 
+from app.config import WAVEFORM_BACKEND
 from app.core.sync_model import LyricLine
+from app.widgets.waveform_view import WaveformView
 
 
 class WaveformWidget(QWidget):
@@ -22,16 +18,26 @@ class WaveformWidget(QWidget):
     play_pause_clicked = Signal()     # Botão play/pause clicado
     seek_requested = Signal(float)    # Solicitação de seek
     
-    def __init__(self, parent=None):
+    # Fator de zoom dos botões +/-
+    ZOOM_STEP = 0.5
+    
+    def __init__(self, parent=None, backend: str = WAVEFORM_BACKEND):
+        """
+        Inicializa o widget.
+        
+        Args:
+            parent: Widget pai
+            backend: Visualização do waveform, "native" (QPainter) ou "matplotlib"
+        """
         super().__init__(parent)
         self.waveform_data = None
         self.duration = 0.0
         self.current_position = 0.0
         self.is_playing = False
         self.lines = []  # Lista de LyricLine para mostrar no waveform
+        self.backend = backend
         
         self.setup_ui()
-        self.setup_plot()
         
         # Timer para atualizar posição
         self.update_timer = QTimer()
@@ -83,34 +89,50 @@ class WaveformWidget(QWidget):
         controls_layout.addWidget(self.speed_combo)
         controls_layout.addStretch()
         
-        layout.addLayout(controls_layout)
+        # Controles de zoom
+        self.zoom_out_button = QPushButton("−")
+        self.zoom_out_button.setFixedSize(30, 30)
+        self.zoom_out_button.setToolTip("Afastar")
+        self.zoom_out_button.clicked.connect(lambda: self.zoom(1 / self.ZOOM_STEP))
         
-        # Canvas do matplotlib
-        self.figure = Figure(figsize=(12, 3), dpi=100)
-        self.canvas = FigureCanvas(self.figure)
-        self.canvas.setMinimumHeight(150)
-        layout.addWidget(self.canvas)
+        self.zoom_in_button = QPushButton("+")
+        self.zoom_in_button.setFixedSize(30, 30)
+        self.zoom_in_button.setToolTip("Aproximar")
+        self.zoom_in_button.clicked.connect(lambda: self.zoom(self.ZOOM_STEP))
         
-        # Conectar eventos do mouse
-        self.canvas.mpl_connect('button_press_event', self.on_mouse_click)
-        self.canvas.mpl_connect('motion_notify_event', self.on_mouse_move)
-    
-    def setup_plot(self):
-        """Configura o plot do matplotlib."""
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_xlabel('Tempo (s)')
-        self.ax.set_ylabel('Amplitude')
-        self.ax.grid(True, alpha=0.3)
+        self.zoom_fit_button = QPushButton("⤢")
+        self.zoom_fit_button.setFixedSize(30, 30)
+        self.zoom_fit_button.setToolTip("Mostrar tudo")
+        self.zoom_fit_button.clicked.connect(self.reset_zoom)
         
-        # Linha do cursor
-        self.cursor_line, = self.ax.plot([], [], 'r-', linewidth=2, alpha=0.8)
+        controls_layout.addWidget(self.zoom_out_button)
+        controls_layout.addWidget(self.zoom_in_button)
+        controls_layout.addWidget(self.zoom_fit_button)
         
-        # Retângulos para as linhas de letra
-        self.line_rectangles = []
+        layout.addLayout(controls_layout)
         
-        self.figure.tight_layout()
+        # Visualização do waveform
+        self.view = self.create_view()
+        self.view.seek_requested.connect(self.on_view_clicked)
+        self.view.view_changed.connect(self.on_view_changed)
+        layout.addWidget(self.view)
+        
+        # Barra de rolagem do trecho visível (em milissegundos)
+        self.view_scrollbar = QScrollBar(Qt.Horizontal)
+        self.view_scrollbar.setRange(0, 0)
+        self.view_scrollbar.valueChanged.connect(self.on_scrollbar_changed)
+        layout.addWidget(self.view_scrollbar)
     
-    def load_waveform(self, waveform_data: np.ndarray, duration: float, sample_rate: int):
+    def create_view(self) -> QWidget:
+        """Cria a visualização do waveform conforme o backend escolhido."""
+        if self.backend == "matplotlib":
+            # Importado só quando usado: matplotlib é pesado para carregar
+            from app.widgets.waveform_canvas import WaveformCanvas
+            return WaveformCanvas()
+        return WaveformView()
+    
+    def load_waveform(self, waveform_data: np.ndarray, duration: float, sample_rate: float,
+                      keep_view: bool = False):
         """
         Carrega dados do waveform.
         
@@ -118,6 +140,7 @@ class WaveformWidget(QWidget):
             waveform_data: Dados do waveform
             duration: Duração em segundos
             sample_rate: Taxa de amostragem
+            keep_view: Mantém o zoom e a rolagem atuais
         """
         self.waveform_data = waveform_data
         self.duration = duration
@@ -129,89 +152,34 @@ class WaveformWidget(QWidget):
         # Atualizar label de duração
         self.duration_label.setText(self.format_time(duration))
         
-        # Plotar waveform
-        self.plot_waveform()
-    
-    def plot_wave(self, y, sr):
-        """Método simplificado para plotar waveform (compatível com MVP)."""
-        self.ax.clear()
-        t = np.arange(len(y)) / float(sr)
-        self.ax.plot(t, y, linewidth=0.8)
-        self.ax.set_xlabel("Tempo (s)")
-        self.ax.set_ylabel("Amplitude")
-        self.ax.set_title("Waveform")
-        self.ax.margins(x=0)
-        self.draw()
+        # Desenhar waveform
+        self.view.load_waveform(waveform_data, duration, sample_rate, keep_view)
     
-    def plot_waveform(self):
-        """Plota o waveform no canvas."""
-        if self.waveform_data is None:
-            return
-        
-        self.ax.clear()
-        
-        # Criar array de tempo
-        time = np.linspace(0, self.duration, len(self.waveform_data))
-        
-        # Plotar waveform
-        self.ax.plot(time, self.waveform_data, 'b-', linewidth=0.5, alpha=0.7)
-        self.ax.fill_between(time, self.waveform_data, alpha=0.3)
-        
-        # Configurar eixos
-        self.ax.set_xlim(0, self.duration)
-        self.ax.set_xlabel('Tempo (s)')
-        self.ax.set_ylabel('Amplitude')
-        self.ax.grid(True, alpha=0.3)
+    def load_generator(self, generator, keep_view: bool = False):
+        """
+        Carrega o waveform a partir de um WaveformGenerator.
         
-        # Adicionar linhas de letra se existirem
-        self.plot_lyric_lines()
+        Args:
+            generator: Gerador já carregado (com ou sem amostras em memória)
+            keep_view: Mantém o zoom e a rolagem atuais
+        """
+        self.waveform_data = generator.waveform_data
+        self.duration = generator.duration
+        self.sample_rate = generator.sample_rate
         
-        # Adicionar cursor
-        self.cursor_line, = self.ax.plot([], [], 'r-', linewidth=2, alpha=0.8)
+        self.position_slider.setMaximum(int(self.duration * 1000))
+        self.duration_label.setText(self.format_time(self.duration))
         
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self.view.load_generator(generator, keep_view)
     
-    def plot_lyric_lines(self):
-        """Plota as linhas de letra no waveform."""
-        # Limpar retângulos anteriores
-        for rect in self.line_rectangles:
-            rect.remove()
-        self.line_rectangles.clear()
-        
-        if not self.lines:
-            return
-        
-        # Adicionar retângulos para cada linha
-        for i, line in enumerate(self.lines):
-            if not line.is_empty():
-                # Cor alternada para melhor visualização
-                color = 'lightblue' if i % 2 == 0 else 'lightgreen'
-                alpha = 0.3
-                
-                rect = Rectangle(
-                    (line.start, -1), 
-                    line.end - line.start, 
-                    2, 
-                    facecolor=color, 
-                    alpha=alpha,
-                    edgecolor='blue',
-                    linewidth=1
-                )
-                self.ax.add_patch(rect)
-                self.line_rectangles.append(rect)
-                
-                # Adicionar texto da linha (se couber)
-                if line.end - line.start > 2:  # Só se a linha for longa o suficiente
-                    mid_time = (line.start + line.end) / 2
-                    self.ax.text(mid_time, 0.8, line.text[:20] + "..." if len(line.text) > 20 else line.text,
-                               ha='center', va='center', fontsize=8, rotation=0)
+    def plot_wave(self, y, sr):
+        """Método simplificado para plotar waveform (compatível com MVP)."""
+        self.view.plot_wave(y, sr)
     
     def update_lines(self, lines: list):
         """Atualiza as linhas de letra exibidas."""
         self.lines = lines
-        if self.waveform_data is not None:
-            self.plot_waveform()
+        self.view.update_lines(lines)
     
     def set_position(self, position: float):
         """Define a posição atual do cursor."""
@@ -225,14 +193,13 @@ class WaveformWidget(QWidget):
         # Atualizar label
         self.position_label.setText(self.format_time(position))
         
-        # Atualizar cursor no plot
-        self.update_cursor()
-    
-    def update_cursor(self):
-        """Atualiza a posição do cursor no plot."""
-        if self.cursor_line is not None:
-            self.cursor_line.set_data([self.current_position, self.current_position], [-1, 1])
-            self.canvas.draw_idle()
+        # Durante a reprodução, virar a página quando o cursor sai do trecho visível
+        if self.is_playing and not self.view.view_start <= position <= self.view.view_end:
+            span = self.view.view_end - self.view.view_start
+            self.view.set_view(position, position + span)
+        
+        # Atualizar cursor
+        self.view.set_position(position)
     
     def set_playing(self, playing: bool):
         """Define se está tocando."""
@@ -261,22 +228,33 @@ class WaveformWidget(QWidget):
         # Retomar reprodução se estava tocando
         pass
     
-    def on_mouse_click(self, event):
-        """Chamado quando o mouse é clicado no plot."""
-        if event.inaxes == self.ax and event.button == 1:  # Botão esquerdo
-            position = event.xdata
-            if position is not None:
-                self.set_position(position)
-                self.seek_requested.emit(position)
+    def on_view_clicked(self, position: float):
+        """Chamado quando o waveform é clicado."""
+        self.set_position(position)
+        self.seek_requested.emit(position)
+    
+    def on_view_changed(self, start: float, end: float):
+        """Sincroniza a barra de rolagem com o trecho visível."""
+        span_ms = int((end - start) * 1000)
+        self.view_scrollbar.blockSignals(True)
+        self.view_scrollbar.setRange(0, max(0, int(self.duration * 1000) - span_ms))
+        self.view_scrollbar.setPageStep(max(span_ms, 1))
+        self.view_scrollbar.setSingleStep(max(span_ms // 10, 1))
+        self.view_scrollbar.setValue(int(start * 1000))
+        self.view_scrollbar.blockSignals(False)
+    
+    def on_scrollbar_changed(self, value: int):
+        """Chamado quando a barra de rolagem é movida."""
+        span = self.view.view_end - self.view.view_start
+        start = value / 1000.0
+        self.view.set_view(start, start + span)
     
-    def on_mouse_move(self, event):
-        """Chamado quando o mouse se move sobre o plot."""
-        if event.inaxes == self.ax:
-            # Mostrar posição no tooltip ou status
-            if event.xdata is not None:
-                time_str = self.format_time(event.xdata)
-                # Aqui você pode atualizar um tooltip ou status bar
-                pass
+    def zoom(self, factor: float):
+        """Aplica zoom centrado no cursor, se visível, ou no centro do trecho."""
+        anchor = self.current_position
+        if not self.view.view_start <= anchor <= self.view.view_end:
+            anchor = None
+        self.view.zoom(factor, anchor)
     
     def cycle_speed(self):
         """Alterna entre velocidades de reprodução."""
@@ -302,33 +280,16 @@ class WaveformWidget(QWidget):
     
     def highlight_line(self, line_index: int):
         """Destaca uma linha específica no waveform."""
-        if 0 <= line_index < len(self.lines):
-            line = self.lines[line_index]
-            if not line.is_empty():
-                # Destacar a linha
-                self.ax.axvspan(line.start, line.end, alpha=0.5, color='yellow')
-                self.canvas.draw()
+        self.view.highlight_line(line_index)
     
     def clear_highlights(self):
         """Remove todos os destaques."""
-        # Remover spans de destaque
-        for span in self.ax.collections:
-            if hasattr(span, '_highlight'):
-                span.remove()
-        self.canvas.draw()
+        self.view.clear_highlights()
     
     def zoom_to_line(self, line_index: int):
         """Faz zoom para uma linha específica."""
-        if 0 <= line_index < len(self.lines):
-            line = self.lines[line_index]
-            if not line.is_empty():
-                # Adicionar margem
-                margin = (line.end - line.start) * 0.1
-                self.ax.set_xlim(max(0, line.start - margin), 
-                               min(self.duration, line.end + margin))
-                self.canvas.draw()
+        self.view.zoom_to_line(line_index)
     
     def reset_zoom(self):
         """Reseta o zoom para mostrar todo o waveform."""
-        self.ax.set_xlim(0, self.duration)
-        self.canvas.draw()
+        self.view.reset_zoom()
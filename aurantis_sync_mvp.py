@@ -1,6 +1,6 @@
 """
 AurantisSync – App GUI de Transcrição & Sincronização de Letras
-Stack: Python 3.10+, PySide6, faster-whisper, librosa, matplotlib
+Stack: Python 3.10+, PySide6, faster-whisper, librosa
 
 Recursos neste MVP:
 - Abrir áudio (.wav/.mp3)
@@ -18,7 +18,6 @@ Requisitos (requirements.txt):
   PySide6
   faster-whisper
   librosa
-  matplotlib
   numpy
   soundfile
 
@@ -39,11 +38,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
-import numpy as np
-import matplotlib
-matplotlib.use("QtAgg")  # Backend Qt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from app.widgets.waveform_view import WaveformView
 
 # --- MODELO ---
 @dataclass
@@ -128,27 +123,6 @@ def export_json(lines: List[Line], path: str):
         json.dump(payload, f, ensure_ascii=False, indent=2)
 
 
-# --- WAVEFORM WIDGET ---
-class WaveformWidget(FigureCanvas):
-    def __init__(self, parent=None):
-        self.fig = Figure(figsize=(6, 2), tight_layout=True)
-        super().__init__(self.fig)
-        self.ax = self.fig.add_subplot(111)
-        self.ax.set_title("Waveform")
-        self.ax.set_xlabel("Tempo (s)")
-        self.ax.set_ylabel("Amplitude")
-
-    def plot_wave(self, y, sr):
-        self.ax.clear()
-        t = np.arange(len(y)) / float(sr)
-        self.ax.plot(t, y, linewidth=0.8)
-        self.ax.set_xlabel("Tempo (s)")
-        self.ax.set_ylabel("Amplitude")
-        self.ax.set_title("Waveform")
-        self.ax.margins(x=0)
-        self.draw()
-
-
 # --- JANELA PRINCIPAL ---
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -189,7 +163,7 @@ class MainWindow(QMainWindow):
         top_bar.addStretch(1)
 
         # Waveform + table
-        self.wave = WaveformWidget()
+        self.wave = WaveformView()
 
         self.table = QTableWidget(0, 3)
         self.table.setHorizontalHeaderLabels(["Início (s)", "Fim (s)", "Texto"])
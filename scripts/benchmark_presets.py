@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos presets de transcrição: fator de tempo real (RTF) e taxa de
+erro de palavras (WER) em um clipe de referência.
+
+Uso:
+    python scripts/benchmark_presets.py clipe.wav --reference clipe.txt --model base
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Adicionar a raiz do projeto ao path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.transcriber import Transcriber
+from app.core.benchmark import benchmark_presets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede RTF e WER de cada preset de transcrição.")
+    parser.add_argument("audio", help="Clipe de áudio de referência")
+    parser.add_argument("--reference", help="Arquivo de texto com a transcrição correta do clipe")
+    parser.add_argument("--language", default="pt", help="Código do idioma (padrão: pt)")
+    parser.add_argument("--model", default="base", help="Tamanho do modelo (padrão: base)")
+    parser.add_argument("--preset", action="append", choices=list(Transcriber.PRESETS),
+                        help="Preset a medir (repetível; padrão: todos)")
+    args = parser.parse_args()
+
+    reference = None
+    if args.reference:
+        reference = Path(args.reference).read_text(encoding="utf-8")
+
+    transcriber = Transcriber()
+    print(f"Dispositivo: {transcriber.get_device_info()}")
+    print(f"Modelo: {args.model}\n")
+
+    results = benchmark_presets(transcriber, args.audio, reference,
+                                args.language, args.model, args.preset)
+
+    print(f"{'Preset':<10} {'Áudio (s)':>10} {'Tempo (s)':>10} {'RTF':>7} {'WER':>7}")
+    for result in results:
+        wer = f"{result.wer:.1%}" if result.wer is not None else "-"
+        print(f"{result.preset:<10} {result.audio_duration:>10.1f} {result.elapsed:>10.2f} "
+              f"{result.rtf:>7.3f} {wer:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Servidor local de transcrição: compartilha uma máquina com bastante CPU
+entre vários editores por uma API HTTP/JSON (ver app/core/transcription_server.py).
+
+Uso:
+    python scripts/transcription_server.py --host 0.0.0.0 --port 8765 --workers 2
+
+Exemplo de cliente:
+    curl --data-binary @musica.mp3 "http://servidor:8765/jobs?filename=musica.mp3&model=small"
+    curl http://servidor:8765/jobs/<id>
+    curl http://servidor:8765/jobs/<id>/export/srt
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Adicionar a raiz do projeto ao path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.config import (
+    SERVER_HOST, SERVER_PORT, SERVER_SPOOL_DIR, SERVER_WORKERS, SERVER_MAX_PENDING
+)
+from app.core.transcription_server import TranscriptionService, serve
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor HTTP de transcrição para vários editores.")
+    parser.add_argument("--host", default=SERVER_HOST,
+                        help=f"Endereço de escuta (padrão: {SERVER_HOST}; 0.0.0.0 para a rede local)")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help=f"Porta (padrão: {SERVER_PORT})")
+    parser.add_argument("--workers", type=int, default=SERVER_WORKERS,
+                        help=f"Transcrições simultâneas (padrão: {SERVER_WORKERS})")
+    parser.add_argument("--max-pending", type=int, default=SERVER_MAX_PENDING,
+                        help=f"Jobs esperando antes de recusar envios (padrão: {SERVER_MAX_PENDING})")
+    parser.add_argument("--spool", default=SERVER_SPOOL_DIR,
+                        help="Pasta dos áudios recebidos e da fila")
+    args = parser.parse_args()
+
+    service = TranscriptionService(args.spool, args.workers, args.max_pending)
+    server = serve(args.host, args.port, service)
+    print(f"Servidor de transcrição em {server.url} ({service.workers} worker(s))")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nEncerrando...")
+    finally:
+        server.server_close()
+        service.stop()
+
+
+if __name__ == "__main__":
+    main()
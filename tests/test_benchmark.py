@@ -0,0 +1,48 @@
+"""
+Testes do benchmark de transcrição do AurantisSync.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar a raiz do projeto ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.sync_model import LyricLine
+from app.core.benchmark import word_error_rate, benchmark_presets
+from app.core.alignment import SAMPLE_RATE
+
+
+def test_word_error_rate():
+    """WER ignora caixa e pontuação e conta substituições, inserções e remoções."""
+    reference = "Eu sei que vou te amar, por toda a minha vida"
+    assert word_error_rate(reference, "eu sei que vou te amar por toda a minha vida") == 0.0
+    # Duas remoções ("a", "minha") e uma inserção ("eu") em 11 palavras
+    assert word_error_rate(reference, "Eu sei que vou te amar por toda vida eu") == 3 / 11
+    assert word_error_rate("", "") == 0.0
+    assert word_error_rate("", "ruído") == 1.0
+
+
+class PresetTranscriber:
+    """Transcritor que devolve um texto diferente por preset."""
+    PRESETS = {"draft": {}, "accurate": {}}
+    TEXTS = {"draft": "um dois tres", "accurate": "um dois três quatro"}
+
+    def load_audio(self, audio_path):
+        return np.zeros(10 * SAMPLE_RATE, dtype=np.float32)
+
+    def load_model(self, model_size, preset):
+        return True
+
+    def transcribe(self, audio_path, language, model_size, preset):
+        return [LyricLine(start=0.0, end=1.0, text=self.TEXTS[preset])]
+
+
+def test_benchmark_presets():
+    """Cada preset recebe seu RTF e WER."""
+    results = benchmark_presets(PresetTranscriber(), "clipe.wav", "Um, dois, três, quatro.")
+
+    assert [r.preset for r in results] == ["draft", "accurate"]
+    assert [r.wer for r in results] == [0.5, 0.0]
+    assert all(r.audio_duration == 10.0 and r.rtf == r.elapsed / 10.0 for r in results)
@@ -0,0 +1,114 @@
+"""
+Testes dos exportadores do AurantisSync.
+"""
+import io
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+# Adicionar a raiz do projeto ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.sync_model import LyricLine
+from app.core.exporters import Exporter
+
+
+def make_lines():
+    """Cria linhas de exemplo, incluindo uma vazia."""
+    return [
+        LyricLine(start=0.0, end=1.5, text="Primeira linha"),
+        LyricLine(start=1.5, end=3.0, text="   "),
+        LyricLine(start=3.0, end=4.25, text="Segunda linha"),
+    ]
+
+
+def test_export_all(tmp_path):
+    """Exporta todos os formatos de uma vez."""
+    exported = Exporter.export_all(make_lines(), str(tmp_path / "letra"))
+
+    assert list(exported) == list(Exporter.FORMATS)
+    for format_type, path in exported.items():
+        assert Path(path).suffix == Exporter.FORMATS[format_type]["extension"]
+        assert os.path.exists(path)
+
+    srt = Path(exported["srt"]).read_text(encoding="utf-8")
+    assert srt.startswith("1\n00:00:00,000 --> 00:00:01,500\nPrimeira linha\n")
+    assert "2\n00:00:03,000 --> 00:00:04,250\nSegunda linha\n" in srt
+
+    # Nenhum temporário deve sobrar no diretório
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        Path(p).name for p in exported.values()
+    )
+
+
+@pytest.mark.skipif(os.name == "nt", reason="permissões POSIX")
+def test_export_keeps_file_permissions(tmp_path):
+    """O arquivo exportado não fica restrito ao dono (como o temporário)."""
+    umask = os.umask(0o022)
+    os.umask(umask)
+    path = tmp_path / "letra.srt"
+
+    Exporter.export(make_lines(), str(path), "srt")
+    assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+
+    # Regravar mantém as permissões do arquivo existente
+    path.chmod(0o640)
+    Exporter.export(make_lines(), str(path), "srt")
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+
+def test_export_all_without_lines(tmp_path):
+    """Sem linhas válidas nada é exportado."""
+    lines = [LyricLine(start=0.0, end=1.0, text="")]
+    assert Exporter.export_all(lines, str(tmp_path / "letra")) == {}
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_render_matches_file(tmp_path):
+    """A renderização em memória produz o mesmo conteúdo do arquivo."""
+    lines = make_lines()
+    for format_type in Exporter.FORMATS:
+        path = tmp_path / f"letra.{format_type}"
+        Exporter.export(lines, str(path), format_type)
+
+        # Bytes, para pegar diferenças de quebra de linha (CRLF no Windows)
+        text = Exporter.render(lines, format_type)
+        assert path.read_bytes() == text.encode("utf-8")
+        assert Exporter.render_bytes(lines, format_type) == path.read_bytes()
+
+
+def test_write_to_binary_stream():
+    """Streams binários recebem o texto codificado e continuam abertos."""
+    stream = io.BytesIO()
+    Exporter.write(make_lines(), stream, "lrc")
+
+    assert not stream.closed
+    assert stream.getvalue().decode("utf-8") == "[00:00.00]Primeira linha\n[00:03.00]Segunda linha\n"
+
+
+def test_validate_lines():
+    """Problemas de tempo viram registros estruturados, em ordem de linha."""
+    lines = [
+        LyricLine(start=0.0, end=2.0, text="Sobrepõe a próxima"),
+        LyricLine(start=1.5, end=3.0, text="ok"),
+        LyricLine(start=3.0, end=4.0, text=""),
+        LyricLine(start=4.0, end=5.0, text="Invertida"),
+        LyricLine(start=5.0, end=6.0, text="ok"),
+    ]
+    lines[3].end = 3.5
+    lines[4].start = -1.0
+
+    issues = Exporter.validate_lines(lines)
+
+    assert [(i.index, i.kind) for i in issues] == [
+        (0, "overlap"),
+        (3, "inverted_range"),
+        (3, "overlap"),
+        (4, "negative_start"),
+    ]
+    assert str(issues[0]) == "Linha 1: Sobreposição com próxima linha (2.0 > 1.5)"
+    assert issues[1].message == "Linha 4: Tempo de fim deve ser maior que início (4.0 -> 3.5)"
+    assert Exporter.validate_lines([]) == []
@@ -0,0 +1,68 @@
+"""
+Testes da sincronização guiada do AurantisSync.
+"""
+import sys
+from pathlib import Path
+
+# Adicionar a raiz do projeto ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.sync_model import LyricLine, SyncProject
+from app.core.guided_sync import GuidedSync
+
+
+def make_project(count=4):
+    """Cria um projeto com linhas ainda sem tempo."""
+    return SyncProject(lines=[LyricLine(text=f"Linha {i + 1}") for i in range(count)])
+
+
+def test_taps_write_compensated_times():
+    """Cada toque inicia a linha atual e fecha a anterior, descontando a reação."""
+    project = make_project()
+    engine = GuidedSync(project, reaction_offset=0.2)
+    engine.start()
+
+    assert engine.tap(1.2) == [0]
+    assert engine.tap(3.2) == [0, 1]
+    assert engine.mark_end(5.2) == [1]
+    assert engine.tap(6.2) == [2]
+
+    times = [(round(line.start, 6), round(line.end, 6)) for line in project.lines[:3]]
+    assert times == [(1.0, 3.0), (3.0, 5.0), (6.0, 6.0)]
+    assert engine.current_line == 3
+
+    # Toque atrasado demais não volta para antes da linha anterior
+    assert engine.tap(5.0) == [2, 3]
+    assert project.lines[3].start == project.lines[2].start == 6.0
+
+
+def test_undo_restores_lines():
+    """Desfazer volta tempos e linha atual."""
+    project = make_project(2)
+    engine = GuidedSync(project)
+    engine.start()
+    engine.tap(1.0)
+    engine.tap(2.0)
+
+    assert engine.undo() == [0, 1]
+    assert engine.current_line == 1
+    assert (project.lines[0].end, project.lines[1].start) == (1.0, 0.0)
+    assert engine.tap(2.5) == [0, 1]
+    assert engine.current_line is None
+    assert engine.tap(3.0) == []
+
+
+def test_reaction_offset_calibration():
+    """O atraso é a mediana dos toques sobre linhas já sincronizadas."""
+    starts = [1.0, 2.0, 3.0, 4.0, 5.0]
+    project = SyncProject(lines=[LyricLine(start=s, end=s + 1.0, text="x") for s in starts])
+    engine = GuidedSync(project)
+    engine.start()
+
+    for start, delay in zip(starts[:3], (0.15, 0.12, 0.18)):
+        engine.tap(start + delay)
+    assert engine.estimate_reaction_offset() is None
+
+    engine.tap(starts[3] + 0.14)
+    engine.tap(starts[4] + 5.0)  # Fora do ritmo, ignorado
+    assert abs(engine.estimate_reaction_offset() - 0.145) < 1e-9
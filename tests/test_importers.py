@@ -0,0 +1,146 @@
+"""
+Testes dos importadores do AurantisSync.
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Adicionar a raiz do projeto ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.sync_model import LyricLine
+from app.core.exporters import Exporter
+from app.core.importers import (Importer, ImporterError, parse_srt, parse_vtt,
+                                parse_lrc, parse_json)
+
+
+def test_parse_srt_tolerates_malformed_blocks():
+    """Blocos sem timing e índices grudados são ignorados."""
+    text = (
+        "\ufeff1\n00:00:01,000 --> 00:00:02,500\nOlá\nmundo\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nSem linha em branco\n\n"
+        "3\nlixo --> lixo\nIgnorada\n\n"
+        "4\n00:05.5 --> 00:06.25\nSem horas\n"
+    )
+    lines = list(parse_srt(text.splitlines()))
+
+    assert [(l.start, l.end, l.text) for l in lines] == [
+        (1.0, 2.5, "Olá mundo"),
+        (3.0, 4.0, "Sem linha em branco"),
+        (5.5, 6.25, "Sem horas"),
+    ]
+
+
+def test_parse_vtt_strips_markup():
+    """Cabeçalho, NOTE, identificadores e tags não viram texto."""
+    text = (
+        "WEBVTT\n\nNOTE comentário\n\n"
+        "intro\n00:01.000 --> 00:02.000 align:start\n<v Cantor>Tom &amp; <i>som</i>\n"
+    )
+    lines = list(parse_vtt(text.splitlines()))
+
+    assert len(lines) == 1
+    assert (lines[0].start, lines[0].end, lines[0].text) == (1.0, 2.0, "Tom & som")
+
+
+def test_parse_lrc_multi_timestamp():
+    """Linhas com vários timestamps são repetidas e ordenadas."""
+    text = (
+        "[ar:Artista]\n[offset:500]\n"
+        "[00:10.00][00:30.00]Refrão\n"
+        "[00:20.50]<00:20.50>Verso <00:21.00>um\n"
+        "[00:35.00]\n"
+    )
+    lines = list(parse_lrc(text.splitlines()))
+
+    assert [(l.start, l.end, l.text) for l in lines] == [
+        (9.5, 20.0, "Refrão"),
+        (20.0, 29.5, "Verso um"),
+        (29.5, 34.5, "Refrão"),
+    ]
+
+
+def test_parse_json_formats():
+    """Aceita lista exportada, projeto e itens malformados."""
+    data = {"project": {"lines": [
+        {"start": 1, "end": 2, "text": "ok"},
+        {"start": "x", "end": 2, "text": "tempo inválido"},
+        {"start": 3, "end": 4, "text": "  "},
+        "lixo",
+    ]}}
+    lines = list(parse_json(data))
+
+    assert [(l.start, l.end, l.text) for l in lines] == [(1.0, 2.0, "ok")]
+
+
+def test_round_trip(tmp_path):
+    """O que é exportado volta igual ao ser importado."""
+    original = [
+        LyricLine(start=0.5, end=2.0, text="Primeira"),
+        LyricLine(start=2.0, end=3.75, text="Segunda"),
+    ]
+    exported = Exporter.export_all(original, str(tmp_path / "letra"))
+
+    for format_type in ("srt", "vtt", "json"):
+        lines = Importer.import_lines(exported[format_type])
+        assert [(l.start, l.end, l.text) for l in lines] == \
+            [(l.start, l.end, l.text) for l in original]
+
+    project = Importer.import_project(exported["lrc"])
+    assert [l.text for l in project.lines] == ["Primeira", "Segunda"]
+    assert project.lines[0].end == 2.0
+
+
+def test_unsupported_format(tmp_path):
+    """Extensão desconhecida gera ImporterError."""
+    path = tmp_path / "letra.doc"
+    path.write_text("nada", encoding="utf-8")
+    try:
+        Importer.import_lines(str(path))
+    except ImporterError:
+        pass
+    else:
+        raise AssertionError("ImporterError esperado")
+
+
+def write_large_srt(path, blocks=100_000):
+    """Grava um SRT com ``blocks`` blocos; o bloco i começa em i * 0,1 s (módulo 1 h)."""
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(blocks):
+            f.write(f"{i + 1}\n00:{i // 600 % 60:02d}:{i // 10 % 60:02d},{i % 10}00 --> "
+                    f"00:{i // 600 % 60:02d}:{i // 10 % 60:02d},{i % 10}50\nLinha {i}\n\n")
+
+
+def test_large_srt(tmp_path):
+    """100 mil blocos são lidos inteiros, cada um com seus tempos."""
+    path = tmp_path / "grande.srt"
+    write_large_srt(path)
+
+    lines = Importer.import_lines(str(path))
+
+    assert len(lines) == 100_000
+    seen = set()
+    for line in lines:
+        i = int(line.text.split()[1])
+        seen.add(i)
+        start = (i // 600 % 60) * 60 + (i // 10 % 60) + (i % 10) / 10
+        assert abs(line.start - start) < 1e-6
+        assert abs(line.end - (start + 0.05)) < 1e-6
+    assert len(seen) == 100_000
+
+
+@pytest.mark.benchmark
+def test_large_srt_is_fast(tmp_path):
+    """100 mil blocos devem ser lidos em bem menos de um segundo."""
+    path = tmp_path / "grande.srt"
+    write_large_srt(path)
+
+    started = time.perf_counter()
+    lines = Importer.import_lines(str(path))
+    elapsed = time.perf_counter() - started
+
+    assert len(lines) == 100_000
+    assert elapsed < 1.0
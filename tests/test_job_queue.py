@@ -0,0 +1,97 @@
+"""
+Testes da fila de transcrição do AurantisSync.
+"""
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# Adicionar a raiz do projeto ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.alignment import SAMPLE_RATE
+from app.core.job_queue import JobQueue, TranscriptionJob
+from app.core.transcriber import Transcriber
+
+
+class SegmentModel:
+    """Modelo que devolve um segmento a cada 10 s do áudio recebido."""
+
+    def transcribe(self, audio, **options):
+        duration = len(audio) / SAMPLE_RATE
+        segments = []
+        for i in range(int(duration // 10)):
+            word = SimpleNamespace(word=f" parte{i}", start=i * 10.0, end=i * 10.0 + 5.0)
+            segments.append(SimpleNamespace(text=word.word, start=word.start, end=i * 10.0 + 10.0,
+                                            words=[word]))
+        return iter(segments), None
+
+
+def make_transcriber(duration=40):
+    """Transcritor com o modelo falso e o áudio já decodificado."""
+    transcriber = Transcriber()
+    transcriber.model = SegmentModel()
+    transcriber.load_model = lambda model_size, preset: True
+    transcriber._audio = ("musica.wav", np.zeros(duration * SAMPLE_RATE, dtype=np.float32))
+    return transcriber
+
+
+def test_priority_order_and_persistence(tmp_path):
+    """Maior prioridade sai primeiro; a fila sobrevive a um reinício."""
+    path = tmp_path / "jobs.json"
+    queue = JobQueue(str(path))
+    first = queue.add("a.wav")
+    urgent = queue.add("b.wav", priority=5)
+    queue.add("c.wav")
+
+    assert queue.next_job() is urgent
+    urgent.status = TranscriptionJob.RUNNING
+    queue.cancel(first.id)
+    queue.save()
+
+    reloaded = JobQueue(str(path))
+    assert [job.audio_path for job in reloaded.ordered()] == ["b.wav", "c.wav", "a.wav"]
+    # Interrompido pelo encerramento: volta a pendente
+    assert reloaded.get(urgent.id).status == TranscriptionJob.PENDING
+    assert reloaded.get(first.id).status == TranscriptionJob.CANCELLED
+
+
+def test_process_reports_progress_and_result(tmp_path):
+    """O progresso vem do fim de cada segmento; o resultado fica salvo no job."""
+    queue = JobQueue(str(tmp_path / "jobs.json"))
+    job = queue.add("musica.wav", model_size="small")
+    seen = []
+
+    queue.process(job, make_transcriber(), on_progress=lambda job: seen.append(job.progress))
+
+    assert seen == [0.0, 0.0, 0.25, 0.5, 0.75, 1.0]
+    assert job.status == TranscriptionJob.DONE
+    assert job.duration == 40.0
+    assert [line.text for line in job.to_project().lines] == ["parte0", "parte1", "parte2", "parte3"]
+    assert JobQueue(str(tmp_path / "jobs.json")).get(job.id).lines[3].text == "parte3"
+
+
+def test_cancel_running_job_and_eta(tmp_path):
+    """Cancelar para no próximo segmento; a previsão soma os jobs à frente."""
+    queue = JobQueue(str(tmp_path / "jobs.json"))
+    job = queue.add("musica.wav")
+    later = queue.add("outra.wav")
+    job.duration = later.duration = 40.0
+
+    def predict(job):
+        return 0.5 * job.duration
+
+    times = []
+
+    def on_progress(current):
+        times.append(queue.remaining_times(predict))
+        if current.progress >= 0.5:
+            queue.cancel(current.id)
+
+    queue.process(job, make_transcriber(), on_progress=on_progress)
+
+    assert job.status == TranscriptionJob.CANCELLED
+    assert times[0] == {job.id: 20.0, later.id: 40.0}
+    assert times[3] == {job.id: 10.0, later.id: 30.0}
+    assert queue.next_job() is later
@@ -0,0 +1,54 @@
+"""
+Testes do refinamento do rascunho do AurantisSync.
+"""
+import sys
+from pathlib import Path
+
+# Adicionar a raiz do projeto ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.sync_model import LyricLine, SyncProject
+from app.core.refinement import DraftRefinement
+
+
+def make_draft():
+    """Rascunho com quatro linhas de 2 s separadas por pausas de 1 s."""
+    lines = [LyricLine(start=i * 3.0, end=i * 3.0 + 2.0, text=f"rascunho {i}") for i in range(4)]
+    return SyncProject(lines=list(lines)), DraftRefinement(lines)
+
+
+def test_merge_keeps_user_edits():
+    """Só linhas intactas do rascunho são trocadas; edições e remoções ficam."""
+    project, refinement = make_draft()
+    project.lines[1].text = "editada pelo usuário"
+    del project.lines[3]
+
+    refined = [LyricLine(start=i * 3.0 + 0.1, end=i * 3.0 + 2.2, text=f"refinada {i}") for i in range(4)]
+    assert refinement.merge(project, 0.0, 12.0, refined) == 2
+
+    assert [line.text for line in project.lines] == ["refinada 0", "editada pelo usuário", "refinada 2"]
+    assert project.lines[0].end == 2.2
+    assert not refinement.is_untouched(project.lines[1])
+
+
+def test_merge_clamps_to_edited_neighbours():
+    """Linhas refinadas não invadem as linhas mantidas."""
+    project, refinement = make_draft()
+    project.lines[1].start = 2.5
+
+    refined = [LyricLine(start=0.0, end=3.5, text="longa"), LyricLine(start=6.0, end=8.0, text="nova")]
+    assert refinement.merge(project, 0.0, 8.5, refined) == 2
+
+    assert [(line.start, line.end, line.text) for line in project.lines] == [
+        (0.0, 2.5, "longa"), (2.5, 5.0, "rascunho 1"), (6.0, 8.0, "nova"), (9.0, 11.0, "rascunho 3")
+    ]
+
+
+def test_spans_cut_in_pauses():
+    """Os trechos cobrem o áudio e são cortados no meio das pausas."""
+    lines = [LyricLine(start=i * 30.0, end=i * 30.0 + 28.0, text=str(i)) for i in range(5)]
+    refinement = DraftRefinement(lines)
+    refinement.CHUNK_SECONDS = 50.0
+
+    assert refinement.spans(150.0) == [(0.0, 59.0), (59.0, 119.0), (119.0, 150.0)]
+    assert DraftRefinement([]).spans(10.0) == [(0.0, 10.0)]
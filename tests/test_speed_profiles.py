@@ -0,0 +1,65 @@
+"""
+Testes dos perfis de velocidade do AurantisSync.
+"""
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# Adicionar a raiz do projeto ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.speed_profiles import SpeedProfiles
+from app.core.transcriber import Transcriber
+from app.core.alignment import SAMPLE_RATE
+
+
+def test_profiles_persist_and_plan(tmp_path):
+    """RTFs salvos voltam do disco e guiam a previsão e a escolha de modelo."""
+    path = tmp_path / "perfis" / "speed_profiles.json"
+    profiles = SpeedProfiles(str(path))
+    for model_size, rtf in (("tiny", 0.05), ("base", 0.1), ("small", 0.3), ("medium", 0.9)):
+        profiles.record("cpu", "int8", "balanced", model_size, rtf)
+    profiles.record("cuda", "float16", "balanced", "medium", 0.02)
+    profiles.save()
+
+    profiles = SpeedProfiles(str(path))
+    models = list(Transcriber.MODELS)
+    assert profiles.predict_duration("cpu", "int8", "balanced", "small", 200.0) == 60.0
+    assert profiles.predict_duration("cpu", "int8", "draft", "small", 200.0) is None
+
+    # 200 s de áudio: small leva 60 s, medium 180 s
+    assert profiles.choose_model("cpu", "int8", "balanced", models, 200.0, 120.0) == "small"
+    assert profiles.choose_model("cpu", "int8", "balanced", models, 200.0, 5.0) == "tiny"
+    assert profiles.choose_model("cpu", "float32", "balanced", models, 200.0, 120.0) is None
+
+
+def test_calibrate_records_rtf(tmp_path):
+    """A calibração transcreve só o clipe e grava um RTF por modelo."""
+    transcriber = Transcriber()
+    transcriber.speed_profiles = SpeedProfiles(str(tmp_path / "speed_profiles.json"))
+    transcriber._audio = ("ref.wav", np.zeros(90 * SAMPLE_RATE, dtype=np.float32))
+
+    clips = []
+
+    def transcribe(audio, **options):
+        clips.append(len(audio) / SAMPLE_RATE)
+        return iter([]), None
+
+    loaded = []
+
+    def load_model(model_size, preset):
+        loaded.append(model_size)
+        return True
+
+    transcriber.model = SimpleNamespace(transcribe=transcribe)
+    transcriber.load_model = load_model
+
+    results = transcriber.calibrate("ref.wav", models=["tiny", "base"], clip_seconds=20.0)
+
+    assert loaded == ["tiny", "base"] and clips == [20.0, 20.0]
+    assert list(results) == ["tiny", "base"]
+    saved = SpeedProfiles(transcriber.speed_profiles.path)
+    assert saved.get_rtf(transcriber.device, transcriber.get_compute_type(), "balanced", "base") == results["base"]
+    assert transcriber.get_model_info("base")["rtf"] == results["base"]
@@ -0,0 +1,51 @@
+"""
+Testes do tempo de inicialização do AurantisSync.
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Tempo máximo para importar o ponto de entrada e o núcleo (benchmark)
+STARTUP_BUDGET_SECONDS = 1.5
+
+# Módulos que só podem ser carregados no primeiro uso
+HEAVY_MODULES = ["faster_whisper", "ctranslate2", "pydub", "librosa",
+                 "matplotlib", "scipy", "soxr", "torch"]
+
+STARTUP_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+import app.core.transcriber, app.core.waveform, app.core.alignment
+import app.core.benchmark, app.core.refinement
+app.main.check_dependencies()
+elapsed = time.perf_counter() - started
+print(json.dumps({"elapsed": elapsed,
+                  "loaded": [m for m in %r if m in sys.modules]}))
+"""
+
+
+def run_startup():
+    """Importa a aplicação num interpretador novo e mede o tempo."""
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT % (HEAVY_MODULES,)],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_startup_does_not_import_heavy_modules():
+    """Verificar dependências e importar o núcleo não carrega os módulos pesados."""
+    assert run_startup()["loaded"] == []
+
+
+@pytest.mark.benchmark
+def test_startup_within_budget():
+    """A importação cabe no orçamento de tempo."""
+    elapsed = min(run_startup()["elapsed"] for _ in range(3))
+    assert elapsed < STARTUP_BUDGET_SECONDS, f"Inicialização levou {elapsed:.2f}s"
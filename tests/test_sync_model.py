@@ -0,0 +1,41 @@
+"""
+Testes do modelo de dados do AurantisSync.
+"""
+import sys
+from pathlib import Path
+
+# Adicionar a raiz do projeto ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.sync_model import LyricLine, SyncProject, WordTiming
+
+
+def test_replace_range_keeps_neighbors():
+    """Só as linhas do trecho são trocadas; as vizinhas não mudam."""
+    before = LyricLine(start=0.0, end=4.2, text="Antes")
+    after = LyricLine(start=9.0, end=12.0, text="Depois")
+    project = SyncProject(lines=[
+        before,
+        LyricLine(start=4.2, end=6.0, text="Errada um"),
+        LyricLine(start=6.0, end=8.5, text="Errada dois"),
+        after,
+    ])
+
+    new_lines = [
+        LyricLine(start=6.5, end=9.3, text="Certa dois"),
+        LyricLine(start=4.0, end=6.4, text="Certa um"),
+    ]
+    assert project.replace_range(4.2, 8.5, new_lines) == (1, 2)
+
+    assert [line.text for line in project.lines] == ["Antes", "Certa um", "Certa dois", "Depois"]
+    assert project.lines[0] is before and project.lines[3] is after
+    assert (before.start, before.end, after.start, after.end) == (0.0, 4.2, 9.0, 12.0)
+    assert (project.lines[1].start, project.lines[2].end) == (4.2, 9.0)
+
+
+def test_words_round_trip():
+    """Tempos por palavra são salvos só quando existem."""
+    line = LyricLine(start=1.0, end=2.0, text="oi mundo",
+                     words=[WordTiming(1.0, 1.4, "oi"), WordTiming(1.5, 2.0, "mundo")])
+    assert LyricLine.from_dict(line.to_dict()) == line
+    assert "words" not in LyricLine(start=1.0, end=2.0, text="oi").to_dict()
@@ -0,0 +1,98 @@
+"""
+Testes do transcritor do AurantisSync.
+"""
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# Adicionar a raiz do projeto ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core import transcriber as transcriber_module
+from app.core.transcriber import Transcriber
+from app.core.alignment import SAMPLE_RATE
+
+
+class ClipModel:
+    """Modelo que "transcreve" palavras fixas, em tempos relativos ao trecho recebido."""
+
+    def __init__(self, words):
+        self.words = words
+        self.clips = []
+
+    def transcribe(self, audio, **options):
+        self.clips.append(len(audio) / SAMPLE_RATE)
+        words = [SimpleNamespace(word=text, start=start, end=end) for text, start, end in self.words]
+        segment = SimpleNamespace(text="".join(w.word for w in words), start=words[0].start,
+                                  end=words[-1].end, words=words)
+        return iter([segment]), None
+
+
+def test_transcribe_range_uses_cached_audio():
+    """Só o trecho com contexto vai para o modelo; palavras do contexto são descartadas."""
+    transcriber = Transcriber()
+    transcriber.model = ClipModel([
+        (" antes", 1.0, 1.8),    # 16,0 s: contexto
+        (" meio", 5.2, 5.6),     # 20,2 s
+        (" certo", 6.0, 6.9),    # 21,0 s
+        (" depois", 8.9, 9.6),   # 23,9 s: meio cai fora do trecho
+    ])
+    transcriber.load_model = lambda model_size, preset: True
+    transcriber._audio = ("musica.wav", np.zeros(60 * SAMPLE_RATE, dtype=np.float32))
+
+    lines = transcriber.transcribe_range("musica.wav", 20.0, 24.0, model_size="base", padding=5.0)
+
+    assert transcriber.model.clips == [14.0]
+    assert len(lines) == 1
+    assert lines[0].text == "meio certo"
+    assert [word.text for word in lines[0].words] == ["meio", "certo"]
+    assert (round(lines[0].start, 6), round(lines[0].end, 6)) == (20.2, 21.9)
+
+
+def test_device_detection_is_cached_without_torch(monkeypatch):
+    """A GPU é consultada no CTranslate2 uma única vez, sem importar o torch."""
+    import ctranslate2
+
+    calls = []
+
+    def get_cuda_device_count():
+        calls.append(1)
+        return 1
+
+    monkeypatch.setattr(ctranslate2, "get_cuda_device_count", get_cuda_device_count)
+    transcriber_module.cuda_device_count.cache_clear()
+    try:
+        devices = [Transcriber().device for _ in range(2)]
+        info = Transcriber().get_device_info()
+    finally:
+        transcriber_module.cuda_device_count.cache_clear()
+
+    assert devices == ["cuda", "cuda"]
+    assert info == "GPU: CUDA disponível (1 dispositivo)"
+    assert len(calls) == 1
+    assert "torch" not in sys.modules
+
+
+def test_transcription_uses_model_loaded_by_its_thread(monkeypatch):
+    """Outra thread trocar o modelo não muda o da transcrição em andamento."""
+    import faster_whisper
+
+    class NamedModel(ClipModel):
+        def __init__(self, model_size, **options):
+            super().__init__([(" " + model_size, 0.0, 1.0)])
+
+    monkeypatch.setattr(faster_whisper, "WhisperModel", NamedModel)
+    transcriber = Transcriber()
+    transcriber._audio = ("musica.wav", np.zeros(5 * SAMPLE_RATE, dtype=np.float32))
+
+    assert transcriber.load_model("tiny")
+    other = threading.Thread(target=transcriber.load_model, args=("large-v3",))
+    other.start()
+    other.join()
+
+    lines = transcriber._transcribe_audio(transcriber.load_audio("musica.wav"), "pt", "balanced")
+    assert transcriber.current_model_size == "large-v3"
+    assert [line.text for line in lines] == ["tiny"]
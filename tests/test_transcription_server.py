@@ -0,0 +1,153 @@
+"""
+Testes do servidor de transcrição do AurantisSync (só em localhost, com
+modelo falso).
+"""
+import json
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+# Adicionar a raiz do projeto ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.alignment import SAMPLE_RATE
+from app.core.transcriber import Transcriber
+from app.core.transcription_server import TranscriptionService, serve
+
+
+class StubModel:
+    """Modelo que devolve um segmento a cada 10 s e pode esperar um sinal."""
+
+    def __init__(self, release=None):
+        self.release = release
+
+    def transcribe(self, audio, **options):
+        if self.release is not None:
+            self.release.wait(5)
+        segments = []
+        for i in range(int(len(audio) / SAMPLE_RATE // 10)):
+            word = SimpleNamespace(word=f" parte{i}", start=i * 10.0, end=i * 10.0 + 5.0)
+            segments.append(SimpleNamespace(text=word.word, start=word.start, end=i * 10.0 + 10.0,
+                                            words=[word]))
+        return iter(segments), None
+
+
+class StubTranscriber(Transcriber):
+    """Transcritor que conta os carregamentos de modelo e não decodifica áudio."""
+
+    def __init__(self, release=None):
+        super().__init__()
+        self.release = release
+        self.loads = []
+
+    def load_model(self, model_size="base", preset=Transcriber.DEFAULT_PRESET):
+        if not self.is_model_loaded(model_size, preset):
+            self.loads.append(model_size)
+            self.model = StubModel(self.release)
+            self._model_key = (model_size, self.get_compute_type(preset), 1)
+        return True
+
+    def load_audio(self, audio_path):
+        return np.zeros(20 * SAMPLE_RATE, dtype=np.float32)
+
+
+@pytest.fixture
+def start_server(tmp_path):
+    """Inicia servidor e workers numa porta livre; encerra tudo no fim."""
+    running = []
+
+    def start(release=None, **options):
+        transcribers = []
+
+        def factory():
+            transcriber = StubTranscriber(release)
+            transcribers.append(transcriber)
+            return transcriber
+
+        service = TranscriptionService(str(tmp_path / "spool"), transcriber_factory=factory,
+                                       **options)
+        server = serve("127.0.0.1", 0, service)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        running.append((server, service))
+        return server, service, transcribers
+
+    yield start
+    for server, service in running:
+        server.shutdown()
+        server.server_close()
+        service.stop(timeout=5)
+
+
+def request(server, method, path, body=None):
+    """Faz uma requisição e devolve (status, cabeçalhos, corpo)."""
+    req = urllib.request.Request(server.url + path, data=body, method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=5) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def wait_for(server, job_id, status="done"):
+    """Consulta o job até chegar ao estado esperado."""
+    for _ in range(200):
+        data = json.loads(request(server, "GET", f"/jobs/{job_id}")[2])
+        if data["status"] == status:
+            return data
+        time.sleep(0.02)
+    raise AssertionError(f"Job {job_id} não chegou a {status}: {data}")
+
+
+def test_submit_poll_and_export(start_server):
+    """Envio, consulta e resultado; o modelo é reaproveitado entre jobs."""
+    server, service, transcribers = start_server()
+
+    code, headers, body = request(server, "POST", "/jobs?filename=a.mp3&model=small", b"audio")
+    assert code == 202
+    job = json.loads(body)
+    assert headers["Location"] == f"/jobs/{job['id']}"
+    assert "audio_path" not in job
+
+    assert wait_for(server, job["id"])["line_count"] == 2
+    lines = json.loads(request(server, "GET", f"/jobs/{job['id']}/lines")[2])["lines"]
+    assert [line["text"] for line in lines] == ["parte0", "parte1"]
+    code, headers, body = request(server, "GET", f"/jobs/{job['id']}/export/srt")
+    assert code == 200 and headers["Content-Type"].startswith("application/x-subrip")
+    assert b"00:00:10,000 --> 00:00:20,000\nparte1" in body.replace(b"\r\n", b"\n")
+
+    second = json.loads(request(server, "POST", "/jobs?model=small", b"audio")[2])
+    wait_for(server, second["id"])
+    assert transcribers[0].loads == ["small"]
+    # O áudio recebido é apagado quando o job termina
+    assert not list(Path(service.spool_dir).glob("*.mp3"))
+
+
+def test_full_queue_is_rejected_with_retry_after(start_server):
+    """Com os workers ocupados e a fila cheia, novos envios recebem 503."""
+    release = threading.Event()
+    server, service, _ = start_server(workers=1, max_pending=1, release=release)
+
+    running = json.loads(request(server, "POST", "/jobs", b"audio")[2])
+    wait_for(server, running["id"], "running")
+    waiting = json.loads(request(server, "POST", "/jobs", b"audio")[2])
+    assert waiting["position"] == 0
+
+    code, headers, body = request(server, "POST", "/jobs", b"audio")
+    assert code == 503 and int(headers["Retry-After"]) > 0
+    assert request(server, "GET", f"/jobs/{running['id']}/lines")[0] == 409
+    assert request(server, "POST", "/jobs?model=enorme", b"audio")[0] == 400
+
+    # Cancelar o pendente libera a vaga
+    assert request(server, "DELETE", f"/jobs/{waiting['id']}")[0] == 200
+    assert request(server, "POST", "/jobs", b"audio")[0] == 202
+    release.set()
+    wait_for(server, running["id"])
+    health = json.loads(request(server, "GET", "/health")[2])
+    assert health["max_pending"] == 1
@@ -0,0 +1,164 @@
+"""
+Testes do envelope de picos do AurantisSync.
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+# Adicionar a raiz do projeto ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.waveform import WaveformGenerator, PeakTileCache, compute_peaks
+from app.core.audio_loader import AudioLoader
+
+
+def make_generator(seconds=60, sample_rate=8000):
+    """Cria um gerador com ruído determinístico."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal(seconds * sample_rate).astype(np.float32)
+    return WaveformGenerator.from_array(data, sample_rate)
+
+
+def test_peak_levels_match_raw_samples():
+    """Qualquer nível de detalhe produz o mesmo envelope das amostras."""
+    generator = make_generator()
+    data = generator.waveform_data
+
+    # Colunas alinhadas aos blocos da pirâmide: resultado idêntico
+    for samples_per_column in (2, 256, 1024, 4096, 8192):
+        start = samples_per_column * 3
+        mins, maxs = generator.get_peak_columns(start, samples_per_column, 50)
+        expected = compute_peaks(data[start:start + samples_per_column * 50], 50)
+        assert np.array_equal(mins, expected[0])
+        assert np.array_equal(maxs, expected[1])
+
+    # Colunas desalinhadas ainda preservam os extremos do trecho
+    mins, maxs = generator.get_peak_columns(1000, 3000, 50)
+    segment = data[1000:1000 + 3000 * 50]
+    assert mins.min() <= segment.min() and maxs.max() >= segment.max()
+
+    assert generator.get_peak_amplitude() == float(np.abs(data).max())
+
+
+def test_get_peaks_clips_to_duration():
+    """Pedidos além do fim do áudio retornam só as colunas existentes."""
+    generator = make_generator(seconds=10)
+
+    mins, maxs = generator.get_peaks(5.0, 15.0, 100)
+    assert len(mins) == len(maxs) == 50
+    assert np.all(mins <= maxs)
+    assert len(generator.get_peaks(20.0, 30.0, 100)[0]) == 0
+
+
+def test_tile_cache_prefetch():
+    """Tiles vizinhos são calculados em segundo plano e reaproveitados."""
+    generator = make_generator()
+    cache = PeakTileCache(generator, tile_columns=64, max_tiles=8)
+    resolution = cache.resolution_for(300.0)
+    assert resolution == 256
+
+    tile = cache.get(resolution, 3)
+    expected = generator.get_peak_columns(3 * resolution * 64, resolution, 64)
+    assert np.array_equal(tile[0], expected[0])
+    assert cache.get(resolution, 3) is tile
+
+    cache.prefetch(resolution, [2, 4, 10 ** 6])
+    deadline = time.time() + 5
+    while cache._pending and time.time() < deadline:
+        time.sleep(0.01)
+    assert set(cache._tiles) == {(resolution, 2), (resolution, 3), (resolution, 4)}
+
+    # O limite de tiles descarta os menos usados
+    for index in range(5, 20):
+        cache.get(resolution, index)
+    assert len(cache._tiles) == 8
+    cache.shutdown()
+
+
+def test_streamed_load_matches_full_load(tmp_path):
+    """Carregar em blocos produz o mesmo waveform do carregamento completo."""
+    sample_rate = 44100
+    t = np.arange(sample_rate * 5) / sample_rate
+    wave = 0.5 * np.sin(2 * np.pi * 440 * t)
+    path = str(tmp_path / "tom.wav")
+    sf.write(path, np.stack([wave, wave * 0.5], axis=1), sample_rate, subtype="PCM_16")
+
+    loader = AudioLoader(path, block_frames=10000).open()
+    assert (loader.sample_rate, loader.channels, loader.frames) == (sample_rate, 2, len(t))
+
+    streamed = WaveformGenerator()
+    streamed.begin_stream(loader.sample_rate, loader.frames)
+    for block in loader.blocks():
+        streamed.feed_block(block)
+
+    # A prévia já cobre o que foi decodificado, em pares (mínimo, máximo)
+    preview, duration, preview_rate = streamed.get_preview_data()
+    assert duration == 5.0
+    assert preview_rate == 2 * streamed.sample_rate / streamed.PEAK_BASE_BLOCK
+    assert np.all(preview[0::2] <= preview[1::2])
+
+    streamed.end_stream()
+
+    full = WaveformGenerator()
+    assert full.load_audio(path)
+    assert streamed.sample_rate == full.sample_rate
+    assert np.allclose(streamed.waveform_data, full.waveform_data, atol=1e-5)
+
+
+def test_streamed_analysis_without_samples(tmp_path):
+    """Sem guardar amostras, picos, RMS, silêncio e trechos continuam disponíveis."""
+    sample_rate = 22050
+    tone = 0.5 * np.sin(2 * np.pi * 220 * np.arange(sample_rate * 2) / sample_rate)
+    wave = np.concatenate((tone, np.zeros(sample_rate), tone))
+    path = str(tmp_path / "pausa.wav")
+    sf.write(path, wave, sample_rate, subtype="FLOAT")
+
+    full = WaveformGenerator()
+    assert full.load_audio(path)
+    streamed = WaveformGenerator()
+    assert streamed.load_audio_stream(path)
+
+    assert streamed.is_streamed() and streamed.waveform_data is None
+    assert streamed.duration == full.duration
+    assert np.allclose(streamed.get_rms_energy(), full.get_rms_energy(), atol=1e-6)
+    assert streamed.detect_silence() == full.detect_silence()
+    assert len(streamed.detect_silence()) == 1
+
+    for samples_per_column in (16, 1024, 5000):
+        assert all(np.array_equal(a, b) for a, b in zip(
+            streamed.get_peak_columns(100, samples_per_column, 40),
+            full.get_peak_columns(100, samples_per_column, 40),
+        ))
+
+    assert np.allclose(streamed.get_waveform_segment(1.0, 1.1),
+                       full.get_waveform_segment(1.0, 1.1), atol=1e-5)
+
+    stats, expected = streamed.get_waveform_stats(), full.get_waveform_stats()
+    assert stats["samples"] == expected["samples"]
+    assert stats["zero_crossings"] == expected["zero_crossings"]
+    assert abs(stats["rms"] - expected["rms"]) < 1e-6
+
+
+def test_tile_cache_reset_reuses_executor():
+    """Trocar o gerador descarta os tiles antigos sem criar outra thread."""
+    cache = PeakTileCache(make_generator(), tile_columns=64)
+    executor = cache._executor
+    cache.get(256, 0)
+    cache.prefetch(256, range(1, 20))
+
+    silent = WaveformGenerator.from_array(np.zeros(60 * 8000, dtype=np.float32), 8000)
+    cache.reset(silent)
+    cache.prefetch(256, [1])
+    deadline = time.time() + 5
+    while cache._pending and time.time() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+
+    assert cache._executor is executor
+    assert set(cache._tiles) <= {(256, 1)}
+    assert not cache.get(256, 1)[1].any()
+    assert not cache.get(256, 0)[1].any()
+    cache.shutdown()